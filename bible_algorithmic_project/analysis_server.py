@@ -0,0 +1,318 @@
+"""Local analysis server for the Bible Algorithmic Project
+
+Runs one warm AlgorithmicFramework (spaCy model and plugins loaded once) and serves
+multi-dimensional analysis to any number of app processes over a Unix socket or TCP.
+
+Protocol: newline-delimited JSON. Each request is one object per line and each
+response echoes its "id"; a connection may pipeline requests and responses can arrive
+out of order.
+
+    {"id": 1, "op": "analyze", "passage": {"reference": "John 1:1", "text": "..."}, "timeout": 2.0}
+    {"id": 1, "result": {...}}            or    {"id": 1, "error": "..."}
+    {"id": 2, "op": "ping"}               ->    {"id": 2, "ok": true, "version": "..."}
+    {"id": 3, "op": "stats"}              ->    {"id": 3, "stats": {...}, "metrics": {...}}
+
+Identical concurrent requests (same passage content hash) share one analysis, and
+passages arriving within batch_window seconds are analyzed together after a single
+nlp.pipe call.
+
+Usage:
+    python analysis_server.py --socket /tmp/bible_analysis.sock
+    python analysis_server.py --host 127.0.0.1 --port 8765
+"""
+
+import os
+import json
+import stat
+import errno
+import socket
+import asyncio
+import argparse
+import concurrent.futures
+from typing import Dict, List, Any
+
+from baseline_framework import (
+    __version__, AlgorithmicFramework, BiblicalPassage, MultiDimensionalAnalyzer, MultiDimensionalResult,
+    create_default_framework, prime_spacy_docs
+)
+
+PASSAGE_FIELDS = ("reference", "text", "version", "testament", "book", "chapter", "verse")
+
+
+class AnalysisServer:
+    """Asyncio NDJSON server with request coalescing and micro-batching"""
+
+    def __init__(self, framework: AlgorithmicFramework = None, batch_window: float = 0.005,
+                 max_batch_size: int = 64, executor: concurrent.futures.Executor = None):
+        self.framework = framework or create_default_framework()
+        self.analyzer = MultiDimensionalAnalyzer(self.framework)
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        # Analysis is GIL-bound, so one worker thread keeps each micro-batch together
+        self.executor = executor or concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._inflight = {}   # content hash -> asyncio.Future shared by identical requests
+        self._queue = []      # (passage, future) waiting for the next micro-batch
+        self._flush_handle = None
+        self._server = None
+        self.socket_path = None  # Unix socket this server bound, removed on shutdown
+        self.stats = {"requests": 0, "coalesced": 0, "batches": 0, "batched_passages": 0, "errors": 0}
+
+    async def analyze(self, passage: BiblicalPassage) -> Dict[str, Any]:
+        """Analyze a passage, joining an identical in-flight request if there is one"""
+        loop = asyncio.get_running_loop()
+        self.stats["requests"] += 1
+        key = passage.get_content_hash()
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+        else:
+            future = self._inflight[key] = loop.create_future()
+            self._queue.append((passage, future))
+            if len(self._queue) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+        # shield: one caller timing out must not cancel the result others are waiting for
+        return await asyncio.shield(future)
+
+    def _flush(self):
+        """Hand the queued passages to the executor as one micro-batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._queue = self._queue, []
+        if batch:
+            asyncio.get_running_loop().create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[tuple]):
+        loop = asyncio.get_running_loop()
+        passages = [passage for passage, _ in batch]
+        self.stats["batches"] += 1
+        self.stats["batched_passages"] += len(passages)
+        try:
+            outcomes = await loop.run_in_executor(self.executor, self._analyze_batch, passages)
+        except Exception as e:
+            outcomes = [e] * len(batch)
+
+        for (passage, future), outcome in zip(batch, outcomes):
+            self._inflight.pop(passage.get_content_hash(), None)
+            if future.done() or future.cancelled():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+                # Every waiter may have timed out already; mark the exception retrieved so
+                # asyncio does not log it. Waiters still awaiting the future get it raised.
+                future.exception()
+            else:
+                future.set_result(outcome)
+
+    def _analyze_batch(self, passages: List[BiblicalPassage]) -> List[Any]:
+        """Executor side: one nlp.pipe over the batch, then per-passage analysis"""
+        prime_spacy_docs(passages)
+        outcomes = []
+        for passage in passages:
+            try:
+                result = self.analyzer.analyze(passage)
+                outcomes.append(self.framework._serialize_checkpoint_record(result))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    async def _handle_request(self, line: bytes, writer: asyncio.StreamWriter, write_lock: asyncio.Lock):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            op = request.get("op", "analyze")
+            if op == "ping":
+                response = {"ok": True, "version": __version__}
+            elif op == "stats":
+                response = {"stats": dict(self.stats, inflight=len(self._inflight)),
+                            "metrics": self.framework.get_metrics()}
+            elif op == "analyze":
+                fields = {k: v for k, v in request["passage"].items() if k in PASSAGE_FIELDS}
+                passage = BiblicalPassage(**fields)
+                timeout = request.get("timeout")
+                if timeout is not None:
+                    response = {"result": await asyncio.wait_for(self.analyze(passage), timeout)}
+                else:
+                    response = {"result": await self.analyze(passage)}
+            else:
+                raise ValueError(f"Unknown op: {op}")
+        except asyncio.TimeoutError:
+            self.stats["errors"] += 1
+            response = {"error": "timeout"}
+        except Exception as e:
+            self.stats["errors"] += 1
+            response = {"error": f"{type(e).__name__}: {e}"}
+
+        response["id"] = request_id
+        async with write_lock:
+            writer.write((json.dumps(response, default=str) + "\n").encode("utf-8"))
+            await writer.drain()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one client connection; requests on it are processed concurrently"""
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self._handle_request(line, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except ConnectionError:
+            pass
+        finally:
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def warm_up(self):
+        """Load the model and exercise every plugin once before accepting requests"""
+        sample = BiblicalPassage(reference="John 1:1",
+                                 text="In the beginning was the Word, and the Word was with God, and the Word was God.")
+        await asyncio.get_running_loop().run_in_executor(self.executor, self._analyze_batch, [sample])
+
+    async def start(self, socket_path: str = None, host: str = "127.0.0.1", port: int = 8765):
+        """Warm up and start listening on a Unix socket (if socket_path) or TCP"""
+        await self.warm_up()
+        if socket_path:
+            if os.path.exists(socket_path):
+                self._remove_stale_socket(socket_path)
+            self._server = await asyncio.start_unix_server(self.handle_connection, path=socket_path)
+            self.socket_path = socket_path
+        else:
+            self._server = await asyncio.start_server(self.handle_connection, host=host, port=port)
+        return self._server
+
+    @staticmethod
+    def _remove_stale_socket(socket_path: str):
+        """Unlink a socket left by a previous run; refuse to replace one a live server accepts on"""
+        try:
+            if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+                # connect() to a regular file is refused too; never delete the user's data
+                raise FileExistsError(errno.EEXIST, f"{socket_path} exists and is not a socket")
+        except FileNotFoundError:
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)  # Nobody listening: stale
+            return
+        except FileNotFoundError:
+            return
+        finally:
+            probe.close()
+        raise OSError(errno.EADDRINUSE, f"An analysis server is already listening on {socket_path}")
+
+    async def serve_forever(self, socket_path: str = None, host: str = "127.0.0.1", port: int = 8765):
+        server = await self.start(socket_path, host, port)
+        where = socket_path or f"{host}:{port}"
+        print(f"Bible Algorithmic Project analysis server v{__version__} listening on {where}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+
+class AnalysisClient:
+    """Blocking client for AnalysisServer; one request at a time per client"""
+
+    def __init__(self, socket_path: str = None, host: str = "127.0.0.1", port: int = 8765,
+                 timeout: float = 30.0):
+        self.socket_path = socket_path
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._socket = None
+        self._file = None
+        self._next_id = 0
+        self._framework = AlgorithmicFramework()  # Only used to rebuild results
+
+    def _connect(self):
+        if self._socket is None:
+            if self.socket_path:
+                self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._socket.settimeout(self.timeout)
+                self._socket.connect(self.socket_path)
+            else:
+                self._socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            self._file = self._socket.makefile("rwb")
+
+    def request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request and wait for its response"""
+        self._connect()
+        self._next_id += 1
+        payload = dict(payload, id=self._next_id)
+        self._file.write((json.dumps(payload) + "\n").encode("utf-8"))
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            self.close()
+            raise ConnectionError("Analysis server closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError(f"Analysis server error: {response['error']}")
+        return response
+
+    def analyze(self, passage: BiblicalPassage, timeout: float = None) -> MultiDimensionalResult:
+        """Analyze a passage on the server; timeout is the server-side deadline in seconds"""
+        payload = {"op": "analyze", "passage": {field: getattr(passage, field) for field in PASSAGE_FIELDS}}
+        if timeout is not None:
+            payload["timeout"] = timeout
+        result = self._framework._deserialize_checkpoint_record(self.request(payload)["result"])
+        result.passage = passage
+        return result
+
+    def ping(self) -> bool:
+        return self.request({"op": "ping"}).get("ok", False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return self.request({"op": "stats"})
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        if self._socket is not None:
+            self._socket.close()
+        self._socket = self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Serve Bible Algorithmic Project analysis to local processes")
+    parser.add_argument("--socket", help="Unix socket path (default: TCP)")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port")
+    parser.add_argument("--batch-window-ms", type=float, default=5.0,
+                        help="How long to gather passages into one micro-batch")
+    parser.add_argument("--max-batch-size", type=int, default=64, help="Flush a micro-batch at this size")
+    args = parser.parse_args(argv)
+
+    server = AnalysisServer(batch_window=args.batch_window_ms / 1000.0, max_batch_size=args.max_batch_size)
+    try:
+        asyncio.run(server.serve_forever(args.socket, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server.socket_path and os.path.exists(server.socket_path):
+            os.unlink(server.socket_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,21 @@
 # Date: 2025-10-25
 # Production-ready framework with multi-dimensional analysis, plugin architecture, and advanced features
 
+import os
+import ast
 import json
 import re
+import hashlib
+import math
+import heapq
+import bisect
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+import time
+import random
+from typing import Dict, List, Any, Optional, Iterable, Iterator
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 
 # Configure logging
@@ -73,9 +82,21 @@ else:
     logging.warning("spaCy not available - framework will use basic text processing")
     logging.info("To enable full NLP features, resolve spaCy installation issues above")
 
+# NumPy is optional; vectorized paths fall back to plain Python without it
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 # Version control
 __version__ = "0.1.0"
 
+# Word tokenizer shared by corpus-level indexes (letters with optional apostrophe suffix)
+TOKEN_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)?")
+WORD_RUN_PATTERN = re.compile(r"\w+")
+
 class AnalysisDimension(Enum):
     """10 core dimensions for v0.1.0"""
     LEXICAL = "lexical"              # Language/word analysis
@@ -139,6 +160,19 @@ class BiblicalPassage:
             self._preprocessing_cache['text_lower'] = self.text.lower()
         return self._preprocessing_cache['text_lower']
 
+    def get_cached_tokens(self) -> List[str]:
+        """Get cached lowercase word tokens with punctuation stripped"""
+        if 'tokens' not in self._preprocessing_cache:
+            self._preprocessing_cache['tokens'] = TOKEN_PATTERN.findall(self.get_cached_text_lower())
+        return self._preprocessing_cache['tokens']
+
+    def get_content_hash(self) -> str:
+        """Stable hash of everything the built-in algorithms read from the passage"""
+        if 'content_hash' not in self._preprocessing_cache:
+            content = "\x1f".join([self.reference, self.version, self.testament, self.text])
+            self._preprocessing_cache['content_hash'] = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return self._preprocessing_cache['content_hash']
+
     def get_synonym_expanded_keywords(self) -> List[str]:
         """Get keywords expanded with synonyms"""
         if 'expanded_keywords' not in self._preprocessing_cache:
@@ -163,6 +197,12 @@ class BiblicalPassage:
             return [word.lower() for word in self.get_cached_words()]
         return [token.lemma_.lower() for token in doc]
 
+    def get_lemma_text(self) -> str:
+        """Get cached space-joined lemmas"""
+        if 'lemma_text' not in self._preprocessing_cache:
+            self._preprocessing_cache['lemma_text'] = ' '.join(self.get_lemmas())
+        return self._preprocessing_cache['lemma_text']
+
     def get_pos_tags(self) -> List[str]:
         """Get part-of-speech tags using spaCy"""
         doc = self.get_spacy_doc()
@@ -194,6 +234,19 @@ class BiblicalPassage:
             text_lower = self.get_cached_text_lower()
             self.keywords = [kw for kw in common_keywords if kw in text_lower]
 
+def prime_spacy_docs(passages: Iterable[BiblicalPassage], batch_size: int = 64) -> int:
+    """Fill the spaCy Doc cache of many passages with one nlp.pipe call
+
+    nlp.pipe batches the model's work, which is much faster than letting each algorithm
+    trigger nlp() per passage. Returns the number of passages parsed (0 without spaCy).
+    """
+    if not SPACY_AVAILABLE or nlp is None:
+        return 0
+    pending = [p for p in passages if 'spacy_doc' not in p._preprocessing_cache]
+    for passage, doc in zip(pending, nlp.pipe((p.text for p in pending), batch_size=batch_size)):
+        passage._preprocessing_cache['spacy_doc'] = doc
+    return len(pending)
+
 class BibleLoader:
     """Loader for biblical corpora in various formats (JSON, USFM, etc.)"""
 
@@ -602,6 +655,863 @@ class AlgorithmicResult:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     links: List[LinkedPassage] = field(default_factory=list)
 
+@dataclass
+class SimilarityMatch:
+    """A corpus passage scored against a query passage"""
+    passage: BiblicalPassage
+    score: float
+    shared_terms: List[str] = field(default_factory=list)
+
+class CorpusSimilarityIndex:
+    """TF-IDF sparse inverted index for top-k passage similarity queries"""
+
+    def __init__(self, max_df_ratio: float = 0.5, min_df: int = 1):
+        self.max_df_ratio = max_df_ratio  # Terms in more documents than this are too common to rank
+        self.min_df = min_df
+        self.passages = []
+        self.postings = {}  # term -> list of (doc_index, weight)
+        self.idf = {}       # term -> inverse document frequency
+        self.corpus_signature = None
+        self._verified_corpus = None  # Last list object confirmed to match corpus_signature
+
+    def build(self, corpus: List[BiblicalPassage]):
+        """Build the index over a corpus in a single pass over its tokens"""
+        self.passages = list(corpus)
+        self.corpus_signature = self.get_corpus_signature(self.passages)
+        self._verified_corpus = corpus
+
+        doc_term_counts = []
+        doc_freq = {}
+        for passage in self.passages:
+            counts = {}
+            for token in passage.get_cached_tokens():
+                counts[token] = counts.get(token, 0) + 1
+            doc_term_counts.append(counts)
+            for term in counts:
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+
+        # Drop overly common terms: they add nothing to ranking and dominate query cost
+        total_docs = len(self.passages)
+        max_df = max(self.max_df_ratio * total_docs, 2)
+        self.idf = {
+            term: math.log((1 + total_docs) / (1 + df)) + 1.0
+            for term, df in doc_freq.items()
+            if self.min_df <= df <= max_df
+        }
+
+        self.postings = {}
+        for doc_index, counts in enumerate(doc_term_counts):
+            weights = self._weigh_terms(counts)
+            for term, weight in weights.items():
+                if term not in self.postings:
+                    self.postings[term] = []
+                self.postings[term].append((doc_index, weight))
+
+        return self
+
+    @staticmethod
+    def get_corpus_signature(corpus: List[BiblicalPassage]) -> str:
+        """Hash of every passage's reference, version and content, in order"""
+        digest = hashlib.sha256()
+        for passage in corpus:
+            digest.update("\x1f".join([passage.reference, passage.version, passage.get_content_hash()]).encode('utf-8'))
+            digest.update(b"\x1e")
+        return digest.hexdigest()
+
+    def covers(self, corpus: List[BiblicalPassage]) -> bool:
+        """Check whether the index was built over these passages (same order and content)
+
+        The content check is O(N), so it runs once per corpus object: the list last
+        verified is held, and passing it again only compares its length. Edit an indexed
+        list in place without changing its length and the index will not notice; rebuild
+        it with build_similarity_index.
+        """
+        if corpus is self._verified_corpus and len(corpus) == len(self.passages):
+            return True
+        if self.corpus_signature != self.get_corpus_signature(corpus):
+            return False
+        self._verified_corpus = corpus
+        return True
+
+    def _weigh_terms(self, counts: Dict[str, int]) -> Dict[str, float]:
+        """Sublinear TF-IDF weights, L2-normalized"""
+        weights = {term: (1.0 + math.log(count)) * self.idf[term]
+                   for term, count in counts.items() if term in self.idf}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        if norm > 0:
+            weights = {term: w / norm for term, w in weights.items()}
+        return weights
+
+    def query(self, passage: BiblicalPassage, top_k: int = 10) -> List[SimilarityMatch]:
+        """Return the top-k most similar passages, scoring only documents that share a term"""
+        counts = {}
+        for token in passage.get_cached_tokens():
+            counts[token] = counts.get(token, 0) + 1
+        query_weights = self._weigh_terms(counts)
+
+        scores = {}
+        for term, query_weight in query_weights.items():
+            for doc_index, doc_weight in self.postings.get(term, []):
+                scores[doc_index] = scores.get(doc_index, 0.0) + query_weight * doc_weight
+
+        candidates = ((score, doc_index) for doc_index, score in scores.items()
+                      if self.passages[doc_index].reference != passage.reference)
+        top = heapq.nlargest(top_k, candidates)
+
+        matches = []
+        for score, doc_index in top:
+            match_passage = self.passages[doc_index]
+            match_tokens = set(match_passage.get_cached_tokens())
+            shared = sorted((t for t in query_weights if t in match_tokens),
+                            key=lambda t: query_weights[t], reverse=True)
+            matches.append(SimilarityMatch(passage=match_passage, score=score, shared_terms=shared))
+        return matches
+
+@dataclass
+class SharedNgramMatch:
+    """A maximal run of words shared by two passages (positions are token offsets)"""
+    source: BiblicalPassage
+    target: BiblicalPassage
+    source_position: int
+    target_position: int
+    length: int
+    ngram: str
+
+class SharedNgramIndex:
+    """Finds every word sequence of at least min_n tokens shared across a corpus
+
+    Passages are tokenized into one token-id stream and every min_n-token window is
+    hashed (a polynomial hash over token ids, vectorized with NumPy when available), so
+    equal windows meet in the same hash group instead of comparing passages pairwise.
+    Each shared window seeds a match that is extended to its maximal length along its
+    diagonal, so a long quotation is reported once rather than once per window. Windows
+    occurring more than max_frequency times (formulaic phrases) do not seed matches.
+    """
+
+    HASH_BASE = 0x100000001B3  # Odd multiplier; hashes wrap modulo 2**64
+
+    def __init__(self, min_n: int = 4, max_frequency: int = 50, include_same_reference: bool = False):
+        self.min_n = min_n
+        self.max_frequency = max_frequency
+        self.include_same_reference = include_same_reference  # e.g. one verse in two translations
+
+    def find_matches(self, passages: List[BiblicalPassage]) -> List[SharedNgramMatch]:
+        """Return every maximal shared n-gram between two different passages"""
+        n = self.min_n
+        vocabulary = {}
+        token_ids = []
+        starts, ends = [], []
+        for passage in passages:
+            starts.append(len(token_ids))
+            token_ids.extend(vocabulary.setdefault(token, len(vocabulary)) for token in passage.get_cached_tokens())
+            ends.append(len(token_ids))
+        passage_of = [0] * len(token_ids)
+        for index, (start, end) in enumerate(zip(starts, ends)):
+            passage_of[start:end] = [index] * (end - start)
+
+        groups, window_counts = self._group_windows(token_ids, passage_of, ends)
+        references = [passage.reference for passage in passages]
+        max_frequency = self.max_frequency
+
+        found = set()  # (source passage, source start, target passage, target start, length)
+        for positions in groups:
+            for x, a in enumerate(positions):
+                source = passage_of[a]
+                for b in positions[x + 1:]:
+                    target = passage_of[b]
+                    if source == target or (not self.include_same_reference and
+                                            references[source] == references[target]):
+                        continue
+                    if token_ids[a:a + n] != token_ids[b:b + n]:
+                        continue  # Hash collision
+                    # Diagonal already reported from the shared window one token to the left
+                    left_extends = (a > starts[source] and b > starts[target] and token_ids[a - 1] == token_ids[b - 1])
+                    if left_extends and window_counts[a - 1] <= max_frequency:
+                        continue
+                    # The left neighbours are formulaic (not seeds themselves): walk back to the true start
+                    a0, b0 = a, b
+                    while a0 > starts[source] and b0 > starts[target] and token_ids[a0 - 1] == token_ids[b0 - 1]:
+                        a0 -= 1
+                        b0 -= 1
+                    length = a - a0 + n
+                    while (a0 + length < ends[source] and b0 + length < ends[target]
+                           and token_ids[a0 + length] == token_ids[b0 + length]):
+                        length += 1
+                    found.add((source, a0 - starts[source], target, b0 - starts[target], length))
+
+        matches = []
+        for source, source_position, target, target_position, length in sorted(found):
+            tokens = passages[source].get_cached_tokens()
+            matches.append(SharedNgramMatch(
+                source=passages[source],
+                target=passages[target],
+                source_position=source_position,
+                target_position=target_position,
+                length=length,
+                ngram=' '.join(tokens[source_position:source_position + length])
+            ))
+        return matches
+
+    def _group_windows(self, token_ids: List[int], passage_of: List[int], ends: List[int]) -> tuple:
+        """Group window start positions by hash: (groups of 2..max_frequency positions, count per position)"""
+        n = self.min_n
+        window_total = len(token_ids) - n + 1
+        window_counts = [0] * len(token_ids)
+        if window_total <= 0:
+            return [], window_counts
+
+        if NUMPY_AVAILABLE:
+            ids = np.asarray(token_ids, dtype=np.uint64) + np.uint64(1)
+            hashes = np.zeros(window_total, dtype=np.uint64)
+            for k in range(n):
+                hashes = hashes * np.uint64(self.HASH_BASE) + ids[k:k + window_total]
+            # Windows must lie inside one passage
+            window_passages = np.asarray(passage_of[:window_total])
+            valid = np.flatnonzero(np.asarray(ends)[window_passages] >= np.arange(window_total) + n)
+            order = valid[np.argsort(hashes[valid], kind="stable")]
+            sorted_hashes = hashes[order]
+            boundaries = np.flatnonzero(sorted_hashes[1:] != sorted_hashes[:-1]) + 1
+            group_starts = np.concatenate(([0], boundaries))
+            group_sizes = np.diff(np.concatenate((group_starts, [len(order)])))
+            counts = np.zeros(len(token_ids), dtype=np.int64)
+            counts[order] = np.repeat(group_sizes, group_sizes)
+            window_counts = counts.tolist()
+            order_list = order.tolist()
+            groups = [order_list[start:start + size]
+                      for start, size in zip(group_starts.tolist(), group_sizes.tolist())
+                      if 2 <= size <= self.max_frequency]
+            return groups, window_counts
+
+        windows = {}
+        for position in range(window_total):
+            if ends[passage_of[position]] >= position + n:
+                windows.setdefault(tuple(token_ids[position:position + n]), []).append(position)
+        groups = []
+        for positions in windows.values():
+            for position in positions:
+                window_counts[position] = len(positions)
+            if 2 <= len(positions) <= self.max_frequency:
+                groups.append(positions)
+        return groups, window_counts
+
+    def find_links(self, passages: List[BiblicalPassage]) -> Dict[str, List['CrossReferenceLink']]:
+        """Candidate quotation links in both directions, keyed by the linking passage's reference"""
+        links = {}
+        for match in self.find_matches(passages):
+            for passage, other, position, other_position in (
+                    (match.source, match.target, match.source_position, match.target_position),
+                    (match.target, match.source, match.target_position, match.source_position)):
+                links.setdefault(passage.reference, []).append(CrossReferenceLink(
+                    reference=other.reference,
+                    relationship_type="direct_quotation",
+                    strength=min(match.length * 0.2, 1.0),  # Longer shared runs = stronger, as in cross_reference_detection
+                    detection_method="shared_ngram_detection",
+                    evidence={
+                        "ngram": match.ngram,
+                        "ngram_length": match.length,
+                        "position": position,
+                        "target_position": other_position,
+                        "version": passage.version,
+                        "target_version": other.version
+                    }
+                ))
+        return links
+
+class PassageEmbedder:
+    """Sentence-embedding vectors for passages, cached on disk per model
+
+    Texts missing from the cache are encoded in batches of batch_size, longest first, so
+    each batch pads to similar lengths, and stored L2-normalized as float16 rows of a
+    memory-mapped file. A sidecar index maps the SHA-256 of each text to its row, so
+    every distinct text is encoded once per model and reused across runs (and across
+    translations or references with identical text). Cosine similarity is a dot product.
+    Writers sharing a cache_dir (e.g. shard jobs) serialize appends on an fcntl lock and
+    pick up each other's rows.
+
+    encoder, if given, replaces sentence-transformers: a callable taking a list of texts
+    and returning an (n, dimension) array. Without cache_dir vectors live in memory only.
+    """
+
+    DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+    def __init__(self, cache_dir: str = None, model_name: str = DEFAULT_MODEL, batch_size: int = 256,
+                 encoder=None, device: str = "cpu"):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for PassageEmbedder")
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.device = device
+        self._encoder = encoder
+        self.cache_dir = os.path.join(cache_dir, re.sub(r"[^\w.-]+", "_", model_name)) if cache_dir else None
+        self.dimension = None
+        self.hits = 0
+        self.misses = 0
+        self._rows = {}       # text hash -> row in _vectors
+        self._count = 0       # rows in use; the mapped file may hold spare capacity
+        self._vectors = None  # np.memmap with a cache_dir, otherwise an in-memory array
+        self._index_offset = 0  # Bytes of index.txt already loaded into _rows
+        self._lock = threading.Lock()
+        self._corpus_matrix = None  # (text hashes, vectors) of the last similarity corpus
+        if self.cache_dir:
+            self._open_cache()
+
+    # Cache
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, name)
+
+    def _lock_cache(self):
+        """Take the cache directory's writer lock; returns the handle that holds it
+
+        Several embedders (e.g. shard jobs) may share a cache_dir. Without fcntl (Windows)
+        there is no lock, so use one writer per cache_dir there.
+        """
+        handle = open(self._path(".lock"), 'a')
+        try:
+            import fcntl
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        except ImportError:
+            pass
+        return handle
+
+    def _open_cache(self):
+        """Load the index and map the vector file of an existing cache"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with self._lock_cache():
+            self._sync_cache()
+
+    def _sync_cache(self):
+        """Pick up rows other writers appended since the last sync (caller holds the lock)"""
+        if self.dimension is None:
+            if not os.path.exists(self._path("meta.json")):
+                return
+            with open(self._path("meta.json"), 'r', encoding='utf-8') as f:
+                self.dimension = json.load(f)["dimension"]
+        if os.path.exists(self._path("index.txt")):
+            with open(self._path("index.txt"), 'rb') as f:
+                f.seek(self._index_offset)
+                appended = f.read()
+            complete = appended.rfind(b"\n") + 1  # A cut-off last line is from a crashed writer
+            for text_hash in appended[:complete].decode('ascii').splitlines():
+                self._rows[text_hash] = self._count
+                self._count += 1
+            self._index_offset += complete
+        capacity = (os.path.getsize(self._path("vectors.f16")) // (2 * self.dimension)
+                    if os.path.exists(self._path("vectors.f16")) else 0)
+        if capacity and (self._vectors is None or len(self._vectors) != capacity):
+            self._vectors = np.memmap(self._path("vectors.f16"), dtype=np.float16, mode="r+",
+                                      shape=(capacity, self.dimension))
+
+    def _reserve(self, rows: int):
+        """Make room for at least rows vectors, growing the file geometrically"""
+        capacity = len(self._vectors) if self._vectors is not None else 0
+        if rows <= capacity:
+            return
+        capacity = max(rows, 2 * capacity, 1024)
+        if not self.cache_dir:
+            vectors = np.zeros((capacity, self.dimension), dtype=np.float16)
+            if self._vectors is not None:
+                vectors[:self._count] = self._vectors[:self._count]
+            self._vectors = vectors
+            return
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+        with open(self._path("vectors.f16"), 'ab') as f:
+            f.truncate(capacity * self.dimension * 2)
+        self._vectors = np.memmap(self._path("vectors.f16"), dtype=np.float16, mode="r+",
+                                  shape=(capacity, self.dimension))
+
+    def _store(self, hashes: List[str], vectors):
+        """Append one encoded batch; vectors are durable before their hashes are indexed"""
+        if not self.cache_dir:
+            self._append_rows(hashes, vectors)
+            return
+        with self._lock_cache():
+            self._sync_cache()  # Start after rows written by other embedders sharing the cache
+            self._append_rows(hashes, vectors)
+
+    def _append_rows(self, hashes: List[str], vectors):
+        if self.dimension is None:
+            self.dimension = vectors.shape[1]
+            if self.cache_dir:
+                # Replaced atomically: a torn meta.json would make every later _sync_cache fail
+                temp_path = self._path("meta.json.tmp")
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({"model": self.model_name, "dimension": self.dimension, "dtype": "float16",
+                               "normalized": True, "version": __version__}, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self._path("meta.json"))
+        elif vectors.shape[1] != self.dimension:
+            raise ValueError(f"Encoder returned {vectors.shape[1]}-dimensional vectors, "
+                             f"cache holds {self.dimension}")
+
+        self._reserve(self._count + len(hashes))
+        self._vectors[self._count:self._count + len(hashes)] = vectors
+        if self.cache_dir:
+            self._vectors.flush()
+            lines = "".join(f"{text_hash}\n" for text_hash in hashes).encode('ascii')
+            with open(self._path("index.txt"), 'ab') as f:
+                f.truncate(self._index_offset)  # Drop a partial line left by a crashed writer
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            self._index_offset += len(lines)
+        for text_hash in hashes:
+            self._rows[text_hash] = self._count
+            self._count += 1
+
+    # Encoding
+
+    def _get_encoder(self):
+        """The injected encoder, or a sentence-transformers model loaded on first use"""
+        if self._encoder is None:
+            from sentence_transformers import SentenceTransformer
+
+            model = SentenceTransformer(self.model_name, device=self.device)
+            self._encoder = lambda texts: model.encode(texts, batch_size=self.batch_size,
+                                                       convert_to_numpy=True, show_progress_bar=False)
+        return self._encoder
+
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _encode_missing(self, missing: Dict[str, str]):
+        encoder = self._get_encoder()
+        pending = sorted(missing.items(), key=lambda item: len(item[1]), reverse=True)
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            vectors = np.asarray(encoder([text for _, text in batch]), dtype=np.float32)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms > 0, norms, 1.0)
+            self._store([text_hash for text_hash, _ in batch], vectors)
+
+    def embed(self, items: Iterable) -> 'np.ndarray':
+        """float32 (n, dimension) unit vectors for passages or plain strings, encoding only cache misses"""
+        texts = [item.text if isinstance(item, BiblicalPassage) else item for item in items]
+        return self._embed_texts(texts, [self._text_hash(text) for text in texts])
+
+    def _embed_texts(self, texts: List[str], hashes: List[str]) -> 'np.ndarray':
+        with self._lock:
+            missing = {}
+            for text_hash, text in zip(hashes, texts):
+                if text_hash not in self._rows and text_hash not in missing:
+                    missing[text_hash] = text
+            if missing and self.cache_dir:
+                with self._lock_cache():
+                    self._sync_cache()  # Another embedder sharing the cache may have stored some
+                missing = {text_hash: text for text_hash, text in missing.items() if text_hash not in self._rows}
+            self.misses += len(missing)
+            self.hits += len(texts) - len(missing)
+            if missing:
+                self._encode_missing(missing)
+            if not texts:
+                return np.zeros((0, self.dimension or 0), dtype=np.float32)
+            rows = np.fromiter((self._rows[text_hash] for text_hash in hashes), dtype=np.int64, count=len(hashes))
+            return np.asarray(self._vectors[rows], dtype=np.float32)
+
+    # Similarity, clustering and cross-reference scoring
+
+    def _corpus_vectors(self, corpus: List[BiblicalPassage]) -> 'np.ndarray':
+        """Embeddings of a corpus, kept while passages with the same texts are queried repeatedly"""
+        texts = [passage.text for passage in corpus]
+        signature = tuple(self._text_hash(text) for text in texts)
+        if self._corpus_matrix is None or self._corpus_matrix[0] != signature:
+            self._corpus_matrix = (signature, self._embed_texts(texts, list(signature)))
+        return self._corpus_matrix[1]
+
+    def similarity(self, passage, others: Iterable) -> 'np.ndarray':
+        """Cosine similarity of a passage (or text) to each of others"""
+        return self.embed(list(others)) @ self.embed([passage])[0]
+
+    def most_similar(self, passage: BiblicalPassage, corpus: List[BiblicalPassage],
+                     top_k: int = 10) -> List[SimilarityMatch]:
+        """Top-k corpus passages by cosine similarity (the passage's own reference excluded)"""
+        if not corpus:
+            return []
+        scores = self._corpus_vectors(corpus) @ self.embed([passage])[0]
+        for index, candidate in enumerate(corpus):
+            if candidate.reference == passage.reference:
+                scores[index] = -np.inf
+        top_k = min(top_k, len(corpus))
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [SimilarityMatch(passage=corpus[index], score=float(scores[index]))
+                for index in top.tolist() if np.isfinite(scores[index])]
+
+    def cluster(self, passages: List[BiblicalPassage], n_clusters: int, iterations: int = 25,
+                seed: int = 0) -> List[int]:
+        """Spherical k-means over the embeddings; returns a cluster label per passage"""
+        vectors = self.embed(passages)
+        if len(vectors) == 0:
+            return []
+        n_clusters = min(n_clusters, len(vectors))
+        rng = np.random.default_rng(seed)
+        centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)]
+        labels = None
+        for _ in range(iterations):
+            new_labels = np.argmax(vectors @ centroids.T, axis=1)
+            if labels is not None and np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+            for cluster in range(n_clusters):
+                members = vectors[labels == cluster]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    centroids[cluster] = centroid / max(np.linalg.norm(centroid), 1e-12)
+        return labels.tolist()
+
+    def score_cross_references(self, results: Iterable[MultiDimensionalResult],
+                               corpus: List[BiblicalPassage]) -> List[Dict[str, Any]]:
+        """Embedding similarity between each result's passage and its cross-reference targets
+
+        Targets are looked up by reference in corpus (same version first); targets not in
+        the corpus are skipped.
+        """
+        by_reference = {}
+        for passage in corpus:
+            by_reference.setdefault(passage.reference, []).append(passage)
+
+        pairs = []
+        for result in results:
+            cross_reference = result.dimension_results.get(AnalysisDimension.CROSS_REFERENCE)
+            if cross_reference is None:
+                continue
+            for link in cross_reference.findings.get("cross_references", []):
+                candidates = by_reference.get(link["reference"])
+                if not candidates:
+                    continue
+                target = next((p for p in candidates if p.version == result.passage.version), candidates[0])
+                pairs.append((result.passage, target, link))
+        if not pairs:
+            return []
+
+        sources = self.embed([source for source, _, _ in pairs])
+        targets = self.embed([target for _, target, _ in pairs])
+        similarities = np.einsum("ij,ij->i", sources, targets)
+        return [
+            {"source": source.reference, "target": target.reference, "type": link["type"],
+             "strength": link["strength"], "similarity": float(similarity)}
+            for (source, target, link), similarity in zip(pairs, similarities.tolist())
+        ]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "model": self.model_name,
+            "cache_dir": self.cache_dir,
+            "dimension": self.dimension,
+            "vectors": self._count,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+def _get_jsonl_encoder(compact: bool = True, use_orjson: bool = False):
+    """Return a function encoding one record as a newline-terminated UTF-8 line"""
+    if use_orjson:
+        try:
+            import orjson
+            return lambda record: orjson.dumps(record, default=str,
+                                               option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except ImportError:
+            logging.warning("orjson not installed - falling back to json for JSON Lines export")
+
+    separators = (',', ':') if compact else (', ', ': ')
+    return lambda record: (json.dumps(record, separators=separators, default=str) + '\n').encode('utf-8')
+
+def _encode_checkpoint_value(value):
+    """Make findings JSON-safe while keeping tuples, sets and non-string dict keys recoverable"""
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value) and not (len(value) == 1 and next(iter(value)).startswith("__")):
+            return {key: _encode_checkpoint_value(item) for key, item in value.items()}
+        # JSON would turn 1 into "1"; keep the key types (and marker-like keys) as pairs
+        return {"__dict__": [[_encode_checkpoint_value(key), _encode_checkpoint_value(item)]
+                             for key, item in value.items()]}
+    if isinstance(value, list):
+        return [_encode_checkpoint_value(item) for item in value]
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode_checkpoint_value(item) for item in value]}
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": [_encode_checkpoint_value(item) for item in value]}
+    return value
+
+def _decode_checkpoint_value(value):
+    """Inverse of _encode_checkpoint_value"""
+    if isinstance(value, dict):
+        if len(value) == 1 and "__tuple__" in value:
+            return tuple(_decode_checkpoint_value(item) for item in value["__tuple__"])
+        if len(value) == 1 and "__set__" in value:
+            return set(_decode_checkpoint_value(item) for item in value["__set__"])
+        if len(value) == 1 and "__dict__" in value:
+            decoded = {}
+            for key, item in value["__dict__"]:
+                key = _decode_checkpoint_value(key)
+                decoded[frozenset(key) if isinstance(key, set) else key] = _decode_checkpoint_value(item)
+            return decoded
+        return {key: _decode_checkpoint_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode_checkpoint_value(item) for item in value]
+    return value
+
+def _truncate_partial_jsonl_line(filename: str, block_size: int = 65536) -> int:
+    """Cut a JSON Lines file back to its last complete line; returns the resulting size"""
+    with open(filename, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        position = end
+        while position > 0:
+            read_start = max(0, position - block_size)
+            f.seek(read_start)
+            block = f.read(position - read_start)
+            newline = block.rfind(b'\n')
+            if newline != -1:
+                position = read_start + newline + 1
+                break
+            position = read_start
+        if position != end:
+            f.truncate(position)
+        return position
+
+def _update_code_digest(digest, code):
+    """Feed a code object into a hash without anything process-specific (addresses, set order)"""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode('utf-8'))
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            _update_code_digest(digest, const)
+        elif isinstance(const, frozenset):
+            digest.update(repr(sorted(repr(item) for item in const)).encode('utf-8'))
+        else:
+            digest.update(repr(const).encode('utf-8'))
+
+_MODULE_SOURCE_DIGESTS = {}  # module name -> sha256 of its source, or None when unavailable
+
+def _get_module_source_digest(module_name: str) -> Optional[str]:
+    """Hash of a module's source, covering the helpers, constants and classes a plugin uses"""
+    if module_name not in _MODULE_SOURCE_DIGESTS:
+        import inspect
+        import sys
+        try:
+            source = inspect.getsource(sys.modules[module_name])
+        except (KeyError, OSError, TypeError):
+            source = None  # Interactive sessions, C extensions: fall back to the code object alone
+        _MODULE_SOURCE_DIGESTS[module_name] = (
+            hashlib.sha256(source.encode('utf-8')).hexdigest() if source is not None else None)
+    return _MODULE_SOURCE_DIGESTS[module_name]
+
+def _log_analysis_error(passage: BiblicalPassage, error: Exception):
+    """Default error hook for corpus analysis: log and keep going"""
+    logging.warning(f"Error analyzing {passage.reference}: {error}")
+
+@dataclass
+class OperationStats:
+    """Call count and latency summary for one plugin or batch operation"""
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    min_seconds: float = float('inf')
+    max_seconds: float = 0.0
+    samples: List[float] = field(default_factory=list)  # Reservoir sample for percentiles
+
+class PluginMetrics:
+    """Thread-safe per-plugin call counts, latencies and cache hit rates
+
+    Latencies come from time.perf_counter and percentiles from a fixed-size reservoir
+    sample per operation, so recording is O(1) with bounded memory and can stay on in
+    production. Metrics collected in worker processes are folded back with merge().
+    """
+
+    PERCENTILES = (0.5, 0.9, 0.99)
+
+    def __init__(self, sample_size: int = 1024, enabled: bool = True):
+        self.sample_size = sample_size
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._random = random.Random(0)
+        self.reset()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']  # Locks cannot be pickled (process-pool initargs)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reset_after_fork(self):
+        """Drop all recorded metrics in a forked child, replacing the lock first
+
+        Another thread of the parent may have held the lock at fork time; the child's copy
+        would then never be released.
+        """
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop all recorded metrics"""
+        with self._lock:
+            self.operations = {}  # name -> OperationStats
+            self.caches = {}      # name -> [hits, misses]
+            self.started = time.time()
+
+    def record(self, name: str, seconds: float, error: bool = False):
+        """Record one call of an operation"""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self.operations.get(name)
+            if stats is None:
+                stats = self.operations[name] = OperationStats()
+            stats.count += 1
+            if error:
+                stats.errors += 1
+            stats.total_seconds += seconds
+            stats.min_seconds = min(stats.min_seconds, seconds)
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            if len(stats.samples) < self.sample_size:
+                stats.samples.append(seconds)
+            else:
+                slot = self._random.randrange(stats.count)
+                if slot < self.sample_size:
+                    stats.samples[slot] = seconds
+
+    def record_cache(self, name: str, hits: int = 0, misses: int = 0):
+        """Record cache lookups"""
+        if not self.enabled:
+            return
+        with self._lock:
+            counts = self.caches.setdefault(name, [0, 0])
+            counts[0] += hits
+            counts[1] += misses
+
+    def time_operation(self, name: str):
+        """Context manager recording the duration of the enclosed block"""
+        import contextlib
+
+        @contextlib.contextmanager
+        def timer():
+            start = time.perf_counter()
+            try:
+                yield
+            except Exception:
+                self.record(name, time.perf_counter() - start, error=True)
+                raise
+            self.record(name, time.perf_counter() - start)
+        return timer()
+
+    def merge(self, other: 'PluginMetrics'):
+        """Fold another instance (e.g. from a worker process) into this one"""
+        with self._lock:
+            for name, theirs in other.operations.items():
+                ours = self.operations.get(name)
+                if ours is None:
+                    ours = self.operations[name] = OperationStats()
+                total = ours.count + theirs.count
+                samples = ours.samples + theirs.samples
+                if len(samples) > self.sample_size:
+                    # Keep each side's share of the reservoir proportional to its call count
+                    keep = round(self.sample_size * ours.count / total) if total else 0
+                    samples = (self._random.sample(ours.samples, min(keep, len(ours.samples))) +
+                               self._random.sample(theirs.samples, min(self.sample_size - keep, len(theirs.samples))))
+                ours.count = total
+                ours.errors += theirs.errors
+                ours.total_seconds += theirs.total_seconds
+                ours.min_seconds = min(ours.min_seconds, theirs.min_seconds)
+                ours.max_seconds = max(ours.max_seconds, theirs.max_seconds)
+                ours.samples = samples
+            for name, (hits, misses) in other.caches.items():
+                counts = self.caches.setdefault(name, [0, 0])
+                counts[0] += hits
+                counts[1] += misses
+
+    def drain(self) -> 'PluginMetrics':
+        """Return a copy of the current metrics and reset this instance"""
+        snapshot = PluginMetrics(self.sample_size, self.enabled)
+        with self._lock:
+            snapshot.operations, snapshot.caches, snapshot.started = self.operations, self.caches, self.started
+            self.operations, self.caches, self.started = {}, {}, time.time()
+        return snapshot
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of all metrics as plain data"""
+        with self._lock:
+            operations = {}
+            for name, stats in self.operations.items():
+                samples = sorted(stats.samples)
+                entry = {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "total_seconds": stats.total_seconds,
+                    "mean_seconds": stats.total_seconds / stats.count if stats.count else 0.0,
+                    "min_seconds": stats.min_seconds if stats.count else 0.0,
+                    "max_seconds": stats.max_seconds,
+                    "calls_per_second": stats.count / stats.total_seconds if stats.total_seconds > 0 else 0.0
+                }
+                for q in self.PERCENTILES:
+                    entry[f"p{int(q * 100)}_seconds"] = samples[min(len(samples) - 1, int(q * len(samples)))] if samples else 0.0
+                operations[name] = entry
+            caches = {
+                name: {"hits": hits, "misses": misses,
+                       "hit_rate": hits / (hits + misses) if hits + misses else 0.0}
+                for name, (hits, misses) in self.caches.items()
+            }
+            return {
+                "uptime_seconds": time.time() - self.started,
+                "operations": operations,
+                "caches": caches
+            }
+
+    def to_json(self) -> str:
+        """Metrics as a JSON document"""
+        return json.dumps(self.get_metrics(), indent=2)
+
+    @staticmethod
+    def _escape_label(value: str) -> str:
+        """Escape a Prometheus label value (plugin names are user-registered)"""
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def to_prometheus(self, prefix: str = "bible_algorithmic") -> str:
+        """Metrics in the Prometheus text exposition format"""
+        metrics = self.get_metrics()
+        lines = [
+            f"# HELP {prefix}_operation_calls_total Calls per plugin or batch operation",
+            f"# TYPE {prefix}_operation_calls_total counter"
+        ]
+        for name, entry in metrics["operations"].items():
+            name = self._escape_label(name)
+            lines.append(f'{prefix}_operation_calls_total{{operation="{name}"}} {entry["count"]}')
+        lines += [
+            f"# HELP {prefix}_operation_errors_total Failed calls per plugin or batch operation",
+            f"# TYPE {prefix}_operation_errors_total counter"
+        ]
+        for name, entry in metrics["operations"].items():
+            name = self._escape_label(name)
+            lines.append(f'{prefix}_operation_errors_total{{operation="{name}"}} {entry["errors"]}')
+        lines += [
+            f"# HELP {prefix}_operation_duration_seconds Operation latency (sampled quantiles)",
+            f"# TYPE {prefix}_operation_duration_seconds summary"
+        ]
+        for name, entry in metrics["operations"].items():
+            name = self._escape_label(name)
+            for q in self.PERCENTILES:
+                lines.append(f'{prefix}_operation_duration_seconds{{operation="{name}",quantile="{q}"}} '
+                             f'{entry[f"p{int(q * 100)}_seconds"]}')
+            lines.append(f'{prefix}_operation_duration_seconds_sum{{operation="{name}"}} {entry["total_seconds"]}')
+            lines.append(f'{prefix}_operation_duration_seconds_count{{operation="{name}"}} {entry["count"]}')
+        for kind in ("hits", "misses"):
+            lines += [
+                f"# HELP {prefix}_cache_{kind}_total Cache {kind}",
+                f"# TYPE {prefix}_cache_{kind}_total counter"
+            ]
+            for name, entry in metrics["caches"].items():
+                name = self._escape_label(name)
+                lines.append(f'{prefix}_cache_{kind}_total{{cache="{name}"}} {entry[kind]}')
+        return "\n".join(lines) + "\n"
+
 class AlgorithmicFramework:
     """Base framework for biblical algorithmic processing with plugin architecture"""
 
@@ -610,6 +1520,9 @@ class AlgorithmicFramework:
         self.plugins = {}     # name -> AlgorithmPlugin mapping
         self.passage_cache = {}
         self.categories = {}  # category -> list of algorithm names
+        self.similarity_index = None  # CorpusSimilarityIndex, built on demand
+        self._plugin_fingerprints = {}  # name -> fingerprint, reset on (un)registration
+        self.metrics = PluginMetrics()  # Per-plugin latency/throughput and cache hit rates
 
     def register_algorithm(self, name: str, algorithm_func, category: str = "general",
                           description: str = "", dependencies: List[str] = None,
@@ -628,6 +1541,7 @@ class AlgorithmicFramework:
 
         self.algorithms[name] = algorithm_func
         self.plugins[name] = plugin
+        self._plugin_fingerprints.pop(name, None)
 
         # Update category index
         if category not in self.categories:
@@ -644,6 +1558,37 @@ class AlgorithmicFramework:
             del self.plugins[name]
         if name in self.algorithms:
             del self.algorithms[name]
+        self._plugin_fingerprints.pop(name, None)
+
+    def get_plugin_fingerprint(self, name: str) -> Optional[str]:
+        """Stable hash of a plugin's version and code, used to key persisted results
+
+        Changing the plugin version, its function body, the source of the module defining
+        it (helpers, constants, owning class) or the framework version yields a new
+        fingerprint, so results computed by older code are never reused. Plugins whose
+        source cannot be read, or which depend on code in other modules, must bump their
+        version when that code changes.
+        """
+        plugin = self.plugins.get(name)
+        if plugin is None:
+            return None
+        if name not in self._plugin_fingerprints:
+            digest = hashlib.sha256()
+            digest.update(f"{__version__}\x1f{plugin.name}\x1f{plugin.version}".encode('utf-8'))
+            function = getattr(plugin.function, '__func__', plugin.function)
+            code = getattr(function, '__code__', None)
+            if code is None:
+                code = getattr(getattr(type(function), '__call__', None), '__code__', None)
+            if code is not None:
+                _update_code_digest(digest, code)
+            else:
+                digest.update(repr(function).encode('utf-8'))
+            module_name = getattr(function, '__module__', None) or type(function).__module__
+            module_digest = _get_module_source_digest(module_name)
+            if module_digest is not None:
+                digest.update(f"\x1f{module_digest}".encode('utf-8'))
+            self._plugin_fingerprints[name] = digest.hexdigest()
+        return self._plugin_fingerprints[name]
 
     def get_plugin_info(self, name: str) -> Optional[AlgorithmPlugin]:
         """Get plugin metadata"""
@@ -685,7 +1630,13 @@ class AlgorithmicFramework:
             return None  # Could return error result instead
 
         algorithm = self.algorithms[algorithm_name]
-        result = algorithm(passage)
+        start = time.perf_counter()
+        try:
+            result = algorithm(passage)
+        except Exception:
+            self.metrics.record(algorithm_name, time.perf_counter() - start, error=True)
+            raise
+        self.metrics.record(algorithm_name, time.perf_counter() - start)
 
         return AlgorithmicResult(
             algorithm_name=algorithm_name,
@@ -695,6 +1646,17 @@ class AlgorithmicFramework:
             confidence=result.get('confidence', 1.0)
         )
 
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-plugin call counts, latencies and cache hit rates"""
+        return self.metrics.get_metrics()
+
+    def export_metrics(self, filename: str, format: str = "json"):
+        """Write metrics as JSON or Prometheus text ("prometheus")"""
+        if format not in ("json", "prometheus"):
+            raise ValueError(f"Unknown metrics format: {format}")
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(self.metrics.to_json() if format == "json" else self.metrics.to_prometheus())
+
     def cache_passage(self, passage: BiblicalPassage):
         """Cache a passage for reuse"""
         key = f"{passage.reference}_{passage.version}"
@@ -785,8 +1747,34 @@ class AlgorithmicFramework:
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2)
 
-    def analyze_passage_against_corpus(self, passage: BiblicalPassage, corpus: List[BiblicalPassage], algorithm_name: str) -> List[AlgorithmicResult]:
-        """Analyze passage against a corpus using specified algorithm"""
+    def build_similarity_index(self, corpus: List[BiblicalPassage], max_df_ratio: float = 0.5) -> CorpusSimilarityIndex:
+        """Build (or rebuild) the TF-IDF similarity index over a corpus"""
+        self.similarity_index = CorpusSimilarityIndex(max_df_ratio=max_df_ratio).build(corpus)
+        return self.similarity_index
+
+    def find_similar_passages(self, passage: BiblicalPassage, corpus: List[BiblicalPassage] = None,
+                              top_k: int = 10) -> List[SimilarityMatch]:
+        """Find the top-k passages most similar to a passage (index is reused across queries)
+
+        corpus=None queries the index already built, with no validation at all; a corpus
+        not yet indexed (or changed since) is indexed first.
+        """
+        if corpus is not None and (self.similarity_index is None or not self.similarity_index.covers(corpus)):
+            self.build_similarity_index(corpus)
+        if self.similarity_index is None:
+            return []
+        return self.similarity_index.query(passage, top_k=top_k)
+
+    def analyze_passage_against_corpus(self, passage: BiblicalPassage, corpus: List[BiblicalPassage],
+                                       algorithm_name: str = None, top_k: int = None) -> List[AlgorithmicResult]:
+        """Analyze passage against a corpus using specified algorithm
+
+        With top_k set, only the top-k most similar passages (TF-IDF cosine) are returned,
+        each linked back to the query passage; algorithm_name, if given, is run on those hits only.
+        """
+        if top_k is not None:
+            return self._analyze_similar_passages(passage, corpus, algorithm_name, top_k)
+
         results = []
         for corpus_passage in corpus:
             if corpus_passage.reference != passage.reference:  # Don't analyze against itself
@@ -801,25 +1789,118 @@ class AlgorithmicFramework:
                     results.append(result)
         return results
 
-    def analyze_corpus(self, passages: List[BiblicalPassage], algorithm_names: List[str] = None) -> List[MultiDimensionalResult]:
-        """Analyze multiple passages using all available algorithms"""
-        if algorithm_names is None:
-            algorithm_names = list(self.algorithms.keys())
-
+    def _analyze_similar_passages(self, passage: BiblicalPassage, corpus: List[BiblicalPassage],
+                                  algorithm_name: Optional[str], top_k: int) -> List[AlgorithmicResult]:
+        """Similarity mode of analyze_passage_against_corpus"""
         results = []
-        analyzer = MultiDimensionalAnalyzer(self.framework if hasattr(self, 'framework') else self)
+        for match in self.find_similar_passages(passage, corpus, top_k=top_k):
+            similarity_findings = {
+                "similarity_score": round(match.score, 4),
+                "shared_terms": match.shared_terms[:10]
+            }
 
-        for i, passage in enumerate(passages):
-            print(f"Analyzing passage {i+1}/{len(passages)}: {passage.reference}")
-            try:
-                result = analyzer.analyze(passage)
-                results.append(result)
-            except Exception as e:
-                print(f"Error analyzing {passage.reference}: {e}")
-                continue
+            if algorithm_name:
+                result = self.analyze_passage(match.passage, algorithm_name)
+                if not result:
+                    continue
+                result.findings["similarity"] = similarity_findings
+            else:
+                result = AlgorithmicResult(
+                    algorithm_name="tfidf_similarity",
+                    input_passage=match.passage,
+                    findings=similarity_findings,
+                    insights=[f"{match.passage.reference} is similar to {passage.reference} "
+                              f"(cosine {match.score:.3f}) via {', '.join(match.shared_terms[:5])}"],
+                    confidence=match.score
+                )
 
+            result.links.append(LinkedPassage(
+                reference=passage.reference,
+                relationship="tfidf_similarity",
+                insight=f"Similarity {match.score:.3f} to {match.passage.reference} via shared terms: {', '.join(match.shared_terms[:5])}"
+            ))
+            results.append(result)
         return results
 
+    def analyze_corpus(self, passages: List[BiblicalPassage], algorithm_names: List[str] = None,
+                       progress_callback=None) -> List[MultiDimensionalResult]:
+        """Analyze multiple passages using all available algorithms"""
+        return list(self.iter_analyze_corpus(passages, progress_callback=progress_callback))
+
+    def iter_analyze_corpus(self, passages: Iterable[BiblicalPassage], ordered: bool = True, max_workers: int = 1,
+                            max_pending: int = None, progress_callback=None, error_callback=None,
+                            precomputed: Dict[str, Dict[AnalysisDimension, DimensionalAnalysis]] = None
+                            ) -> Iterator[MultiDimensionalResult]:
+        """Analyze passages lazily, yielding each MultiDimensionalResult as it completes
+
+        At most max_pending passages (default 2 per worker) are in flight and nothing new is
+        submitted until the consumer pulls, so memory stays bounded for any corpus size.
+        With ordered=False results are yielded as they complete. progress_callback is called
+        as (completed, total, passage) and error_callback as (passage, exception); total is
+        None when passages has no length. precomputed maps passage content hashes to
+        dimension results that should be reused rather than recomputed.
+        """
+        import concurrent.futures
+
+        analyzer = MultiDimensionalAnalyzer(self)
+        precomputed = precomputed or {}
+        error_callback = error_callback or _log_analysis_error
+        total = len(passages) if hasattr(passages, '__len__') else None
+        completed = 0
+
+        if max_workers <= 1:
+            for passage in passages:
+                result = None
+                try:
+                    result = analyzer.analyze(passage, precomputed.get(passage.get_content_hash()))
+                except Exception as e:
+                    error_callback(passage, e)
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total, passage)
+                if result is not None:
+                    yield result
+            return
+
+        max_pending = max_pending or max_workers * 2
+        passage_iter = iter(passages)
+        pending = {}  # future -> passage, in submission order
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while True:
+                # Top up the window; this is the only place new work is submitted
+                while len(pending) < max_pending:
+                    passage = next(passage_iter, None)
+                    if passage is None:
+                        break
+                    future = executor.submit(analyzer.analyze, passage, precomputed.get(passage.get_content_hash()))
+                    pending[future] = passage
+                if not pending:
+                    break
+
+                if ordered:
+                    future = next(iter(pending))
+                else:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    future = next(iter(done))
+                passage = pending.pop(future)
+
+                result = None
+                try:
+                    result = future.result()
+                except Exception as e:
+                    error_callback(passage, e)
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total, passage)
+                if result is not None:
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
     def export_multidimensional_markdown(self, results: List[MultiDimensionalResult], filename: str):
         """Export multi-dimensional results to Markdown"""
         with open(filename, 'w') as f:
@@ -866,51 +1947,242 @@ class AlgorithmicFramework:
         data = {
             "version": __version__,
             "export_date": datetime.now().isoformat(),
-            "results": [
-                {
-                    "passage": {
-                        "reference": r.passage.reference,
-                        "text": r.passage.text,
-                        "version": r.passage.version,
-                        "metadata": {
-                            "word_count": r.passage.word_count,
-                            "keywords": r.passage.keywords,
-                            "themes": r.passage.themes
-                        }
-                    },
-                    "dimensions_analyzed": len(r.dimension_results),
-                    "total_insights": r.get_total_insights(),
-                    "total_findings": r.get_total_findings(),
-                    "average_confidence": r.get_average_confidence(),
-                    "multiplication_factor": r.multiplication_factor,
-                    "synthesis": r.synthesis,
-                    "dimension_results": {
-                        dim.value: {
-                            "findings": result.findings,
-                            "insights": result.insights,
-                            "confidence": result.confidence,
-                            "links": [{"reference": link.reference, "relationship": link.relationship, "insight": link.insight} for link in result.links]
-                        }
-                        for dim, result in r.dimension_results.items()
-                    },
-                    "timestamp": r.timestamp
-                }
-                for r in results
-            ]
+            "results": [self._serialize_multidimensional_result(r) for r in results]
         }
 
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2)
 
-    def export_interactive_html(self, results: List[MultiDimensionalResult], filename: str,
-                               include_visualizations: bool = True):
-        """Export multi-dimensional results to interactive HTML with modern UI"""
-        html_content = self._generate_html_header()
-        html_content += self._generate_html_body(results, include_visualizations)
-        html_content += self._generate_html_footer()
+    def _serialize_multidimensional_result(self, r: MultiDimensionalResult) -> Dict[str, Any]:
+        """Convert a multi-dimensional result to a JSON-ready dict"""
+        return {
+            "passage": {
+                "reference": r.passage.reference,
+                "text": r.passage.text,
+                "version": r.passage.version,
+                "metadata": {
+                    "word_count": r.passage.word_count,
+                    "keywords": r.passage.keywords,
+                    "themes": r.passage.themes
+                }
+            },
+            "dimensions_analyzed": len(r.dimension_results),
+            "total_insights": r.get_total_insights(),
+            "total_findings": r.get_total_findings(),
+            "average_confidence": r.get_average_confidence(),
+            "multiplication_factor": r.multiplication_factor,
+            "synthesis": r.synthesis,
+            "dimension_results": {
+                dim.value: {
+                    "findings": result.findings,
+                    "insights": result.insights,
+                    "confidence": result.confidence,
+                    "links": [{"reference": link.reference, "relationship": link.relationship, "insight": link.insight} for link in result.links]
+                }
+                for dim, result in r.dimension_results.items()
+            },
+            "timestamp": r.timestamp
+        }
+
+    def _serialize_jsonl_record(self, r: MultiDimensionalResult) -> Dict[str, Any]:
+        """Serialize a result as a JSON Lines record, including full passage location"""
+        record = self._serialize_multidimensional_result(r)
+        record["record_type"] = "result"
+        record["content_hash"] = r.passage.get_content_hash()
+        record["passage"].update({
+            "testament": r.passage.testament,
+            "book": r.passage.book,
+            "chapter": r.passage.chapter,
+            "verse": r.passage.verse
+        })
+        return record
+
+    def _serialize_checkpoint_record(self, r: MultiDimensionalResult) -> Dict[str, Any]:
+        """Serialize a result with everything needed to rebuild it (see _deserialize_checkpoint_record)"""
+        record = self._serialize_jsonl_record(r)
+        for dim, result in r.dimension_results.items():
+            record["dimension_results"][dim.value]["findings"] = _encode_checkpoint_value(result.findings)
+        return record
+
+    def _deserialize_checkpoint_record(self, record: Dict[str, Any]) -> MultiDimensionalResult:
+        """Rebuild a MultiDimensionalResult (and its passage) from a checkpoint record"""
+        passage_data = record["passage"]
+        passage = BiblicalPassage(
+            reference=passage_data["reference"],
+            text=passage_data["text"],
+            version=passage_data["version"],
+            testament=passage_data.get("testament", "New"),
+            book=passage_data.get("book", ""),
+            chapter=passage_data.get("chapter", 0),
+            verse=passage_data.get("verse", 0)
+        )
+        dimension_results = {}
+        for dim_value, data in record["dimension_results"].items():
+            dimension = AnalysisDimension(dim_value)
+            dimension_results[dimension] = DimensionalAnalysis(
+                dimension=dimension,
+                findings=_decode_checkpoint_value(data["findings"]),
+                insights=data["insights"],
+                confidence=data["confidence"],
+                links=[LinkedPassage(**link) for link in data["links"]]
+            )
+        return MultiDimensionalResult(
+            passage=passage,
+            dimension_results=dimension_results,
+            synthesis=record["synthesis"],
+            multiplication_factor=record["multiplication_factor"],
+            timestamp=record["timestamp"]
+        )
+
+    def export_multidimensional_jsonl(self, results: Iterable[MultiDimensionalResult], filename: str,
+                                      resume: bool = False, compact: bool = True, use_orjson: bool = False,
+                                      flush_every: int = 100) -> int:
+        """Stream multi-dimensional results to JSON Lines, one object per result
+
+        Works directly on result generators such as iter_analyze_corpus, so writing starts
+        with the first result. With resume=True an existing file is appended to after
+        dropping any partially written last line. Returns the number of results written.
+        """
+        encode = _get_jsonl_encoder(compact, use_orjson)
+
+        appending = resume and os.path.exists(filename) and _truncate_partial_jsonl_line(filename) > 0
+        written = 0
+        with open(filename, 'ab' if appending else 'wb') as f:
+            if not appending:
+                f.write(encode({
+                    "record_type": "header",
+                    "version": __version__,
+                    "export_date": datetime.now().isoformat()
+                }))
+
+            for r in results:
+                f.write(encode(self._serialize_jsonl_record(r)))
+                written += 1
+                if flush_every and written % flush_every == 0:
+                    f.flush()
+
+        return written
+
+    def read_multidimensional_jsonl(self, filename: str) -> Iterator[Dict[str, Any]]:
+        """Read result records from a JSON Lines export, tolerating a truncated last line"""
+        with open(filename, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.endswith('\n'):
+                    break  # Partial line from an interrupted writer
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logging.warning(f"Skipping corrupt line {line_number} in {filename}")
+                    continue
+                if record.get("record_type", "result") == "result":
+                    yield record
+
+    def get_pending_passages(self, passages: Iterable[BiblicalPassage], filename: str) -> List[BiblicalPassage]:
+        """Passages not yet exported (or whose text changed) in a JSON Lines file, for resuming"""
+        if not os.path.exists(filename):
+            return list(passages)
+
+        completed = {
+            (record["passage"]["reference"], record["passage"]["version"]): record.get("content_hash")
+            for record in self.read_multidimensional_jsonl(filename)
+        }
+        return [p for p in passages
+                if completed.get((p.reference, p.version)) != p.get_content_hash()]
+
+    def export_interactive_html(self, results: Iterable[MultiDimensionalResult], filename: str,
+                               include_visualizations: bool = True, passages_per_page: int = None,
+                               split_by_book: bool = False) -> List[str]:
+        """Export multi-dimensional results to interactive HTML with modern UI
+
+        The report is streamed to disk one passage card at a time, so results may be a
+        generator. With passages_per_page and/or split_by_book the passages go to separate
+        pages next to filename, which becomes a lightweight index page with the overall
+        summary. Returns the list of files written.
+        """
+        if passages_per_page or split_by_book:
+            return self._export_paginated_html(results, filename, include_visualizations,
+                                               passages_per_page, split_by_book)
 
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(self._generate_html_header())
+            f.write('<div class="container">\n')
+            f.write(self._generate_report_title_html("Interactive Multi-Dimensional Analysis Report"))
+            stats = self._new_html_report_stats()
+            self._write_passage_cards(f, results, stats)
+            # Summary is written last but displayed first (see .report-summary ordering)
+            f.write(self._generate_summary_html(stats, include_visualizations))
+            f.write('</div>\n')
+            f.write(self._generate_html_footer())
+
+        return [filename]
+
+    def _export_paginated_html(self, results: Iterable[MultiDimensionalResult], filename: str,
+                               include_visualizations: bool, passages_per_page: Optional[int],
+                               split_by_book: bool) -> List[str]:
+        """Write passages to per-book and/or fixed-size pages plus an index page"""
+        base, ext = os.path.splitext(filename)
+        ext = ext or ".html"
+        overall = self._new_html_report_stats()
+        pages = []  # dicts: file, label, passages, average_confidence
+        book_parts = {}
+
+        page_file = None
+        page_stats = None
+        page_key = None
+
+        def close_page(next_page: Optional[str]):
+            prev_page = pages[-2]["file"] if len(pages) > 1 else None
+            page_file.write(self._generate_summary_html(page_stats, False))
+            page_file.write('</div>\n')
+            page_file.write(self._generate_page_nav_html(os.path.basename(filename), prev_page, next_page))
+            page_file.write(self._generate_html_footer())
+            page_file.close()
+            pages[-1]["passages"] = page_stats["passages"]
+            pages[-1]["average_confidence"] = (page_stats["confidence_total"] / page_stats["passages"]
+                                               if page_stats["passages"] else 0.0)
+
+        try:
+            for result in results:
+                key = result.passage.book if split_by_book else None
+                page_full = passages_per_page and page_stats and page_stats["passages"] >= passages_per_page
+                if page_file is None or key != page_key or page_full:
+                    if split_by_book:
+                        book_parts[key] = book_parts.get(key, 0) + 1
+                        slug = re.sub(r'[^a-z0-9]+', '-', (key or "unknown").lower()).strip('-') or "unknown"
+                        name = f"{os.path.basename(base)}_{slug}_{book_parts[key]}{ext}"
+                        label = key or "Unknown"
+                        if book_parts[key] > 1:
+                            label = f"{label} (part {book_parts[key]})"
+                    else:
+                        name = f"{os.path.basename(base)}_page_{len(pages) + 1}{ext}"
+                        label = f"Page {len(pages) + 1}"
+
+                    if page_file is not None:
+                        close_page(name)
+                    pages.append({"file": name, "label": label, "passages": 0, "average_confidence": 0.0})
+                    page_file = open(os.path.join(os.path.dirname(filename), name), 'w', encoding='utf-8')
+                    page_file.write(self._generate_html_header())
+                    page_file.write('<div class="container">\n')
+                    page_file.write(self._generate_report_title_html(label))
+                    page_stats = self._new_html_report_stats()
+                    page_key = key
+
+                self._write_passage_cards(page_file, [result], page_stats, start_index=page_stats["passages"] + 1)
+                self._update_html_report_stats(overall, result)
+        finally:
+            if page_file is not None and not page_file.closed:
+                close_page(None)
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(self._generate_html_header())
+            f.write('<div class="container">\n')
+            f.write(self._generate_report_title_html("Report Index"))
+            f.write(self._generate_page_index_html(pages))
+            f.write(self._generate_summary_html(overall, include_visualizations))
+            f.write('</div>\n')
+            f.write(self._generate_html_footer())
+
+        return [filename] + [os.path.join(os.path.dirname(filename), page["file"]) for page in pages]
 
     def _generate_html_header(self) -> str:
         """Generate HTML header with CSS and JavaScript"""
@@ -940,6 +2212,35 @@ class AlgorithmicFramework:
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
+            display: flex;
+            flex-direction: column;
+        }
+
+        /* Streamed reports write the summary after the passages; show it first */
+        .container > .header { order: -2; }
+        .report-summary { order: -1; }
+
+        .page-nav {
+            text-align: center;
+            padding: 20px;
+            font-size: 1.1em;
+        }
+
+        .page-nav a {
+            color: white;
+            margin: 0 10px;
+        }
+
+        .page-index {
+            width: 100%;
+            margin-top: 15px;
+            border-collapse: collapse;
+        }
+
+        .page-index th, .page-index td {
+            padding: 8px;
+            text-align: left;
+            border-bottom: 1px solid #ecf0f1;
         }
 
         .header {
@@ -1145,26 +2446,57 @@ class AlgorithmicFramework:
 <body>
 """
 
-    def _generate_html_body(self, results: List[MultiDimensionalResult], include_visualizations: bool) -> str:
-        """Generate HTML body content"""
-        body = '<div class="container">\n'
+    def _new_html_report_stats(self) -> Dict[str, Any]:
+        """Running summary statistics for a streamed HTML report"""
+        return {
+            "passages": 0,
+            "insights": 0,
+            "findings": 0,
+            "confidence_total": 0.0,
+            "dimension_counts": {},
+            "confidence_buckets": [0, 0, 0]  # low, medium, high
+        }
 
-        # Header
-        body += f'''
+    def _update_html_report_stats(self, stats: Dict[str, Any], result: MultiDimensionalResult):
+        """Fold one result into running report statistics"""
+        confidence = result.get_average_confidence()
+        stats["passages"] += 1
+        stats["insights"] += result.get_total_insights()
+        stats["findings"] += result.get_total_findings()
+        stats["confidence_total"] += confidence
+        for dim in result.dimension_results.keys():
+            stats["dimension_counts"][dim.value] = stats["dimension_counts"].get(dim.value, 0) + 1
+        if confidence >= 0.8:
+            stats["confidence_buckets"][2] += 1
+        elif confidence >= 0.6:
+            stats["confidence_buckets"][1] += 1
+        else:
+            stats["confidence_buckets"][0] += 1
+
+    def _write_passage_cards(self, f, results: Iterable[MultiDimensionalResult], stats: Dict[str, Any],
+                             start_index: int = 1):
+        """Write passage cards one at a time, updating running statistics"""
+        for i, result in enumerate(results, start_index):
+            self._update_html_report_stats(stats, result)
+            f.write(self._generate_passage_html(result, i))
+
+    def _generate_report_title_html(self, subtitle: str) -> str:
+        """Generate the report title block"""
+        return f'''
     <div class="header">
         <h1>📖 Bible Algorithmic Project</h1>
-        <p>Interactive Multi-Dimensional Analysis Report | Version {__version__}</p>
+        <p>{subtitle} | Version {__version__}</p>
         <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
     </div>
 '''
 
-        # Summary statistics
-        total_passages = len(results)
-        total_insights = sum(r.get_total_insights() for r in results)
-        total_findings = sum(r.get_total_findings() for r in results)
-        avg_confidence = sum(r.get_average_confidence() for r in results) / total_passages if results else 0
+    def _generate_summary_html(self, stats: Dict[str, Any], include_visualizations: bool) -> str:
+        """Generate summary metrics (and optional charts) from running statistics"""
+        total_passages = stats["passages"]
+        avg_confidence = stats["confidence_total"] / total_passages if total_passages else 0
 
-        body += f'''
+        summary = f'''
+    <div class="report-summary">
     <div class="summary-card">
         <h2>📊 Analysis Summary</h2>
         <div class="summary-grid">
@@ -1173,11 +2505,11 @@ class AlgorithmicFramework:
                 <p>Passages Analyzed</p>
             </div>
             <div class="metric">
-                <h3>{total_insights}</h3>
+                <h3>{stats["insights"]}</h3>
                 <p>Total Insights</p>
             </div>
             <div class="metric">
-                <h3>{total_findings}</h3>
+                <h3>{stats["findings"]}</h3>
                 <p>Total Findings</p>
             </div>
             <div class="metric">
@@ -1189,28 +2521,40 @@ class AlgorithmicFramework:
 '''
 
         # Overall visualizations
-        if include_visualizations and results:
-            body += self._generate_overall_charts(results)
+        if include_visualizations and total_passages:
+            summary += self._generate_overall_charts(stats["dimension_counts"], stats["confidence_buckets"])
 
-        # Individual passage analyses
-        for i, result in enumerate(results, 1):
-            body += self._generate_passage_html(result, i)
+        summary += '    </div>\n'
+        return summary
 
-        body += '</div>\n'
-        return body
+    def _generate_page_index_html(self, pages: List[Dict[str, Any]]) -> str:
+        """Generate the page listing for a paginated report index"""
+        rows = [
+            f'            <tr><td><a href="{page["file"]}">{page["label"]}</a></td><td>{page["passages"]}</td><td>{page["average_confidence"]:.2f}</td></tr>'
+            for page in pages
+        ]
+        return '''
+    <div class="summary-card">
+        <h2>📚 Report Pages</h2>
+        <table class="page-index">
+            <tr><th>Page</th><th>Passages</th><th>Average Confidence</th></tr>
+''' + '\n'.join(rows) + '''
+        </table>
+    </div>
+'''
 
-    def _generate_overall_charts(self, results: List[MultiDimensionalResult]) -> str:
+    def _generate_page_nav_html(self, index_file: str, prev_page: Optional[str], next_page: Optional[str]) -> str:
+        """Generate previous/index/next links for a report page"""
+        links = []
+        if prev_page:
+            links.append(f'<a href="{prev_page}">← Previous</a>')
+        links.append(f'<a href="{index_file}">Index</a>')
+        if next_page:
+            links.append(f'<a href="{next_page}">Next →</a>')
+        return f'\n    <div class="page-nav">{" | ".join(links)}</div>\n'
+
+    def _generate_overall_charts(self, dimension_counts: Dict[str, int], confidence_buckets: List[int]) -> str:
         """Generate overall analysis charts"""
-        # Prepare data for charts
-        dimension_counts = {}
-        confidence_scores = []
-
-        for result in results:
-            confidence_scores.append(result.get_average_confidence())
-            for dim in result.dimension_results.keys():
-                dim_name = dim.value
-                dimension_counts[dim_name] = dimension_counts.get(dim_name, 0) + 1
-
         charts_html = '''
     <div class="summary-card">
         <h2>📈 Overall Analysis Visualizations</h2>
@@ -1251,14 +2595,7 @@ class AlgorithmicFramework:
 
         // Confidence chart
         const confidenceCtx = document.getElementById('confidenceChart').getContext('2d');
-        const confidenceData = ''' + str(confidence_scores) + ''';
-        const confidenceBuckets = [0, 0, 0]; // low, medium, high
-
-        confidenceData.forEach(score => {
-            if (score >= 0.8) confidenceBuckets[2]++;
-            else if (score >= 0.6) confidenceBuckets[1]++;
-            else confidenceBuckets[0]++;
-        });
+        const confidenceBuckets = ''' + str(list(confidence_buckets)) + '''; // low, medium, high
 
         new Chart(confidenceCtx, {
             type: 'pie',
@@ -1287,7 +2624,7 @@ class AlgorithmicFramework:
         confidence_class = "confidence-high" if result.get_average_confidence() >= 0.8 else \
                           "confidence-medium" if result.get_average_confidence() >= 0.6 else "confidence-low"
 
-        passage_html = f'''
+        parts = [f'''
     <div class="passage-card">
         <div class="passage-header" onclick="togglePassage({index})">
             <div>
@@ -1310,36 +2647,36 @@ class AlgorithmicFramework:
                 <p><strong>Multiplication Factor:</strong> {result.multiplication_factor}x</p>
 
                 <div class="dimension-grid">
-'''
+''']
 
         # Add each dimension
         for dim, dim_result in result.dimension_results.items():
             confidence_class = "confidence-high" if dim_result.confidence >= 0.8 else \
                               "confidence-medium" if dim_result.confidence >= 0.6 else "confidence-low"
 
-            passage_html += f'''
+            parts.append(f'''
                     <div class="dimension-card">
                         <h4>{dim.value.title()} Analysis</h4>
                         <div class="confidence-badge {confidence_class}">{dim_result.confidence:.2f}</div>
                         <div class="insights-list">
-'''
+''')
 
             for insight in dim_result.insights[:3]:  # Show top 3 insights
-                passage_html += f'<div class="insight-item">{insight}</div>'
+                parts.append(f'<div class="insight-item">{insight}</div>')
 
-            passage_html += '''
+            parts.append('''
                         </div>
                     </div>
-'''
+''')
 
-        passage_html += '''
+        parts.append('''
                 </div>
             </div>
         </div>
     </div>
-'''
+''')
 
-        return passage_html
+        return ''.join(parts)
 
     def _generate_html_footer(self) -> str:
         """Generate HTML footer with JavaScript"""
@@ -1370,11 +2707,51 @@ class AlgorithmicFramework:
 </body>
 </html>'''
 
+class AsyncExecutionContext:
+    """Executor and concurrency limit shared by the async analysis APIs
+
+    CPU-bound analysis runs on executor (None = the event loop's default thread pool) and
+    at most max_concurrency calls run at once; waiting callers are admitted in FIFO
+    order. A timed-out or cancelled call stops waiting immediately, but work already
+    running in a thread finishes in the background.
+    """
+
+    def __init__(self, executor=None, max_concurrency: int = 4):
+        import weakref
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._semaphores = weakref.WeakKeyDictionary()  # event loop -> asyncio.Semaphore (loop-bound)
+
+    def _get_semaphore(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def run(self, func, *args, timeout: float = None):
+        """Run func(*args) on the executor under the concurrency limit
+
+        timeout covers both waiting for a slot and the call itself.
+        """
+        import asyncio
+
+        async def call():
+            async with self._get_semaphore():
+                return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+        if timeout is None:
+            return await call()
+        return await asyncio.wait_for(call(), timeout)
+
 class MultiDimensionalAnalyzer:
     """Orchestrates multi-dimensional biblical analysis with plugin integration"""
 
-    def __init__(self, framework: AlgorithmicFramework):
+    def __init__(self, framework: AlgorithmicFramework, async_context: 'AsyncExecutionContext' = None):
         self.framework = framework
+        self.async_context = async_context  # Created on first analyze_async call if not given
         self.dimension_algorithms = {
             AnalysisDimension.LEXICAL: "lexical_analysis",
             AnalysisDimension.THEMATIC: "thematic_extraction",
@@ -1400,12 +2777,20 @@ class MultiDimensionalAnalyzer:
             AnalysisDimension.HISTORICAL: "historical"
         }
 
-    def analyze(self, passage: BiblicalPassage) -> MultiDimensionalResult:
-        """Perform multi-dimensional analysis"""
+    def analyze(self, passage: BiblicalPassage,
+                precomputed: Dict[AnalysisDimension, DimensionalAnalysis] = None) -> MultiDimensionalResult:
+        """Perform multi-dimensional analysis
+
+        Dimensions present in precomputed (e.g. result store hits) are reused as-is and
+        only the remaining ones are computed.
+        """
+        start = time.perf_counter()
         dimension_results = {}
 
         for dimension, algo_name in self.dimension_algorithms.items():
-            if algo_name in self.framework.algorithms:
+            if precomputed and dimension in precomputed:
+                dimension_results[dimension] = precomputed[dimension]
+            elif algo_name in self.framework.algorithms:
                 result = self.framework.analyze_passage(passage, algo_name)
                 if result:
                     dimension_results[dimension] = DimensionalAnalysis(
@@ -1418,6 +2803,7 @@ class MultiDimensionalAnalyzer:
 
         # Generate synthesis
         synthesis = self._generate_synthesis(passage, dimension_results)
+        self.framework.metrics.record("multidimensional_analysis", time.perf_counter() - start)
 
         return MultiDimensionalResult(
             passage=passage,
@@ -1426,6 +2812,16 @@ class MultiDimensionalAnalyzer:
             multiplication_factor=len(dimension_results)
         )
 
+    async def analyze_async(self, passage: BiblicalPassage, timeout: float = None,
+                            precomputed: Dict[AnalysisDimension, DimensionalAnalysis] = None) -> MultiDimensionalResult:
+        """Async analyze: runs on the async context's executor without blocking the event loop
+
+        Raises asyncio.TimeoutError if the result is not ready within timeout seconds.
+        """
+        if self.async_context is None:
+            self.async_context = AsyncExecutionContext()
+        return await self.async_context.run(self.analyze, passage, precomputed, timeout=timeout)
+
     def _generate_synthesis(self, passage: BiblicalPassage, dimension_results: Dict[AnalysisDimension, DimensionalAnalysis]) -> str:
         """Generate human-readable synthesis"""
         total_insights = sum(len(result.insights) for result in dimension_results.values())
@@ -1482,6 +2878,224 @@ class DimensionInteractionAnalyzer:
         }
         return interactions
 
+    # Per-passage score columns reported by analyze_interactions_batch
+    BATCH_SCORE_COLUMNS = [
+        "resonance_score", "reinforcement_strength", "tension_strength", "emergence_confidence",
+        "semantic_confidence", "trinity_theology_score", "incarnation_theology_score", "creation_theology_score"
+    ]
+
+    def analyze_interactions_batch(self, results: List[MultiDimensionalResult],
+                                   include_details: bool = False) -> Dict[str, Any]:
+        """Analyze dimension interactions for a whole corpus at once
+
+        One pass pulls the findings every interaction rule reads (densities, tense, theme
+        flags, confidences) into columns; reinforcements, tensions, resonance, emergent and
+        semantic patterns and theological scores are then computed for all passages with
+        NumPy array operations. Returns per-passage score columns, the passage indices
+        showing each pattern, each passage's dominant theological framework and corpus
+        distributions. include_details adds the per-passage analyze_interactions dicts.
+        Without NumPy each passage goes through analyze_interactions instead.
+        """
+        if not NUMPY_AVAILABLE:
+            return self._analyze_interactions_sequential(results, include_details)
+
+        dimensions = list(AnalysisDimension)
+        dimension_weights = self._get_dimension_weights()
+        dimension_index = {dimension: j for j, dimension in enumerate(dimensions)}
+        n = len(results)
+        column_names = [
+            "lexical_repetitions", "literary_repetitions", "theme_density", "moral_density", "sentence_count",
+            "theme_count", "creation_theme", "kingdom_theme", "past_dominant", "historical_context",
+            "word_count", "contextual_titles", "thematic_consistency", "christ_density", "trinity_titles"
+        ]
+        rows, presence_rows, confidence_rows = [], [], []
+        for result in results:
+            findings = [{}] * len(dimensions)
+            presence = [False] * len(dimensions)
+            confidences = [0.0] * len(dimensions)
+            for dimension, analysis in result.dimension_results.items():
+                j = dimension_index[dimension]
+                findings[j] = analysis.findings
+                presence[j] = True
+                confidences[j] = analysis.confidence
+            rows.append(self._extract_interaction_features(findings))
+            presence_rows.append(presence)
+            confidence_rows.append(confidences)
+        present = np.array(presence_rows, dtype=bool).reshape(n, len(dimensions))
+        confidence = np.array(confidence_rows, dtype=float).reshape(n, len(dimensions))
+        columns = dict(zip(column_names, np.array(rows, dtype=float).reshape(n, len(column_names)).T))
+        has = {dimension: present[:, j] for j, dimension in enumerate(dimensions)}
+        L, T, S, C = (AnalysisDimension.LEXICAL, AnalysisDimension.THEMATIC,
+                      AnalysisDimension.STRUCTURAL, AnalysisDimension.CHRISTOLOGICAL)
+
+        # Reinforcements and tensions: (mask, strength) per type
+        patterns = {
+            "lexical_literary_reinforcement": (
+                has[L] & has[AnalysisDimension.LITERARY]
+                & (columns["lexical_repetitions"] > 0) & (columns["literary_repetitions"] > 0),
+                np.minimum(columns["lexical_repetitions"], columns["literary_repetitions"]) / 5.0),
+            "thematic_ethical_reinforcement": (
+                has[T] & has[AnalysisDimension.ETHICAL]
+                & (columns["theme_density"] > 0.05) & (columns["moral_density"] > 0.02),
+                np.minimum(columns["theme_density"], columns["moral_density"]) * 10),
+            "structural_thematic_tension": (
+                has[S] & has[T] & (columns["sentence_count"] == 1) & (columns["theme_count"] > 2),
+                columns["theme_count"]),  # theme_count / sentence_count, with sentence_count == 1
+        }
+
+        # Resonance: confidence averaged with dimension weights, accumulated in dimension order
+        weighted_confidence = np.zeros(n)
+        total_weight = np.zeros(n)
+        for j, dimension in enumerate(dimensions):
+            weight = dimension_weights.get(dimension, 1.0)
+            weighted_confidence += np.where(present[:, j], confidence[:, j] * weight, 0.0)
+            total_weight += np.where(present[:, j], weight, 0.0)
+        resonance = np.divide(weighted_confidence, total_weight, out=np.zeros(n), where=total_weight > 0)
+
+        # Emergent and semantic patterns
+        creation = has[T] & (columns["creation_theme"] > 0)
+        past = has[AnalysisDimension.TEMPORAL] & (columns["past_dominant"] > 0)
+        creation_indicators = (creation.astype(int) + past
+                               + (has[AnalysisDimension.HISTORICAL] & (columns["historical_context"] > 0)))
+        patterns["creation_narrative"] = (creation_indicators >= 2, np.minimum(creation_indicators / 3.0, 1.0))
+        patterns["potential_christological_title"] = (
+            has[L] & has[C] & (columns["word_count"] > 1) & (columns["contextual_titles"] > 0), np.full(n, 0.85))
+        patterns["thematic_cross_reference_validation"] = (
+            has[AnalysisDimension.CROSS_REFERENCE] & has[T] & (columns["thematic_consistency"] > 0),
+            np.minimum(columns["thematic_consistency"] / 5.0, 1.0))
+
+        # Theological level
+        creation_score = np.where(creation, 0.3, 0.0) + np.where(creation & past, 0.3, 0.0)
+        incarnation_score = np.where(has[C] & (columns["christ_density"] > 0), columns["christ_density"] * 2, 0.0)
+        trinity_score = (np.where(has[C] & has[T] & (columns["trinity_titles"] > 0), 0.4, 0.0)
+                         + np.where(has[C] & has[T] & (columns["kingdom_theme"] > 0), 0.3, 0.0))
+        framework_scores = np.stack([trinity_score, incarnation_score, creation_score], axis=1)
+        framework_names = np.array(["Trinitarian", "Incarnational", "Creation"])
+        dominant = np.where(framework_scores.max(axis=1, initial=0.0) < 0.2, "Undetermined",
+                            framework_names[framework_scores.argmax(axis=1)])
+
+        def pattern_total(names: List[str]) -> Any:
+            return sum(np.where(patterns[name][0], patterns[name][1], 0.0) for name in names)
+
+        def pattern_max(names: List[str]) -> Any:
+            return np.max([np.where(patterns[name][0], patterns[name][1], 0.0) for name in names], axis=0)
+
+        scores = {
+            "resonance_score": resonance.tolist(),
+            "reinforcement_strength": pattern_total(["lexical_literary_reinforcement",
+                                                     "thematic_ethical_reinforcement"]).tolist(),
+            "tension_strength": pattern_total(["structural_thematic_tension"]).tolist(),
+            "emergence_confidence": pattern_max(["creation_narrative"]).tolist(),
+            "semantic_confidence": pattern_max(["potential_christological_title",
+                                                "thematic_cross_reference_validation"]).tolist(),
+            # Rounded as analyze_theological_level rounds them
+            "trinity_theology_score": [round(x, 2) for x in trinity_score.tolist()],
+            "incarnation_theology_score": [round(x, 2) for x in incarnation_score.tolist()],
+            "creation_theology_score": [round(x, 2) for x in creation_score.tolist()],
+        }
+        batch = self._build_interaction_batch(
+            results, scores,
+            {name: np.flatnonzero(mask).tolist() for name, (mask, _) in patterns.items()},
+            dominant.tolist()
+        )
+        if include_details:
+            batch["details"] = [self.analyze_interactions(result.dimension_results) for result in results]
+        return batch
+
+    def _extract_interaction_features(self, findings: List[Dict[str, Any]]) -> List[float]:
+        """The values read by the interaction rules, in analyze_interactions_batch column order
+
+        findings holds each dimension's findings in AnalysisDimension order ({} when absent).
+        """
+        (lexical, thematic, structural, christological, cross_reference,
+         literary, ethical, temporal, _, historical) = findings
+        themes = thematic.get("detected_themes", {})
+
+        thematic_consistency = 0
+        cross_refs = cross_reference.get("cross_references", [])
+        if cross_refs and themes:
+            for ref in cross_refs:
+                thematic_consistency += len(set(self._get_reference_themes(ref["reference"])) & set(themes.keys()))
+
+        return [
+            len(lexical.get("most_frequent_words", [])),
+            len(literary.get("repetition_patterns", {})),
+            thematic.get("theme_density", 0),
+            ethical.get("moral_density", 0),
+            structural.get("sentence_count", 1),
+            thematic.get("theme_count", 0),
+            "creation" in themes,
+            "kingdom" in themes,
+            temporal.get("dominant_tense", "") == "past",
+            historical.get("context_type", "") in ["strongly_historical", "historically_rooted"],
+            dict(lexical.get("most_frequent_words", [])).get("word", 0),
+            bool(christological.get("contextual_christ_titles", [])),
+            thematic_consistency,
+            christological.get("christological_density", 0),
+            any(title in ["son", "father", "spirit"] for title in christological.get("christ_titles", [])),
+        ]
+
+    def _analyze_interactions_sequential(self, results: List[MultiDimensionalResult],
+                                         include_details: bool) -> Dict[str, Any]:
+        """analyze_interactions_batch without NumPy: one analyze_interactions call per passage"""
+        details = [self.analyze_interactions(result.dimension_results) for result in results]
+        scores = {name: [] for name in self.BATCH_SCORE_COLUMNS}
+        pattern_indices = {name: [] for name in [
+            "lexical_literary_reinforcement", "thematic_ethical_reinforcement", "structural_thematic_tension",
+            "creation_narrative", "potential_christological_title", "thematic_cross_reference_validation"]}
+        dominant = []
+        for i, interaction in enumerate(details):
+            theological = interaction["theological_synthesis"]
+            scores["resonance_score"].append(interaction["resonance_score"])
+            scores["reinforcement_strength"].append(sum(r["strength"] for r in interaction["reinforcements"]) or 0.0)
+            scores["tension_strength"].append(sum(t["strength"] for t in interaction["tensions"]) or 0.0)
+            scores["emergence_confidence"].append(max([e["confidence"] for e in interaction["emergent_patterns"]], default=0.0))
+            scores["semantic_confidence"].append(max([p["confidence"] for p in interaction["semantic_interactions"]], default=0.0))
+            for name in ["trinity_theology_score", "incarnation_theology_score", "creation_theology_score"]:
+                scores[name].append(theological[name])
+            for entry in interaction["reinforcements"] + interaction["tensions"]:
+                pattern_indices[entry["type"]].append(i)
+            for entry in interaction["emergent_patterns"] + interaction["semantic_interactions"]:
+                pattern_indices[entry["pattern"]].append(i)
+            dominant.append(theological["dominant_theological_framework"])
+        batch = self._build_interaction_batch(results, scores, pattern_indices, dominant)
+        if include_details:
+            batch["details"] = details
+        return batch
+
+    def _build_interaction_batch(self, results: List[MultiDimensionalResult], scores: Dict[str, List[float]],
+                                 pattern_indices: Dict[str, List[int]], dominant: List[str]) -> Dict[str, Any]:
+        """Assemble the batch result and its corpus distributions"""
+        n = len(results)
+        distributions = {}
+        for name, values in scores.items():
+            ordered = sorted(values)
+            mean = sum(values) / n if n else 0.0
+            distributions[name] = {
+                "mean": mean,
+                "std": (sum((v - mean) ** 2 for v in values) / n) ** 0.5 if n else 0.0,
+                "min": ordered[0] if ordered else 0.0,
+                "max": ordered[-1] if ordered else 0.0,
+                **{f"p{int(q * 100)}": ordered[min(n - 1, int(q * n))] if ordered else 0.0 for q in (0.5, 0.9, 0.99)}
+            }
+        framework_counts = {}
+        for framework in dominant:
+            framework_counts[framework] = framework_counts.get(framework, 0) + 1
+
+        return {
+            "passages_analyzed": n,
+            "references": [result.passage.reference for result in results],
+            "scores": scores,
+            "patterns": pattern_indices,
+            "dominant_frameworks": dominant,
+            "distributions": {
+                "scores": distributions,
+                "pattern_counts": {name: len(indices) for name, indices in pattern_indices.items()},
+                "pattern_rates": {name: len(indices) / n if n else 0.0 for name, indices in pattern_indices.items()},
+                "framework_counts": framework_counts
+            }
+        }
+
     def _find_reinforcements(self, results: Dict[AnalysisDimension, DimensionalAnalysis]) -> List[Dict]:
         """Find where dimensions reinforce each other"""
         reinforcements = []
@@ -1548,18 +3162,7 @@ class DimensionInteractionAnalyzer:
         total_weighted_confidence = 0.0
         total_weight = 0.0
 
-        dimension_weights = {
-            AnalysisDimension.LEXICAL: 1.0,
-            AnalysisDimension.THEMATIC: 1.2,
-            AnalysisDimension.STRUCTURAL: 0.8,
-            AnalysisDimension.CHRISTOLOGICAL: 1.5,
-            AnalysisDimension.CROSS_REFERENCE: 1.3,
-            AnalysisDimension.LITERARY: 1.1,
-            AnalysisDimension.ETHICAL: 1.4,
-            AnalysisDimension.TEMPORAL: 1.0,
-            AnalysisDimension.ESCHATOLOGICAL: 1.3,
-            AnalysisDimension.HISTORICAL: 1.1
-        }
+        dimension_weights = self._get_dimension_weights()
 
         for dimension, result in results.items():
             weight = dimension_weights.get(dimension, 1.0)
@@ -1690,6 +3293,21 @@ class DimensionInteractionAnalyzer:
             )
         }
 
+    def _get_dimension_weights(self) -> Dict[AnalysisDimension, float]:
+        """Interaction potential of each dimension, used to weight resonance"""
+        return {
+            AnalysisDimension.LEXICAL: 1.0,
+            AnalysisDimension.THEMATIC: 1.2,
+            AnalysisDimension.STRUCTURAL: 0.8,
+            AnalysisDimension.CHRISTOLOGICAL: 1.5,
+            AnalysisDimension.CROSS_REFERENCE: 1.3,
+            AnalysisDimension.LITERARY: 1.1,
+            AnalysisDimension.ETHICAL: 1.4,
+            AnalysisDimension.TEMPORAL: 1.0,
+            AnalysisDimension.ESCHATOLOGICAL: 1.3,
+            AnalysisDimension.HISTORICAL: 1.1
+        }
+
     def _get_reference_themes(self, reference: str) -> List[str]:
         """Get expected themes for a reference (simplified)"""
         theme_map = {
@@ -1706,22 +3324,342 @@ class DimensionInteractionAnalyzer:
             return "Undetermined"
         return max(scores, key=scores.get)
 
+class RunningStats:
+    """Mergeable count, sum, mean, variance, min and max of a numeric stream
+
+    Variance uses Welford's update and Chan et al.'s pairwise merge, so partial
+    statistics from workers or shards combine without revisiting the values.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0  # Stays an int while only ints are added
+        self.min = float('inf')
+        self.max = float('-inf')
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, value):
+        self.count += 1
+        self.total += value
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Fold another instance into this one"""
+        if other.count:
+            count = self.count + other.count
+            delta = other._mean - self._mean
+            self._mean += delta * other.count / count
+            self._m2 += other._m2 + delta * delta * self.count * other.count / count
+            self.count = count
+            self.total += other.total
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def mean(self) -> float:
+        # total / count rather than the running mean so averages match a plain sum exactly
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Population variance"""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def get_summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min if self.count else 0.0,
+            "max": self.max if self.count else 0.0
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"count": self.count, "total": self.total, "min": self.min if self.count else None,
+                "max": self.max if self.count else None, "mean": self._mean, "m2": self._m2}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RunningStats':
+        stats = cls()
+        stats.count, stats.total = data["count"], data["total"]
+        stats._mean, stats._m2 = data["mean"], data["m2"]
+        if stats.count:
+            stats.min, stats.max = data["min"], data["max"]
+        return stats
+
+class StreamingHistogram:
+    """Fixed-bin histogram; bin i counts values in [edges[i-1], edges[i])"""
+
+    def __init__(self, edges: Iterable[float], labels: Optional[Iterable[str]] = None):
+        self.edges = tuple(edges)
+        self.labels = tuple(labels) if labels is not None else None
+        if self.labels is not None and len(self.labels) != len(self.edges) + 1:
+            raise ValueError(f"Expected {len(self.edges) + 1} labels for {len(self.edges)} edges")
+        self.counts = [0] * (len(self.edges) + 1)
+
+    def update(self, value: float):
+        self.counts[bisect.bisect_right(self.edges, value)] += 1
+
+    def merge(self, other: 'StreamingHistogram') -> 'StreamingHistogram':
+        """Fold another histogram with the same edges into this one"""
+        if other.edges != self.edges:
+            raise ValueError("Cannot merge histograms with different bin edges")
+        self.counts = [ours + theirs for ours, theirs in zip(self.counts, other.counts)]
+        return self
+
+    def get_counts(self) -> Dict[str, int]:
+        """Counts keyed by label (or by "[low, high)" range when unlabeled)"""
+        if self.labels is not None:
+            return dict(zip(self.labels, self.counts))
+        bounds = (float('-inf'),) + self.edges + (float('inf'),)
+        return {f"[{bounds[i]}, {bounds[i + 1]})": count for i, count in enumerate(self.counts)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"edges": list(self.edges), "labels": list(self.labels) if self.labels else None,
+                "counts": list(self.counts)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StreamingHistogram':
+        histogram = cls(data["edges"], data.get("labels"))
+        histogram.counts = list(data["counts"])
+        return histogram
+
+class HeavyHitters:
+    """Space-Saving top-k sketch over a stream of (key, weight) updates
+
+    Keeps at most capacity counters. While there are no more distinct keys than that the
+    counts are exact; past it the smallest counter is reassigned to each new key, so a
+    count may overestimate by at most its recorded error and any key heavier than
+    total / capacity is guaranteed to be kept.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self.counts = {}  # key -> estimated count, in first-seen order
+        self.errors = {}  # key -> maximum overestimate
+        self._heap = []   # (count, seq, key) with stale entries; only kept once the sketch is full
+        self._seq = 0
+
+    def update(self, key, weight: int = 1):
+        self.total += weight
+        count = self.counts.get(key)
+        if count is not None:
+            count = self.counts[key] = count + weight
+        elif len(self.counts) < self.capacity:
+            count = self.counts[key] = weight
+            self.errors[key] = 0
+        else:
+            floor, victim = self._pop_min()
+            del self.counts[victim], self.errors[victim]
+            count = self.counts[key] = floor + weight
+            self.errors[key] = floor
+        if self._heap:
+            self._push(key, count)
+
+    def _push(self, key, count):
+        self._seq += 1
+        heapq.heappush(self._heap, (count, self._seq, key))
+        if len(self._heap) > 4 * self.capacity:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self._heap = []
+        for key, count in self.counts.items():
+            self._seq += 1
+            self._heap.append((count, self._seq, key))
+        heapq.heapify(self._heap)
+
+    def _pop_min(self) -> tuple:
+        """Remove and return (count, key) of the smallest counter"""
+        if not self._heap:
+            self._rebuild_heap()
+        while True:
+            count, _, key = heapq.heappop(self._heap)
+            if self.counts.get(key) == count:
+                return count, key
+
+    def merge(self, other: 'HeavyHitters') -> 'HeavyHitters':
+        """Fold another sketch into this one (mergeable summaries, Agarwal et al.)
+
+        A key missing from a full sketch may have been evicted there, so it is credited
+        with that sketch's smallest count as both count and error.
+        """
+        ours_floor = min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+        theirs_floor = min(other.counts.values()) if len(other.counts) >= other.capacity else 0
+        counts, errors = {}, {}
+        for key, count in self.counts.items():
+            if key in other.counts:
+                counts[key] = count + other.counts[key]
+                errors[key] = self.errors[key] + other.errors[key]
+            else:
+                counts[key] = count + theirs_floor
+                errors[key] = self.errors[key] + theirs_floor
+        for key, count in other.counts.items():
+            if key not in counts:
+                counts[key] = count + ours_floor
+                errors[key] = other.errors[key] + ours_floor
+        if len(counts) > self.capacity:
+            kept = set(key for key, _ in sorted(counts.items(), key=lambda x: x[1], reverse=True)[:self.capacity])
+            counts = {key: count for key, count in counts.items() if key in kept}
+            errors = {key: errors[key] for key in counts}
+        self.counts, self.errors = counts, errors
+        self.total += other.total
+        self._heap = []
+        return self
+
+    def top(self, k: int = None) -> List[tuple]:
+        """(key, count) pairs by descending count; ties keep first-seen order"""
+        ranked = sorted(self.counts.items(), key=lambda x: x[1], reverse=True)
+        return ranked if k is None else ranked[:k]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"capacity": self.capacity, "total": self.total,
+                "counters": [[key, count, self.errors[key]] for key, count in self.counts.items()]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HeavyHitters':
+        sketch = cls(data["capacity"])
+        sketch.total = data["total"]
+        for key, count, error in data["counters"]:
+            sketch.counts[key] = count
+            sketch.errors[key] = error
+        return sketch
+
+class ResultAggregator:
+    """Mergeable single-pass summary of a stream of MultiDimensionalResults
+
+    Each update is O(1) in the number of results seen, so statistics can be computed
+    over a result generator (iter_analyze_batch) and aggregators built by separate
+    workers or shards merged afterwards. SowerMetrics.compute_metrics,
+    BatchAnalyzer.find_patterns_across_batch and analyze_batch's batch_statistics
+    are all derived from one.
+    """
+
+    CONFIDENCE_EDGES = (0.5, 0.8)
+    CONFIDENCE_LABELS = ("low", "medium", "high")
+
+    def __init__(self, theme_capacity: int = 1000):
+        self.insights = RunningStats()
+        self.findings = RunningStats()
+        self.confidence = RunningStats()
+        self.fold = RunningStats()
+        self.confidence_histogram = StreamingHistogram(self.CONFIDENCE_EDGES, self.CONFIDENCE_LABELS)
+        self.themes = HeavyHitters(theme_capacity)
+
+    @classmethod
+    def from_results(cls, results: Iterable[MultiDimensionalResult], **kwargs) -> 'ResultAggregator':
+        return cls(**kwargs).update_all(results)
+
+    @classmethod
+    def of(cls, source) -> 'ResultAggregator':
+        """Aggregate a ResultAggregator (as is), a BatchAnalysisResult or an iterable of results"""
+        if isinstance(source, cls):
+            return source
+        if isinstance(source, BatchAnalysisResult):
+            source = source.results
+        return cls.from_results(source)
+
+    @property
+    def count(self) -> int:
+        return self.insights.count
+
+    def update(self, result: MultiDimensionalResult):
+        self.insights.update(result.get_total_insights())
+        self.findings.update(result.get_total_findings())
+        confidence = result.get_average_confidence()
+        self.confidence.update(confidence)
+        self.confidence_histogram.update(confidence)
+        self.fold.update(result.multiplication_factor)
+
+        thematic_analysis = result.dimension_results.get(AnalysisDimension.THEMATIC)
+        if thematic_analysis:
+            for theme, matches in thematic_analysis.findings.get("detected_themes", {}).items():
+                self.themes.update(theme, len(matches))
+
+    def update_all(self, results: Iterable[MultiDimensionalResult]) -> 'ResultAggregator':
+        for result in results:
+            self.update(result)
+        return self
+
+    def merge(self, other: 'ResultAggregator') -> 'ResultAggregator':
+        """Fold another aggregator (e.g. from a worker or shard) into this one"""
+        self.insights.merge(other.insights)
+        self.findings.merge(other.findings)
+        self.confidence.merge(other.confidence)
+        self.fold.merge(other.fold)
+        self.confidence_histogram.merge(other.confidence_histogram)
+        self.themes.merge(other.themes)
+        return self
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Totals, distribution summaries and the confidence histogram"""
+        return {
+            "passages": self.count,
+            "insights": self.insights.get_summary(),
+            "findings": self.findings.get_summary(),
+            "confidence": self.confidence.get_summary(),
+            "multiplication_factor": self.fold.get_summary(),
+            "confidence_distribution": self.confidence_histogram.get_counts(),
+            "top_themes": self.themes.top(5)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "insights": self.insights.to_dict(),
+            "findings": self.findings.to_dict(),
+            "confidence": self.confidence.to_dict(),
+            "fold": self.fold.to_dict(),
+            "confidence_histogram": self.confidence_histogram.to_dict(),
+            "themes": self.themes.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ResultAggregator':
+        aggregator = cls(data["themes"]["capacity"])
+        aggregator.insights = RunningStats.from_dict(data["insights"])
+        aggregator.findings = RunningStats.from_dict(data["findings"])
+        aggregator.confidence = RunningStats.from_dict(data["confidence"])
+        aggregator.fold = RunningStats.from_dict(data["fold"])
+        aggregator.confidence_histogram = StreamingHistogram.from_dict(data["confidence_histogram"])
+        aggregator.themes = HeavyHitters.from_dict(data["themes"])
+        return aggregator
+
 class SowerMetrics:
     """Quantifies interpretive multiplication progress (Matthew 13:8)"""
 
-    def compute_metrics(self, results: List[MultiDimensionalResult]) -> Dict[str, float]:
-        """Calculate interpretive yield metrics"""
-        if not results:
+    def compute_metrics(self, results) -> Dict[str, float]:
+        """Calculate interpretive yield metrics
+
+        results may be a list, a result generator or a (merged) ResultAggregator.
+        """
+        aggregate = ResultAggregator.of(results)
+        if not aggregate.count:
             return {"interpretive_yield": 0.0, "average_fold": 0.0, "growth_index": 0.0}
 
-        total_insights = sum(r.get_total_insights() for r in results)
-        avg_fold = sum(r.multiplication_factor for r in results) / len(results)
+        total_insights = aggregate.insights.total
+        avg_fold = aggregate.fold.mean
 
         # Growth index: insights × fold factor / baseline (10 = symbolic "tenfold")
         growth_index = round(total_insights * avg_fold / 10, 2)
 
         return {
-            "interpretive_yield": round(total_insights / len(results), 2),
+            "interpretive_yield": round(total_insights / aggregate.count, 2),
             "average_fold": round(avg_fold, 1),
             "growth_index": growth_index
         }
@@ -1835,17 +3773,127 @@ class GenreDetector:
             }
         }
 
-    def classify_genre(self, passage: BiblicalPassage) -> GenreClassification:
-        """Classify the genre of a biblical passage"""
+        # Dimension features added to each genre's indicator score: (feature names, multiplier)
+        self.genre_feature_terms = {
+            "narrative": (["past_tense_ratio", "sequence_ratio"], 0.5),        # High past tense + sequence words
+            "poetry": (["parallelism_score", "imagery_score"], 0.8),          # Parallelism and imagery
+            "prophecy": (["future_tense_ratio", "judgment_density"], 1.2),    # Future orientation + judgment themes
+            "wisdom": (["imperative_density", "virtue_density"], 1.5),        # Imperatives + moral teaching
+            "gospel": (["jesus_density"], 1.8),                               # Jesus focus (+ narrative influence)
+            "epistle": (["exhortation_density"], 2.0),                        # Epistolary markers + exhortation
+            "apocalyptic": (["vision_density"], 2.5),                         # Symbolic language + visions
+            "historical": (["historical_density", "chronological_score"], 1.3)  # Historical figures + chronology
+        }
+
+        # Dimension analyses the genre features are computed from, when no result supplies them
+        self.analysis_functions = {
+            AnalysisDimension.STRUCTURAL: structural_analysis,
+            AnalysisDimension.CHRISTOLOGICAL: christological_analysis,
+            AnalysisDimension.LITERARY: literary_analysis,
+            AnalysisDimension.ETHICAL: ethical_analysis,
+            AnalysisDimension.TEMPORAL: temporal_analysis,
+            AnalysisDimension.ESCHATOLOGICAL: eschatological_analysis,
+            AnalysisDimension.HISTORICAL: historical_analysis,
+        }
+
+    def _get_dimension_result(self, passage: BiblicalPassage, dimension: AnalysisDimension,
+                              result: Optional[MultiDimensionalResult] = None,
+                              feature_cache: Optional[Dict[Any, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Findings for one dimension, taken from an existing result or cache before recomputing"""
+        if result is not None and dimension in result.dimension_results:
+            return {"findings": result.dimension_results[dimension].findings}
+
+        if feature_cache is None:
+            return {"findings": self.analysis_functions[dimension](passage)["findings"]}
+        key = (passage.get_content_hash(), dimension)
+        if key in feature_cache:
+            return feature_cache[key]
+
+        dimension_result = {"findings": self.analysis_functions[dimension](passage)["findings"]}
+        feature_cache[key] = dimension_result
+        return dimension_result
+
+    def _indicator_weight(self, genre: str, indicator_type: str) -> float:
+        """Importance of one indicator category for a genre"""
+        if indicator_type == "tense_markers":
+            return 1.5 if genre in ["narrative", "historical"] else 1.0
+        elif indicator_type == "future_markers":
+            return 1.5 if genre == "prophecy" else 1.0
+        elif indicator_type == "jesus_titles":
+            return 2.0 if genre == "gospel" else 0.5
+        return 1.0
+
+    def _extract_genre_features(self, passage: BiblicalPassage, result: Optional[MultiDimensionalResult] = None,
+                                feature_cache: Optional[Dict[Any, Dict[str, Any]]] = None) -> Dict[str, float]:
+        """Ratios and densities from the dimension analyses used by genre-specific scoring"""
+        def dimension_result(dimension: AnalysisDimension) -> Dict[str, Any]:
+            return self._get_dimension_result(passage, dimension, result, feature_cache)
+
         text_lower = passage.get_cached_text_lower()
-        lemmas = passage.get_lemmas()
-        lemma_text = ' '.join(lemmas)
+        word_count = len(passage.get_cached_words())
+        structural_result = dimension_result(AnalysisDimension.STRUCTURAL)
+        temporal_result = dimension_result(AnalysisDimension.TEMPORAL)
+        literary_result = dimension_result(AnalysisDimension.LITERARY)
+        eschatological_result = dimension_result(AnalysisDimension.ESCHATOLOGICAL)
+        ethical_result = dimension_result(AnalysisDimension.ETHICAL)
+        christological_result = dimension_result(AnalysisDimension.CHRISTOLOGICAL)
+        historical_result = dimension_result(AnalysisDimension.HISTORICAL)
+
+        tense_distribution = temporal_result["findings"]["tense_distribution"]
+        tense_total = sum(tense_distribution.values()) if tense_distribution else 0
+        repetition_count = sum(structural_result["findings"]["word_repetitions"].values()) if structural_result["findings"]["word_repetitions"] else 0
+        epistle_markers = sum(1 for marker in ["grace", "peace", "brethren", "therefore"] if marker in text_lower)
+        apocalyptic_symbols = sum(1 for symbol in ["beast", "throne", "scroll", "heaven", "earth"] if symbol in text_lower)
+
+        return {
+            "past_tense_ratio": tense_distribution.get("past", 0) / tense_total if tense_distribution else 0,
+            "sequence_ratio": repetition_count / word_count if word_count else 0,
+            "parallelism_score": len(literary_result["findings"]["repetition_patterns"]) / word_count if word_count else 0,
+            "imagery_score": len(literary_result["findings"]["imagery_detected"]) / 5.0,  # Normalize to 5 senses
+            "future_tense_ratio": tense_distribution.get("future", 0) / tense_total if tense_distribution else 0,
+            "judgment_density": eschatological_result["findings"]["eschatological_density"],
+            "imperative_density": ethical_result["findings"]["imperative_count"] / word_count if word_count else 0,
+            "virtue_density": len(ethical_result["findings"]["detected_virtues"]) / word_count if word_count else 0,
+            "jesus_density": christological_result["findings"]["christological_density"],
+            "exhortation_density": epistle_markers / word_count if word_count else 0,
+            "vision_density": apocalyptic_symbols / word_count if word_count else 0,
+            "historical_density": historical_result["findings"]["historical_density"],
+            "chronological_score": temporal_result["findings"]["sequence_indicators"] / word_count if word_count else 0,
+        }
+
+    def _build_classification(self, confidence_scores: Dict[str, float],
+                              detection_features: Dict[str, Dict[str, int]]) -> GenreClassification:
+        # Determine primary and secondary genres
+        sorted_genres = sorted(confidence_scores.items(), key=lambda x: x[1], reverse=True)
+        primary_genre = sorted_genres[0][0]
+        secondary_genres = [genre for genre, score in sorted_genres[1:3] if score > 0.3]  # Top 2 secondary if > 30%
+
+        # Genre characteristics
+        genre_characteristics = {
+            "primary_features": self.genres[primary_genre]["key_features"],
+            "confidence_distribution": confidence_scores,
+            "genre_description": self.genres[primary_genre]["description"]
+        }
+
+        return GenreClassification(
+            primary_genre=primary_genre,
+            secondary_genres=secondary_genres,
+            confidence_scores=confidence_scores,
+            detection_features=detection_features,
+            genre_characteristics=genre_characteristics
+        )
+
+    def classify_genre(self, passage: BiblicalPassage, result: Optional[MultiDimensionalResult] = None,
+                       feature_cache: Optional[Dict[Any, Dict[str, Any]]] = None) -> GenreClassification:
+        """Classify the genre of a biblical passage
 
-        # Get analysis results for additional features
-        lexical_result = lexical_analysis(passage)
-        thematic_result = thematic_extraction(passage)
-        structural_result = structural_analysis(passage)
-        temporal_result = temporal_analysis(passage)
+        Dimension findings are read from result (a MultiDimensionalResult for the same passage)
+        when present, then from feature_cache (keyed by (content hash, dimension), shareable
+        across calls), and only computed as a last resort, so each dimension runs at most once.
+        """
+        text_lower = passage.get_cached_text_lower()
+        lemma_text = passage.get_lemma_text()
+        features = self._extract_genre_features(passage, result, feature_cache)
 
         confidence_scores = {}
         detection_features = {}
@@ -1863,95 +3911,160 @@ class GenreDetector:
                         matches += 1
 
                 # Weight matches by category importance
-                if indicator_type == "tense_markers":
-                    weight = 1.5 if genre in ["narrative", "historical"] else 1.0
-                elif indicator_type == "future_markers":
-                    weight = 1.5 if genre == "prophecy" else 1.0
-                elif indicator_type == "jesus_titles":
-                    weight = 2.0 if genre == "gospel" else 0.5
-                else:
-                    weight = 1.0
-
-                score += (matches / len(indicators)) * weight
+                score += (matches / len(indicators)) * self._indicator_weight(genre, indicator_type)
                 features_found[indicator_type] = matches
 
             # Genre-specific analysis enhancements
-            if genre == "narrative":
-                # High past tense + sequence words
-                past_tense_ratio = temporal_result["findings"]["tense_distribution"].get("past", 0) / sum(temporal_result["findings"]["tense_distribution"].values()) if temporal_result["findings"]["tense_distribution"] else 0
-                repetition_count = sum(structural_result["findings"]["word_repetitions"].values()) if structural_result["findings"]["word_repetitions"] else 0
-                sequence_ratio = repetition_count / len(passage.get_cached_words()) if passage.get_cached_words() else 0
-                score += (past_tense_ratio + sequence_ratio) * 0.5
-
-            elif genre == "poetry":
-                # Parallelism and imagery
-                literary_result = literary_analysis(passage)
-                parallelism_score = len(literary_result["findings"]["repetition_patterns"]) / len(passage.get_cached_words()) if passage.get_cached_words() else 0
-                imagery_score = len(literary_result["findings"]["imagery_detected"]) / 5.0  # Normalize to 5 senses
-                score += (parallelism_score + imagery_score) * 0.8
-
-            elif genre == "prophecy":
-                # Future orientation + judgment themes
-                future_tense_ratio = temporal_result["findings"]["tense_distribution"].get("future", 0) / sum(temporal_result["findings"]["tense_distribution"].values()) if temporal_result["findings"]["tense_distribution"] else 0
-                eschatological_result = eschatological_analysis(passage)
-                judgment_density = eschatological_result["findings"]["eschatological_density"]
-                score += (future_tense_ratio + judgment_density) * 1.2
-
-            elif genre == "wisdom":
-                # Imperatives + moral teaching
-                ethical_result = ethical_analysis(passage)
-                imperative_density = ethical_result["findings"]["imperative_count"] / len(passage.get_cached_words()) if passage.get_cached_words() else 0
-                virtue_density = len(ethical_result["findings"]["detected_virtues"]) / len(passage.get_cached_words()) if passage.get_cached_words() else 0
-                score += (imperative_density + virtue_density) * 1.5
-
-            elif genre == "gospel":
-                # Jesus focus + narrative elements
-                christological_result = christological_analysis(passage)
-                jesus_density = christological_result["findings"]["christological_density"]
-                narrative_score = confidence_scores.get("narrative", 0) * 0.3  # Partial narrative influence
-                score += (jesus_density + narrative_score) * 1.8
-
-            elif genre == "epistle":
-                # Epistolary markers + exhortation
-                epistle_markers = sum(1 for marker in ["grace", "peace", "brethren", "therefore"] if marker in text_lower)
-                exhortation_density = epistle_markers / len(passage.get_cached_words()) if passage.get_cached_words() else 0
-                score += exhortation_density * 2.0
-
-            elif genre == "apocalyptic":
-                # Symbolic language + visions
-                apocalyptic_symbols = sum(1 for symbol in ["beast", "throne", "scroll", "heaven", "earth"] if symbol in text_lower)
-                vision_density = apocalyptic_symbols / len(passage.get_cached_words()) if passage.get_cached_words() else 0
-                score += vision_density * 2.5
-
-            elif genre == "historical":
-                # Historical figures + chronology
-                historical_result = historical_analysis(passage)
-                historical_density = historical_result["findings"]["historical_density"]
-                chronological_score = temporal_result["findings"]["sequence_indicators"] / len(passage.get_cached_words()) if passage.get_cached_words() else 0
-                score += (historical_density + chronological_score) * 1.3
+            feature_names, multiplier = self.genre_feature_terms[genre]
+            term = sum(features[name] for name in feature_names)
+            if genre == "gospel":
+                term += confidence_scores.get("narrative", 0) * 0.3  # Partial narrative influence
+            score += term * multiplier
 
             confidence_scores[genre] = min(score / 3.0, 1.0)  # Normalize to 0-1
             detection_features[genre] = features_found
 
-        # Determine primary and secondary genres
-        sorted_genres = sorted(confidence_scores.items(), key=lambda x: x[1], reverse=True)
-        primary_genre = sorted_genres[0][0]
-        secondary_genres = [genre for genre, score in sorted_genres[1:3] if score > 0.3]  # Top 2 secondary if > 30%
-
-        # Genre characteristics
-        genre_characteristics = {
-            "primary_features": self.genres[primary_genre]["key_features"],
-            "confidence_distribution": confidence_scores,
-            "genre_description": self.genres[primary_genre]["description"]
-        }
-
-        return GenreClassification(
-            primary_genre=primary_genre,
-            secondary_genres=secondary_genres,
-            confidence_scores=confidence_scores,
-            detection_features=detection_features,
-            genre_characteristics=genre_characteristics
-        )
+        return self._build_classification(confidence_scores, detection_features)
+
+    @staticmethod
+    def _indicator_presence(texts: List[str], vocabulary: List[str]) -> 'np.ndarray':
+        """Boolean matrix: does texts[i] contain vocabulary[j] (plain substring test)
+
+        A single-word indicator can only occur inside one whitespace-separated token, so it
+        is tested once per distinct token in the corpus, and each text's indicators are the
+        union of its tokens' bitmasks. Multi-word indicators are found with one scan of the
+        joined corpus per indicator.
+        """
+        import functools
+        import operator
+
+        single = [(j, term) for j, term in enumerate(vocabulary) if term.isalpha()]
+        phrases = [(j, term) for j, term in enumerate(vocabulary) if not term.isalpha()]
+
+        class TokenMasks(dict):
+            def __missing__(self, token):
+                mask = 0
+                for j, term in single:
+                    if term in token:
+                        mask |= 1 << j
+                self[token] = mask
+                return mask
+
+        token_masks = TokenMasks()
+        masks = [functools.reduce(operator.or_, map(token_masks.__getitem__, text.split()), 0) for text in texts]
+
+        # \x01 occurs in no indicator, so no match can span two texts
+        joined = "\x01".join(texts)
+        starts = [0]
+        for text in texts:
+            starts.append(starts[-1] + len(text) + 1)
+        for j, term in phrases:
+            bit = 1 << j
+            position = joined.find(term)
+            while position >= 0:
+                i = bisect.bisect_right(starts, position) - 1
+                masks[i] |= bit
+                position = joined.find(term, starts[i + 1])  # One hit per text is enough
+
+        width = (len(vocabulary) + 7) // 8
+        packed = np.frombuffer(b"".join(mask.to_bytes(width, "little") for mask in masks), dtype=np.uint8)
+        bits = np.unpackbits(packed.reshape(len(texts), width), axis=1, bitorder="little")
+        return bits[:, :len(vocabulary)].astype(bool)
+
+    def classify_corpus(self, passages: List[BiblicalPassage],
+                        results: Optional[List[Optional[MultiDimensionalResult]]] = None,
+                        feature_cache: Optional[Dict[Any, Dict[str, Any]]] = None,
+                        error_callback=None) -> List[Optional[GenreClassification]]:
+        """Classify many passages at once, scoring all genres with NumPy array operations
+
+        Indicator matches for the whole corpus are built as one matrix (see
+        _indicator_presence), dimension features are gathered alongside, then every genre is
+        scored for every passage at once; scores are accumulated in the same order as
+        classify_genre, so both give identical classifications. results (aligned with
+        passages) and feature_cache are used as in classify_genre. Passages whose features
+        fail are reported to error_callback as (passage, exception) and get None. Without
+        NumPy this falls back to classify_genre per passage.
+
+        Dimension features still come from the per-passage dimension analyses, which
+        dominate the cost when they must be computed: without results this is only
+        marginally faster than classify_genre (a few thousand passages per second). Pass
+        the batch results to skip them.
+        """
+        error_callback = error_callback or _log_analysis_error
+        results = results if results is not None else [None] * len(passages)
+
+        if not NUMPY_AVAILABLE:
+            classifications = []
+            for passage, result in zip(passages, results):
+                try:
+                    classifications.append(self.classify_genre(passage, result, feature_cache))
+                except Exception as e:
+                    error_callback(passage, e)
+                    classifications.append(None)
+            return classifications
+
+        # Indicator vocabulary and the categories (genre, indicator type) that use each term
+        genres = list(self.genres)
+        categories = [(genre, indicator_type, indicators)
+                      for genre in genres
+                      for indicator_type, indicators in self.genres[genre]["indicators"].items()]
+        vocabulary = list(dict.fromkeys(indicator for _, _, indicators in categories for indicator in indicators))
+        term_index = {term: i for i, term in enumerate(vocabulary)}
+        incidence = np.zeros((len(vocabulary), len(categories)))
+        for k, (_, _, indicators) in enumerate(categories):
+            for indicator in indicators:
+                incidence[term_index[indicator], k] += 1
+        feature_names = list(dict.fromkeys(name for names, _ in self.genre_feature_terms.values() for name in names))
+        feature_index = {name: i for i, name in enumerate(feature_names)}
+
+        prime_spacy_docs(passages)  # Lemmas for every passage in one nlp.pipe call
+
+        rows, searchable, feature_rows = [], [], []
+        for i, (passage, result) in enumerate(zip(passages, results)):
+            try:
+                features = self._extract_genre_features(passage, result, feature_cache)
+            except Exception as e:
+                error_callback(passage, e)
+                continue
+            # NUL never occurs in an indicator, so no match can span text and lemmas
+            searchable.append(passage.get_cached_text_lower() + "\0" + passage.get_lemma_text())
+            feature_rows.append([features[name] for name in feature_names])
+            rows.append(i)
+
+        classifications = [None] * len(passages)
+        if not rows:
+            return classifications
+
+        # Matches per category are exact small integers, so the matrix product loses nothing
+        counts = self._indicator_presence(searchable, vocabulary).astype(float) @ incidence
+        feature_matrix = np.array(feature_rows, dtype=float)
+        confidence = np.zeros((len(rows), len(genres)))
+        k = 0
+        for g, genre in enumerate(genres):
+            scores = np.zeros(len(rows))
+            for indicator_type, indicators in self.genres[genre]["indicators"].items():
+                scores += (counts[:, k] / len(indicators)) * self._indicator_weight(genre, indicator_type)
+                k += 1
+            names, multiplier = self.genre_feature_terms[genre]
+            term = feature_matrix[:, feature_index[names[0]]].copy()
+            for name in names[1:]:
+                term += feature_matrix[:, feature_index[name]]
+            if genre == "gospel" and "narrative" in genres[:g]:
+                term += confidence[:, genres.index("narrative")] * 0.3
+            scores += term * multiplier
+            confidence[:, g] = np.minimum(scores / 3.0, 1.0)
+
+        # Column span of each genre's categories in counts
+        spans, k = [], 0
+        for genre in genres:
+            indicator_types = list(self.genres[genre]["indicators"])
+            spans.append((genre, indicator_types, k, k + len(indicator_types)))
+            k += len(indicator_types)
+        for i, confidence_row, count_row in zip(rows, confidence.tolist(), counts.astype(int).tolist()):
+            detection_features = {genre: dict(zip(indicator_types, count_row[a:b]))
+                                  for genre, indicator_types, a, b in spans}
+            classifications[i] = self._build_classification(dict(zip(genres, confidence_row)), detection_features)
+        return classifications
 
 @dataclass
 class OntologyConcept:
@@ -1981,6 +4094,110 @@ class TheologicalOntology:
         self.concepts = {}  # concept_name -> OntologyConcept
         self.concept_hierarchy = {}  # concept -> level in hierarchy
         self.build_ontology()
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """Rebuild the term index, is-a closures and path cache from self.concepts"""
+        self._concept_order = {}     # concept -> position in ontology order (its bit in the closures)
+        self._concept_names = []
+        self._term_concepts = {}     # term -> concepts listing it as a key term
+        self._key_terms = {}         # index key -> terms containing it
+        self._unkeyed_terms = set()  # terms without word characters, always checked
+        self._reverse_related = {}   # concept -> concepts listing it as related
+        self._run_keys = {}          # word run -> index keys it contains (memoized)
+        self._key_lengths = []
+        self._ancestor_bits = {}     # concept -> bitset of its transitive is-a ancestors
+        self._descendant_bits = {}   # concept -> bitset of its transitive is-a descendants
+        self._declared_by_parent = {}  # name -> indexed concepts listing it in child_concepts
+        self._declared_by_child = {}   # name -> indexed concepts listing it in parent_concepts
+        self._path_trees = {}        # source -> BFS predecessor map, built on first query
+        for concept in self.concepts.values():
+            self._index_concept(concept)
+
+    def _index_concept(self, concept: OntologyConcept):
+        """Add one new concept to the term index and is-a closures
+
+        The term index keys each term by its longest word run (\\w+): a term can only occur
+        in a text if that run is a substring of one of the text's word runs, so matching keys
+        select the candidate terms, whose counts are then taken exactly as before.
+        """
+        name = concept.name
+        bit_index = len(self._concept_names)
+        self._concept_order[name] = bit_index
+        self._concept_names.append(name)
+
+        new_keys = False
+        for term in concept.key_terms:
+            self._term_concepts.setdefault(term, []).append(name)
+            parts = WORD_RUN_PATTERN.findall(term)
+            if parts:
+                key = max(parts, key=len)
+                new_keys = new_keys or key not in self._key_terms
+                self._key_terms.setdefault(key, set()).add(term)
+            else:
+                self._unkeyed_terms.add(term)
+        if new_keys:
+            self._key_lengths = sorted({len(key) for key in self._key_terms})
+            self._run_keys.clear()
+        for related in concept.related_concepts:
+            self._reverse_related.setdefault(related, set()).add(name)
+
+        # Is-a edges may be declared on either side: in this concept's parent/child lists,
+        # or in the lists of already indexed concepts that name it
+        parents = {p for p in concept.parent_concepts if p in self._concept_order and p != name}
+        parents |= self._declared_by_parent.get(name, set())
+        children = {c for c in concept.child_concepts if c in self._concept_order and c != name}
+        children |= self._declared_by_child.get(name, set())
+        for child in concept.child_concepts:
+            self._declared_by_parent.setdefault(child, set()).add(name)
+        for parent in concept.parent_concepts:
+            self._declared_by_child.setdefault(parent, set()).add(name)
+
+        ancestors = 0
+        for parent in parents:
+            ancestors |= (1 << self._concept_order[parent]) | self._ancestor_bits[parent]
+        descendants = 0
+        for child in children:
+            descendants |= (1 << self._concept_order[child]) | self._descendant_bits[child]
+
+        # Everything above the new concept gains it and its descendants, and vice versa
+        bit = 1 << bit_index
+        if ancestors & descendants:
+            ancestors |= bit  # The new concept closes a cycle and is-a itself
+            descendants |= bit
+        self._ancestor_bits[name] = ancestors
+        self._descendant_bits[name] = descendants
+        for ancestor in self._names_in_bits(ancestors):
+            self._descendant_bits[ancestor] |= bit | descendants
+        for descendant in self._names_in_bits(descendants):
+            self._ancestor_bits[descendant] |= bit | ancestors
+
+        self._path_trees.clear()  # Any shortest path may now run through the new concept
+
+    def _names_in_bits(self, bits: int) -> List[str]:
+        """Concept names for the set bits of a closure bitset, in ontology order"""
+        names = []
+        while bits:
+            low = bits & -bits
+            names.append(self._concept_names[low.bit_length() - 1])
+            bits ^= low
+        return names
+
+    def _ensure_indexes(self):
+        if len(self._concept_order) != len(self.concepts):
+            self._build_indexes()  # Concepts were added to self.concepts directly
+
+    def _keys_in_run(self, run: str) -> tuple:
+        keys = self._run_keys.get(run)
+        if keys is None:
+            keys = tuple({run[i:i + length]
+                          for i in range(len(run))
+                          for length in self._key_lengths
+                          if i + length <= len(run) and run[i:i + length] in self._key_terms})
+            if len(self._run_keys) >= 100000:
+                self._run_keys.clear()  # Bound the memo on open-ended vocabularies
+            self._run_keys[run] = keys
+        return keys
 
     def build_ontology(self):
         """Build the theological concept hierarchy"""
@@ -2131,43 +4348,82 @@ class TheologicalOntology:
         # Set up hierarchy levels
         for concept in all_concepts.values():
             self.concepts[concept.name] = concept
-            if not concept.parent_concepts:
-                self.concept_hierarchy[concept.name] = 1
-            else:
-                # Find maximum parent level + 1
-                parent_levels = [self.concept_hierarchy.get(parent, 1) for parent in concept.parent_concepts]
-                self.concept_hierarchy[concept.name] = max(parent_levels) + 1
+            self.concept_hierarchy[concept.name] = self._hierarchy_level(concept)
+
+    def add_concept(self, concept: OntologyConcept):
+        """Add a concept, updating the term index and is-a closures incrementally"""
+        if concept.name in self.concepts:
+            # Replacing a concept can remove edges, which needs a full rebuild
+            self.concepts[concept.name] = concept
+            self.concept_hierarchy[concept.name] = self._hierarchy_level(concept)
+            self._build_indexes()
+            return
+        self._ensure_indexes()
+        self.concepts[concept.name] = concept
+        self.concept_hierarchy[concept.name] = self._hierarchy_level(concept)
+        self._index_concept(concept)
+
+    def _hierarchy_level(self, concept: OntologyConcept) -> int:
+        if not concept.parent_concepts:
+            return 1
+        # Find maximum parent level + 1
+        return max(self.concept_hierarchy.get(parent, 1) for parent in concept.parent_concepts) + 1
 
     def map_passage_to_concepts(self, passage: BiblicalPassage) -> List[ConceptMapping]:
-        """Map a passage to theological concepts in the ontology"""
+        """Map a passage to theological concepts in the ontology
+
+        Only concepts with a key term in the passage, and concepts related to those, can
+        reach the mapping threshold, so only they are scored (in ontology order, since
+        contextual relevance depends on the concepts mapped before).
+        """
+        self._ensure_indexes()
+
         text_lower = passage.get_cached_text_lower()
-        lemmas = passage.get_lemmas()
-        lemma_text = ' '.join(lemmas)
+        lemma_text = passage.get_lemma_text()
+
+        # One pass over the word runs of text and lemmas selects the candidate terms
+        candidate_terms = set(self._unkeyed_terms)
+        for run in set(WORD_RUN_PATTERN.findall(text_lower + "\0" + lemma_text)):
+            for key in self._keys_in_run(run):
+                candidate_terms.update(self._key_terms[key])
+
+        term_counts = {}
+        for term in candidate_terms:
+            if term in text_lower or term in lemma_text:
+                term_counts[term] = text_lower.count(term) + lemma_text.count(term)
+
+        touched = {name for term in term_counts for name in self._term_concepts[term]}
+        candidates = set(touched)
+        for name in touched:
+            candidates.update(self._reverse_related.get(name, ()))
 
         mappings = []
+        mapped = {}  # concept name -> ConceptMapping, for contextual relevance
 
-        for concept_name, concept in self.concepts.items():
+        for concept_name in sorted(candidates, key=self._concept_order.__getitem__):
+            concept = self.concepts[concept_name]
             strength = 0.0
             evidence_terms = []
 
             # Check key terms in text and lemmas
-            for term in concept.key_terms:
-                if term in text_lower or term in lemma_text:
-                    evidence_terms.append(term)
-                    # Weight by term frequency
-                    term_count = text_lower.count(term) + lemma_text.count(term)
-                    strength += term_count * concept.theological_weight
+            if concept_name in touched:
+                for term in concept.key_terms:
+                    if term in term_counts:
+                        evidence_terms.append(term)
+                        # Weight by term frequency
+                        strength += term_counts[term] * concept.theological_weight
 
             # Normalize strength
             max_possible_strength = len(concept.key_terms) * concept.theological_weight * 3  # Assume max 3 occurrences
             if max_possible_strength > 0:
                 strength = min(strength / max_possible_strength, 1.0)
 
-            # Contextual relevance based on related concepts
+            # Contextual relevance based on related concepts (mapped earlier, in ontology order)
             contextual_relevance = 0.0
-            related_mappings = [m for m in mappings if m.concept_name in concept.related_concepts]
-            if related_mappings:
-                contextual_relevance = sum(m.strength for m in related_mappings) / len(related_mappings)
+            related_names = [name for name in set(concept.related_concepts) if name in mapped]
+            if related_names:
+                related_names.sort(key=self._concept_order.__getitem__)
+                contextual_relevance = sum(mapped[name].strength for name in related_names) / len(related_names)
 
             # Boost strength if related concepts are present
             strength += contextual_relevance * 0.2
@@ -2176,13 +4432,15 @@ class TheologicalOntology:
             if strength > 0.1:  # Only include meaningful mappings
                 hierarchical_level = self.concept_hierarchy.get(concept_name, 1)
 
-                mappings.append(ConceptMapping(
+                mapping = ConceptMapping(
                     concept_name=concept_name,
                     strength=strength,
                     evidence_terms=evidence_terms,
                     contextual_relevance=contextual_relevance,
                     hierarchical_level=hierarchical_level
-                ))
+                )
+                mappings.append(mapping)
+                mapped[concept_name] = mapping
 
         # Sort by strength
         mappings.sort(key=lambda x: x.strength, reverse=True)
@@ -2204,34 +4462,65 @@ class TheologicalOntology:
         }
 
     def find_concept_path(self, from_concept: str, to_concept: str) -> List[str]:
-        """Find the shortest path between two concepts in the ontology"""
+        """Find the shortest path between two concepts in the ontology
+
+        Each source's BFS tree is built on its first query and kept until concepts are
+        added, so later queries from it only walk the path back.
+        """
         if from_concept not in self.concepts or to_concept not in self.concepts:
             return []
 
-        # Simple BFS for path finding
+        self._ensure_indexes()
+        tree = self._path_trees.get(from_concept)
+        if tree is None:
+            tree = self._path_trees[from_concept] = self._build_path_tree(from_concept)
+        if to_concept not in tree:
+            return []  # No path found
+
+        path = [to_concept]
+        while path[-1] != from_concept:
+            path.append(tree[path[-1]])
+        path.reverse()
+        return path
+
+    def _build_path_tree(self, source: str) -> Dict[str, Optional[str]]:
+        """BFS from source over parent, child and related links: concept -> predecessor"""
         from collections import deque
 
-        queue = deque([(from_concept, [from_concept])])
-        visited = set()
-
+        tree = {source: None}
+        queue = deque([source])
         while queue:
-            current, path = queue.popleft()
-            if current in visited:
-                continue
-            visited.add(current)
-
-            if current == to_concept:
-                return path
-
-            # Add neighbors
+            current = queue.popleft()
             concept = self.concepts[current]
-            neighbors = concept.parent_concepts + concept.child_concepts + concept.related_concepts
-
-            for neighbor in neighbors:
-                if neighbor not in visited and neighbor in self.concepts:
-                    queue.append((neighbor, path + [neighbor]))
+            # Neighbors are expanded in this order, so ties resolve as the per-query BFS did
+            for neighbor in concept.parent_concepts + concept.child_concepts + concept.related_concepts:
+                if neighbor not in tree and neighbor in self.concepts:
+                    tree[neighbor] = current
+                    queue.append(neighbor)
+        return tree
+
+    def get_ancestors(self, concept_name: str) -> List[str]:
+        """All concepts the given concept transitively is-a, in ontology order"""
+        if concept_name not in self.concepts:
+            return []
+        self._ensure_indexes()
+        return self._names_in_bits(self._ancestor_bits[concept_name])
 
-        return []  # No path found
+    def get_descendants(self, concept_name: str) -> List[str]:
+        """All concepts that transitively are-a the given concept, in ontology order"""
+        if concept_name not in self.concepts:
+            return []
+        self._ensure_indexes()
+        return self._names_in_bits(self._descendant_bits[concept_name])
+
+    def is_a(self, concept_name: str, ancestor_name: str) -> bool:
+        """Whether concept_name is ancestor_name or one of its transitive descendants"""
+        if concept_name not in self.concepts or ancestor_name not in self.concepts:
+            return False
+        if concept_name == ancestor_name:
+            return True
+        self._ensure_indexes()
+        return bool(self._ancestor_bits[concept_name] >> self._concept_order[ancestor_name] & 1)
 
     def get_theological_depth(self, mappings: List[ConceptMapping]) -> Dict[str, Any]:
         """Analyze the theological depth of concept mappings"""
@@ -2270,19 +4559,924 @@ class BatchAnalysisResult:
     batch_statistics: Dict[str, Any]
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
+class CrossReferenceGraph:
+    """Corpus-wide cross-reference graph in compressed sparse row (CSR) form
+
+    Nodes are passage references mapped to integer ids; each edge is typed by the
+    cross-reference relationship type and weighted by its strength. Forward and reverse
+    CSR arrays (array module, no NumPy needed) give O(degree) neighbor queries in either
+    direction. Edges are accumulated with add_results and compiled on the next query; a
+    repeated (source, target, type) edge keeps its strongest weight.
+    """
+
+    ARCHIVE_VERSION = 1
+
+    def __init__(self):
+        from array import array
+
+        self.references = []      # node id -> reference
+        self._node_ids = {}       # reference -> node id
+        self.edge_types = []      # edge type id -> relationship type
+        self._edge_type_ids = {}
+        # Edge list awaiting compilation
+        self._sources = array('i')
+        self._targets = array('i')
+        self._types = array('i')
+        self._weights = array('d')
+        self._compiled = False
+        self._forward = None      # (indptr, indices, types, weights) by source
+        self._reverse = None      # (indptr, indices, types, weights) by target
+
+    @classmethod
+    def from_results(cls, results: Iterable[MultiDimensionalResult]) -> 'CrossReferenceGraph':
+        graph = cls()
+        graph.add_results(results)
+        return graph
+
+    def _node_id(self, reference: str) -> int:
+        node_id = self._node_ids.get(reference)
+        if node_id is None:
+            node_id = self._node_ids[reference] = len(self.references)
+            self.references.append(reference)
+        return node_id
+
+    def _edge_type_id(self, relationship_type: str) -> int:
+        type_id = self._edge_type_ids.get(relationship_type)
+        if type_id is None:
+            type_id = self._edge_type_ids[relationship_type] = len(self.edge_types)
+            self.edge_types.append(relationship_type)
+        return type_id
+
+    def add_edge(self, source: str, target: str, relationship_type: str, strength: float):
+        self._sources.append(self._node_id(source))
+        self._targets.append(self._node_id(target))
+        self._types.append(self._edge_type_id(relationship_type))
+        self._weights.append(float(strength))
+        self._compiled = False
+
+    def add_links(self, source: str, links: Iterable['CrossReferenceLink']) -> int:
+        """Add CrossReferenceLinks from one passage (e.g. SharedNgramIndex.find_links); returns edges added"""
+        added = 0
+        for link in links:
+            self.add_edge(source, link.reference, link.relationship_type, link.strength)
+            added += 1
+        return added
+
+    def add_results(self, results: Iterable[MultiDimensionalResult]) -> int:
+        """Add the cross-reference findings of analysis results; returns edges added"""
+        added = 0
+        for result in results:
+            cross_reference = result.dimension_results.get(AnalysisDimension.CROSS_REFERENCE)
+            if cross_reference is None:
+                continue
+            for link in cross_reference.findings.get("cross_references", []):
+                self.add_edge(result.passage.reference, link["reference"], link["type"], link["strength"])
+                added += 1
+        return added
+
+    def _compile(self):
+        """Deduplicate the edge list and build the forward and reverse CSR arrays"""
+        if self._compiled:
+            return
+        from array import array
+
+        strongest = {}
+        for edge in zip(self._sources, self._targets, self._types, self._weights):
+            key = edge[:3]
+            if strongest.get(key, -1.0) < edge[3]:
+                strongest[key] = edge[3]
+        edges = sorted(strongest.items())
+        self._sources = array('i', (key[0] for key, _ in edges))
+        self._targets = array('i', (key[1] for key, _ in edges))
+        self._types = array('i', (key[2] for key, _ in edges))
+        self._weights = array('d', (weight for _, weight in edges))
+
+        self._forward = self._build_csr(self._sources, self._targets)
+        self._reverse = self._build_csr(self._targets, self._sources)
+        self._compiled = True
+
+    def _build_csr(self, rows, columns) -> tuple:
+        """Counting sort of the edge list by row: (indptr, indices, types, weights)"""
+        from array import array
+
+        node_count = len(self.references)
+        indptr = array('q', bytes(8 * (node_count + 1)))
+        for row in rows:
+            indptr[row + 1] += 1
+        for node in range(node_count):
+            indptr[node + 1] += indptr[node]
+
+        edge_count = len(rows)
+        indices = array('i', bytes(4 * edge_count))
+        types = array('i', bytes(4 * edge_count))
+        weights = array('d', bytes(8 * edge_count))
+        cursor = array('q', indptr[:-1])
+        for edge, row in enumerate(rows):
+            slot = cursor[row]
+            cursor[row] += 1
+            indices[slot] = columns[edge]
+            types[slot] = self._types[edge]
+            weights[slot] = self._weights[edge]
+        return indptr, indices, types, weights
+
+    @property
+    def node_count(self) -> int:
+        return len(self.references)
+
+    @property
+    def edge_count(self) -> int:
+        self._compile()
+        return len(self._sources)
+
+    def __contains__(self, reference: str) -> bool:
+        return reference in self._node_ids
+
+    def _adjacency(self, direction: str) -> List[tuple]:
+        self._compile()
+        if direction == "out":
+            return [self._forward]
+        if direction == "in":
+            return [self._reverse]
+        if direction == "both":
+            return [self._forward, self._reverse]
+        raise ValueError(f"direction must be 'out', 'in' or 'both', not {direction!r}")
+
+    def _edge_type_filter(self, edge_types: Optional[Iterable[str]]) -> Optional[set]:
+        if edge_types is None:
+            return None
+        return {self._edge_type_ids[t] for t in edge_types if t in self._edge_type_ids}
+
+    def neighbors(self, reference: str, direction: str = "out", edge_types: Optional[Iterable[str]] = None,
+                  min_weight: float = 0.0) -> List[Dict[str, Any]]:
+        """Edges of one passage, as {"reference", "type", "weight", "direction"} dicts
+
+        direction "out" lists what the passage references, "in" what references it (e.g.
+        everything linking to "Genesis 1:1"), "both" both. O(degree).
+        """
+        node = self._node_ids.get(reference)
+        if node is None:
+            return []
+        allowed = self._edge_type_filter(edge_types)
+        neighbors = []
+        for adjacency in self._adjacency(direction):
+            indptr, indices, types, weights = adjacency
+            side = "out" if adjacency is self._forward else "in"
+            for slot in range(indptr[node], indptr[node + 1]):
+                if (allowed is None or types[slot] in allowed) and weights[slot] >= min_weight:
+                    neighbors.append({
+                        "reference": self.references[indices[slot]],
+                        "type": self.edge_types[types[slot]],
+                        "weight": weights[slot],
+                        "direction": side
+                    })
+        return neighbors
+
+    def degree(self, reference: str, direction: str = "out") -> int:
+        node = self._node_ids.get(reference)
+        if node is None:
+            return 0
+        return sum(indptr[node + 1] - indptr[node] for indptr, _, _, _ in self._adjacency(direction))
+
+    def k_hop(self, reference: str, k: int = 2, direction: str = "out", edge_types: Optional[Iterable[str]] = None,
+              min_weight: float = 0.0) -> Dict[str, int]:
+        """Passages within k hops of reference, mapped to their hop distance (BFS)"""
+        start = self._node_ids.get(reference)
+        if start is None:
+            return {}
+        allowed = self._edge_type_filter(edge_types)
+        adjacencies = self._adjacency(direction)
+        distances = {start: 0}
+        frontier = [start]
+        for hop in range(1, k + 1):
+            next_frontier = []
+            for node in frontier:
+                for indptr, indices, types, weights in adjacencies:
+                    for slot in range(indptr[node], indptr[node + 1]):
+                        neighbor = indices[slot]
+                        if (neighbor not in distances and (allowed is None or types[slot] in allowed)
+                                and weights[slot] >= min_weight):
+                            distances[neighbor] = hop
+                            next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return {self.references[node]: hop for node, hop in distances.items() if node != start}
+
+    def get_statistics(self) -> Dict[str, Any]:
+        self._compile()
+        type_counts = {}
+        for type_id in self._types:
+            type_counts[self.edge_types[type_id]] = type_counts.get(self.edge_types[type_id], 0) + 1
+        indptr = self._reverse[0]
+        in_degrees = [(indptr[node + 1] - indptr[node], node) for node in range(self.node_count)]
+        return {
+            "nodes": self.node_count,
+            "edges": self.edge_count,
+            "edge_types": type_counts,
+            "most_referenced": [(self.references[node], count)
+                                for count, node in heapq.nlargest(10, in_degrees) if count > 0]
+        }
+
+    def save(self, path: str):
+        """Write the graph to a zip archive (metadata JSON plus raw edge arrays), atomically"""
+        import sys
+        import zipfile
+
+        self._compile()
+        metadata = {
+            "version": self.ARCHIVE_VERSION,
+            "framework_version": __version__,
+            "byteorder": sys.byteorder,
+            "references": self.references,
+            "edge_types": self.edge_types,
+            "edges": self.edge_count
+        }
+        temp_path = f"{path}.tmp"
+        with zipfile.ZipFile(temp_path, "w", compression=zipfile.ZIP_STORED) as archive:
+            archive.writestr("metadata.json", json.dumps(metadata))
+            for name in ("sources", "targets", "types", "weights"):
+                archive.writestr(f"{name}.bin", getattr(self, f"_{name}").tobytes())
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'CrossReferenceGraph':
+        """Read a graph written by save"""
+        import sys
+        import zipfile
+
+        graph = cls()
+        with zipfile.ZipFile(path) as archive:
+            metadata = json.loads(archive.read("metadata.json"))
+            if metadata.get("version") != cls.ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported cross-reference graph archive version: {metadata.get('version')}")
+            for name in ("sources", "targets", "types", "weights"):
+                values = getattr(graph, f"_{name}")
+                values.frombytes(archive.read(f"{name}.bin"))
+                if metadata["byteorder"] != sys.byteorder:
+                    values.byteswap()
+        graph.references = metadata["references"]
+        graph._node_ids = {reference: i for i, reference in enumerate(graph.references)}
+        graph.edge_types = metadata["edge_types"]
+        graph._edge_type_ids = {edge_type: i for i, edge_type in enumerate(graph.edge_types)}
+        # Saved edges are already deduplicated and sorted, so only the CSR arrays are rebuilt
+        graph._forward = graph._build_csr(graph._sources, graph._targets)
+        graph._reverse = graph._build_csr(graph._targets, graph._sources)
+        graph._compiled = True
+        return graph
+
+    def to_networkx(self):
+        """Export as a networkx.MultiDiGraph with "type" and "weight" edge attributes"""
+        import networkx as nx
+
+        self._compile()
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from(self.references)
+        graph.add_edges_from(
+            (self.references[source], self.references[target], {"type": self.edge_types[type_id], "weight": weight})
+            for source, target, type_id, weight in zip(self._sources, self._targets, self._types, self._weights)
+        )
+        return graph
+
+class ResultStore:
+    """Persistent content-addressed cache of per-passage, per-algorithm analysis results
+
+    Entries are keyed by passage content hash, algorithm name and plugin fingerprint, so
+    edited text or updated plugins miss instead of returning stale results. Backed by
+    SQLite (":memory:" for a process-local store); every insert that takes the store past
+    max_entries evicts the least recently used entries. Access times of hits are buffered
+    and written with the next insert, so lookups never commit. Processes sharing one file
+    each count only their own inserts between recounts (every tenth of capacity), so the
+    store can briefly exceed max_entries by what the other processes added meanwhile.
+    """
+
+    ACCESS_BUFFER_SIZE = 10000  # Buffered access times written even without an insert
+
+    def __init__(self, path: str = ":memory:", max_entries: int = 100000):
+        import sqlite3
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._writes_since_count = 0
+        self._accessed = {}  # (content_hash, algorithm, fingerprint) -> last access not yet written
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "content_hash TEXT NOT NULL, algorithm TEXT NOT NULL, fingerprint TEXT NOT NULL, "
+            "payload BLOB NOT NULL, last_access REAL NOT NULL, "
+            "PRIMARY KEY (content_hash, algorithm, fingerprint))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)")
+        self._conn.commit()
+        self._entries = self._count_entries()
+
+    def get_passage_results(self, content_hash: str, fingerprints: Dict[str, str]) -> Dict[str, Any]:
+        """Return stored results for one passage as algorithm -> value
+
+        Only entries whose fingerprint matches fingerprints[algorithm] are returned.
+        """
+        import pickle
+        import time
+
+        found = {}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT algorithm, fingerprint, payload FROM results WHERE content_hash = ?", (content_hash,)
+            ).fetchall()
+            now = time.time()
+            for algorithm, fingerprint, payload in rows:
+                if fingerprints.get(algorithm) == fingerprint:
+                    found[algorithm] = pickle.loads(payload)
+                    self._accessed[(content_hash, algorithm, fingerprint)] = now
+            if len(self._accessed) >= self.ACCESS_BUFFER_SIZE:
+                self._write_access_times()
+                self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(fingerprints) - len(found)
+        return found
+
+    def put_passage_results(self, content_hash: str, entries: Dict[str, tuple]):
+        """Store results for one passage; entries maps algorithm -> (fingerprint, value)"""
+        import pickle
+        import time
+
+        now = time.time()
+        rows = []
+        for algorithm, (fingerprint, value) in entries.items():
+            try:
+                rows.append((content_hash, algorithm, fingerprint,
+                             pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), now))
+            except Exception as e:
+                logging.debug(f"Result for {algorithm} not persisted: {e}")
+        if not rows:
+            return
+
+        with self._lock:
+            existing = set(self._conn.execute(
+                "SELECT algorithm, fingerprint FROM results WHERE content_hash = ?", (content_hash,)
+            ).fetchall())
+            self._write_access_times()
+            self._conn.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)", rows)
+            self._entries += sum(1 for row in rows if (row[1], row[2]) not in existing)
+            self._writes_since_count += len(rows)
+            # Counting is a table scan, so pick up other writers' inserts every tenth of capacity
+            if self._writes_since_count >= max(1, self.max_entries // 10):
+                self._writes_since_count = 0
+                self._entries = self._count_entries()
+            if self._entries > self.max_entries:
+                self._evict(self._entries - self.max_entries)
+            self._conn.commit()
+
+    def _count_entries(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def _write_access_times(self):
+        """Write buffered hit times so eviction sees them (caller holds the lock and commits)"""
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE results SET last_access = MAX(last_access, ?) "
+                "WHERE content_hash = ? AND algorithm = ? AND fingerprint = ?",
+                [(accessed, *key) for key, accessed in self._accessed.items()]
+            )
+            self._accessed = {}
+
+    def _evict(self, excess: int):
+        """Drop the excess least recently used entries (caller holds the lock)"""
+        deleted = self._conn.execute(
+            "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY last_access LIMIT ?)",
+            (excess,)
+        ).rowcount
+        self._entries -= max(deleted, 0)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get store size and hit/miss counters"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def clear(self):
+        """Remove all stored results"""
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+            self._accessed = {}
+            self._entries = 0
+            self._writes_since_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """Write buffered access times and close the underlying database"""
+        with self._lock:
+            self._write_access_times()
+            self._conn.commit()
+            self._conn.close()
+
+class _StringDictionary:
+    """Dictionary encoding for one string column: each distinct value is stored once
+
+    Rows hold int32 codes. A dictionary read from disk stays packed (one UTF-8 blob plus
+    offsets) and decodes values on access until something new has to be encoded.
+    """
+
+    def __init__(self):
+        self._values = []
+        self._codes = {}
+        self._blob = None
+        self._offsets = None
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1 if self._blob is not None else len(self._values)
+
+    def encode(self, value: str) -> int:
+        if self._blob is not None:
+            self._unpack()
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+        return code
+
+    def decode(self, code: int) -> str:
+        if self._blob is not None:
+            return self._blob[self._offsets[code]:self._offsets[code + 1]].decode('utf-8')
+        return self._values[code]
+
+    def _unpack(self):
+        self._values = [self.decode(code) for code in range(len(self))]
+        self._codes = {value: code for code, value in enumerate(self._values)}
+        self._blob = self._offsets = None
+
+    def pack(self) -> tuple:
+        """(UTF-8 blob, int64 end offsets with a leading 0) for persistence"""
+        from array import array
+
+        if self._blob is not None:
+            return self._blob, self._offsets
+        encoded = [value.encode('utf-8') for value in self._values]
+        offsets = array('q', [0])
+        end = 0
+        for value in encoded:
+            end += len(value)
+            offsets.append(end)
+        return b"".join(encoded), offsets
+
+    @classmethod
+    def from_packed(cls, blob: bytes, offsets) -> '_StringDictionary':
+        dictionary = cls()
+        dictionary._blob, dictionary._offsets = blob, offsets
+        return dictionary
+
+    def nbytes(self) -> int:
+        if self._blob is not None:
+            return len(self._blob) + self._offsets.itemsize * len(self._offsets)
+        return sum(len(value.encode('utf-8')) for value in self._values)
+
+class ColumnarResultStore:
+    """Compact column-oriented storage for large numbers of MultiDimensionalResults
+
+    Each result is a row. Passage fields, multiplication factor and the timestamp
+    (int64 microseconds) are row columns. Each dimension adds its confidence, its
+    insights and one typed column per findings key:
+      - int findings are int64 arrays and float findings are float64 arrays
+      - string findings (dominant_tense, context_type, ...) are dictionary-encoded
+      - nested findings (dicts, lists) and links are JSON, stored out of line
+    Every string (passage text, synthesis, insights, JSON) goes through a
+    dictionary, so repeated values are stored once. Rows are only rebuilt into
+    MultiDimensionalResult objects when accessed (store[i] or iteration), and
+    get_numeric / get_categorical / get_confidences read whole columns without
+    materializing any rows. save/load use NumPy .npz archives.
+    """
+
+    ARCHIVE_VERSION = 1
+    KIND_TYPECODES = {"i": "q", "f": "d", "s": "i"}  # int64, float64, int32 dictionary codes
+    PASSAGE_STRING_FIELDS = ("reference", "text", "version", "testament", "book")
+    EPOCH = datetime(1970, 1, 1)
+
+    def __init__(self):
+        self._rows = 0
+        self._columns = {}       # name -> row-aligned array.array
+        self._fills = {}         # name -> value for rows that do not set the column (None = repeat previous)
+        self._dictionaries = {}  # name -> _StringDictionary
+        self._insight_ids = {}   # dimension value -> insight codes of all rows, in row order
+        self._layout_cache = {}  # layout code -> [(key, kind), ...]
+
+    @classmethod
+    def from_results(cls, results: Iterable[MultiDimensionalResult]) -> 'ColumnarResultStore':
+        store = cls()
+        store.extend(results)
+        return store
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __getitem__(self, index: int) -> MultiDimensionalResult:
+        if index < 0:
+            index += self._rows
+        if not 0 <= index < self._rows:
+            raise IndexError("ColumnarResultStore index out of range")
+        return self._materialize(index)
+
+    def __iter__(self) -> Iterator[MultiDimensionalResult]:
+        for index in range(self._rows):
+            yield self._materialize(index)
+
+    # Writing
+
+    def _encode(self, name: str, value: str) -> int:
+        dictionary = self._dictionaries.get(name)
+        if dictionary is None:
+            dictionary = self._dictionaries[name] = _StringDictionary()
+        return dictionary.encode(value)
+
+    def _column(self, name: str, typecode: str, fill=0):
+        """Return a column, creating it (backfilled for earlier rows) on first use"""
+        from array import array
+
+        column = self._columns.get(name)
+        if column is None:
+            column = self._columns[name] = array(typecode, [fill if fill is not None else 0]) * self._rows
+            self._fills[name] = fill
+        return column
+
+    @staticmethod
+    def _finding_kind(value) -> str:
+        if type(value) is int and -2 ** 63 <= value < 2 ** 63:
+            return "i"
+        if type(value) is float:
+            return "f"
+        if type(value) is str:
+            return "s"
+        return "j"
+
+    def _encode_timestamp(self, timestamp: str) -> Optional[int]:
+        """Microseconds since the epoch, or None if the string would not round-trip"""
+        try:
+            parsed = datetime.fromisoformat(timestamp)
+        except (TypeError, ValueError):
+            return None
+        if parsed.tzinfo is not None or parsed.isoformat() != timestamp:
+            return None
+        return (parsed - self.EPOCH) // timedelta(microseconds=1)
+
+    def append(self, result: MultiDimensionalResult):
+        """Add one result as a new row"""
+        row = {}
+
+        def put(name, typecode, value, fill=0):
+            self._column(name, typecode, fill)
+            row[name] = value
+
+        passage = result.passage
+        for field_name in self.PASSAGE_STRING_FIELDS:
+            name = f"passage.{field_name}"
+            put(name, "i", self._encode(name, getattr(passage, field_name)))
+        put("passage.chapter", "q", passage.chapter)
+        put("passage.verse", "q", passage.verse)
+        put("multiplication_factor", "q", result.multiplication_factor)
+        put("synthesis", "i", self._encode("synthesis", result.synthesis))
+        put("dimensions", "i", self._encode("dimensions", ",".join(d.value for d in result.dimension_results)))
+        timestamp = self._encode_timestamp(result.timestamp)
+        if timestamp is not None:
+            put("timestamp", "q", timestamp)
+        else:
+            put("timestamp_text", "i", self._encode("timestamp_text", str(result.timestamp)), fill=-1)
+
+        for dimension, analysis in result.dimension_results.items():
+            prefix = dimension.value
+            put(f"{prefix}.present", "b", 1)
+            put(f"{prefix}.confidence", "d", analysis.confidence)
+
+            layout, nested = [], {}
+            for key, value in analysis.findings.items():
+                kind = self._finding_kind(value)
+                layout.append((key, kind))
+                name = f"{prefix}.findings.{key}.{kind}"
+                if kind == "j":
+                    nested[key] = value
+                elif kind == "s":
+                    put(name, "i", self._encode(name, value), fill=-1)
+                else:
+                    put(name, self.KIND_TYPECODES[kind], value)
+            put(f"{prefix}.layout", "i", self._encode("layouts", json.dumps(layout)), fill=-1)
+
+            if nested or analysis.links:
+                payload = {"findings": _encode_checkpoint_value(nested)}
+                if analysis.links:
+                    payload["links"] = [[link.reference, link.relationship, link.insight] for link in analysis.links]
+                put(f"{prefix}.nested", "i", self._encode("nested", json.dumps(payload, default=str)), fill=-1)
+
+            insight_ids = self._insight_ids.get(prefix)
+            if insight_ids is None:
+                from array import array
+                insight_ids = self._insight_ids[prefix] = array('i')
+            insight_ids.extend(self._encode("insights", insight) for insight in analysis.insights)
+            put(f"{prefix}.insight_end", "q", len(insight_ids), fill=None)
+
+        for name, column in self._columns.items():
+            value = row.get(name)
+            if value is None:
+                fill = self._fills[name]
+                value = fill if fill is not None else (column[-1] if column else 0)
+            column.append(value)
+        self._rows += 1
+
+    def extend(self, results: Iterable[MultiDimensionalResult]) -> int:
+        """Append results (any iterable, e.g. iter_analyze_batch); returns rows added"""
+        added = 0
+        for result in results:
+            self.append(result)
+            added += 1
+        return added
+
+    # Reading
+
+    def _decode(self, name: str, code: int) -> str:
+        return self._dictionaries[name].decode(code)
+
+    def _layout(self, code: int) -> list:
+        layout = self._layout_cache.get(code)
+        if layout is None:
+            layout = self._layout_cache[code] = [tuple(item) for item in json.loads(self._decode("layouts", code))]
+        return layout
+
+    def _materialize(self, index: int) -> MultiDimensionalResult:
+        columns = self._columns
+        passage_fields = {field_name: self._decode(f"passage.{field_name}", columns[f"passage.{field_name}"][index])
+                          for field_name in self.PASSAGE_STRING_FIELDS}
+        passage = BiblicalPassage(chapter=columns["passage.chapter"][index], verse=columns["passage.verse"][index],
+                                  **passage_fields)
+
+        dimension_results = {}
+        dimensions = self._decode("dimensions", columns["dimensions"][index])
+        for prefix in dimensions.split(",") if dimensions else []:
+            dimension = AnalysisDimension(prefix)
+            nested_column = columns.get(f"{prefix}.nested")
+            payload = {}
+            if nested_column is not None and nested_column[index] >= 0:
+                payload = json.loads(self._decode("nested", nested_column[index]))
+            nested = _decode_checkpoint_value(payload.get("findings", {}))
+
+            findings = {}
+            for key, kind in self._layout(columns[f"{prefix}.layout"][index]):
+                if kind == "j":
+                    findings[key] = nested[key]
+                    continue
+                name = f"{prefix}.findings.{key}.{kind}"
+                value = columns[name][index]
+                findings[key] = self._decode(name, value) if kind == "s" else value
+
+            ends = columns[f"{prefix}.insight_end"]
+            start = ends[index - 1] if index else 0
+            insights = [self._decode("insights", code) for code in self._insight_ids[prefix][start:ends[index]]]
+            dimension_results[dimension] = DimensionalAnalysis(
+                dimension=dimension,
+                findings=findings,
+                insights=insights,
+                confidence=columns[f"{prefix}.confidence"][index],
+                links=[LinkedPassage(*link) for link in payload.get("links", [])]
+            )
+
+        timestamp_text = columns.get("timestamp_text")
+        if timestamp_text is not None and timestamp_text[index] >= 0:
+            timestamp = self._decode("timestamp_text", timestamp_text[index])
+        else:
+            timestamp = (self.EPOCH + timedelta(microseconds=columns["timestamp"][index])).isoformat()
+
+        return MultiDimensionalResult(
+            passage=passage,
+            dimension_results=dimension_results,
+            synthesis=self._decode("synthesis", columns["synthesis"][index]),
+            multiplication_factor=columns["multiplication_factor"][index],
+            timestamp=timestamp
+        )
+
+    def _key_kinds(self, prefix: str, key: str) -> List[Optional[str]]:
+        """Per row: the kind key has in this dimension's findings (None where absent)"""
+        layouts = self._columns.get(f"{prefix}.layout")
+        if layouts is None:
+            return [None] * self._rows
+        by_code = {}
+        kinds = []
+        for code in layouts:
+            if code not in by_code:
+                by_code[code] = dict(self._layout(code)).get(key) if code >= 0 else None
+            kinds.append(by_code[code])
+        return kinds
+
+    def get_numeric(self, dimension: AnalysisDimension, key: str):
+        """One numeric findings key for every row as float64, NaN where absent
+
+        A NumPy array when NumPy is installed, otherwise a list.
+        """
+        prefix = dimension.value
+        columns = {kind: self._columns.get(f"{prefix}.findings.{key}.{kind}") for kind in ("i", "f")}
+        layouts = self._columns.get(f"{prefix}.layout")
+        if NUMPY_AVAILABLE:
+            values = np.full(self._rows, np.nan)
+            if layouts is None:
+                return values
+            codes = np.frombuffer(layouts, dtype=np.dtype(layouts.typecode))
+            for kind, column in columns.items():
+                if column is None:
+                    continue
+                matching = [code for code in np.unique(codes).tolist()
+                            if code >= 0 and dict(self._layout(code)).get(key) == kind]
+                rows = np.isin(codes, matching)
+                values[rows] = np.frombuffer(column, dtype=np.dtype(column.typecode))[rows]
+            return values
+        return [float(columns[kind][index]) if kind in columns else float('nan')
+                for index, kind in enumerate(self._key_kinds(prefix, key))]
+
+    def get_categorical(self, dimension: AnalysisDimension, key: str) -> List[Optional[str]]:
+        """One string findings key (e.g. dominant_tense) for every row, None where absent"""
+        prefix = dimension.value
+        name = f"{prefix}.findings.{key}.s"
+        column = self._columns.get(name)
+        decoded = {}
+        values = []
+        for index, kind in enumerate(self._key_kinds(prefix, key)):
+            if kind != "s":
+                values.append(None)
+                continue
+            code = column[index]
+            if code not in decoded:
+                decoded[code] = self._decode(name, code)
+            values.append(decoded[code])
+        return values
+
+    def get_confidences(self, dimension: AnalysisDimension):
+        """Confidence of one dimension for every row, NaN where the dimension is absent"""
+        present = self._columns.get(f"{dimension.value}.present")
+        confidences = self._columns.get(f"{dimension.value}.confidence")
+        if present is None:
+            return np.full(self._rows, np.nan) if NUMPY_AVAILABLE else [float('nan')] * self._rows
+        if NUMPY_AVAILABLE:
+            return np.where(np.frombuffer(present, dtype=np.int8) > 0, np.frombuffer(confidences, dtype=np.float64), np.nan)
+        return [confidence if flag else float('nan') for flag, confidence in zip(present, confidences)]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Row count and bytes held by columns, string dictionaries and insight codes"""
+        column_bytes = sum(column.itemsize * len(column) for column in self._columns.values())
+        insight_bytes = sum(ids.itemsize * len(ids) for ids in self._insight_ids.values())
+        dictionary_bytes = {name: dictionary.nbytes() for name, dictionary in self._dictionaries.items()}
+        return {
+            "rows": self._rows,
+            "columns": len(self._columns),
+            "column_bytes": column_bytes,
+            "insight_code_bytes": insight_bytes,
+            "dictionary_bytes": sum(dictionary_bytes.values()),
+            "distinct_insights": len(self._dictionaries["insights"]) if "insights" in self._dictionaries else 0,
+            "total_bytes": column_bytes + insight_bytes + sum(dictionary_bytes.values())
+        }
+
+    # Persistence
+
+    def save(self, path: str):
+        """Write the store to a NumPy .npz archive, atomically"""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required to save a ColumnarResultStore")
+
+        def as_numpy(values):
+            return np.frombuffer(values, dtype=np.dtype(values.typecode)) if len(values) else \
+                np.empty(0, dtype=np.dtype(values.typecode))
+
+        metadata = {
+            "version": self.ARCHIVE_VERSION,
+            "framework_version": __version__,
+            "rows": self._rows,
+            "columns": [[name, column.typecode, self._fills[name]] for name, column in self._columns.items()],
+            "dictionaries": list(self._dictionaries),
+            "insight_dimensions": list(self._insight_ids)
+        }
+        arrays = {"metadata": np.frombuffer(json.dumps(metadata).encode('utf-8'), dtype=np.uint8)}
+        for name, column in self._columns.items():
+            arrays[f"column:{name}"] = as_numpy(column)
+        for name, dictionary in self._dictionaries.items():
+            blob, offsets = dictionary.pack()
+            arrays[f"blob:{name}"] = np.frombuffer(blob, dtype=np.uint8) if blob else np.empty(0, dtype=np.uint8)
+            arrays[f"offsets:{name}"] = as_numpy(offsets)
+        for prefix, ids in self._insight_ids.items():
+            arrays[f"insights:{prefix}"] = as_numpy(ids)
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'ColumnarResultStore':
+        """Read a store written by save; rows are materialized only when accessed"""
+        from array import array
+
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required to load a ColumnarResultStore")
+
+        def as_array(values, typecode):
+            column = array(typecode)
+            column.frombytes(np.ascontiguousarray(values, dtype=np.dtype(typecode)).tobytes())
+            return column
+
+        store = cls()
+        with np.load(path) as archive:
+            metadata = json.loads(archive["metadata"].tobytes().decode('utf-8'))
+            if metadata.get("version") != cls.ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported columnar result archive version: {metadata.get('version')}")
+            store._rows = metadata["rows"]
+            for name, typecode, fill in metadata["columns"]:
+                store._columns[name] = as_array(archive[f"column:{name}"], typecode)
+                store._fills[name] = fill
+            for name in metadata["dictionaries"]:
+                store._dictionaries[name] = _StringDictionary.from_packed(
+                    archive[f"blob:{name}"].tobytes(), as_array(archive[f"offsets:{name}"], "q"))
+            for prefix in metadata["insight_dimensions"]:
+                store._insight_ids[prefix] = as_array(archive[f"insights:{prefix}"], "i")
+        return store
+
+# Process-pool worker state, set once per worker by _init_batch_worker. The corpus and
+# registered plugins arrive as initargs: forked workers inherit them copy-on-write with
+# the Process object, other start methods receive them pickled once per worker, never per task.
+_WORKER_FRAMEWORK = None
+_WORKER_PASSAGES = None
+_WORKER_PRECOMPUTED = None
+_WORKER_ANALYZER = None
+
+def _init_batch_worker(framework: AlgorithmicFramework, passages: List[BiblicalPassage],
+                       precomputed: Dict[str, Dict] = None):
+    """Process-pool initializer: set up plugins, corpus and NLP model once per worker"""
+    global _WORKER_FRAMEWORK, _WORKER_PASSAGES, _WORKER_PRECOMPUTED, _WORKER_ANALYZER
+    _WORKER_FRAMEWORK = framework
+    _WORKER_PASSAGES = passages
+    _WORKER_PRECOMPUTED = precomputed
+    _WORKER_ANALYZER = MultiDimensionalAnalyzer(_WORKER_FRAMEWORK)
+    _WORKER_FRAMEWORK.metrics.reset_after_fork()  # Counts inherited from the parent are not this worker's
+    if SPACY_AVAILABLE and nlp is not None:
+        nlp("In the beginning.")  # Warm the pipeline before the first real task
+
+def _analyze_batch_chunk(start: int, end: int) -> tuple:
+    """Analyze the worker corpus slice [start, end) and return (payloads, metrics)
+
+    Payloads carry only the analysis output; the parent re-attaches its own passage
+    objects, so cached spaCy docs never cross the process boundary. metrics holds the
+    worker's PluginMetrics for this chunk, to be merged by the parent.
+    """
+    payloads = []
+    for index in range(start, end):
+        try:
+            passage = _WORKER_PASSAGES[index]
+            precomputed = _WORKER_PRECOMPUTED.get(passage.get_content_hash()) if _WORKER_PRECOMPUTED else None
+            result = _WORKER_ANALYZER.analyze(passage, precomputed)
+            payloads.append((index, result.dimension_results, result.synthesis, result.timestamp, None))
+        except Exception as e:
+            payloads.append((index, None, None, None, str(e)))
+    return payloads, _WORKER_FRAMEWORK.metrics.drain()
+
 class BatchAnalyzer:
     """Efficient batch processing for multiple passages with parallel capabilities"""
 
-    def __init__(self, framework: AlgorithmicFramework, max_workers: int = 4):
+    def __init__(self, framework: AlgorithmicFramework, max_workers: int = 4, backend: str = "thread",
+                 chunk_size: int = None, start_method: str = None, progress_callback=None,
+                 error_callback=None, result_store: ResultStore = None,
+                 async_context: 'AsyncExecutionContext' = None):
         self.framework = framework
+        self.progress_callback = progress_callback  # (completed, total, passage); no console I/O by default
+        self.error_callback = error_callback or _log_analysis_error  # (passage, exception)
         self.max_workers = max_workers
-        self.batch_cache = {}  # Cache for batch results
+        self.backend = backend  # "thread" or "process" (pure-Python algorithms are GIL-bound)
+        self.chunk_size = chunk_size  # Passages per process task; None = auto
+        self.start_method = start_method  # multiprocessing start method; None = fork where available
+        # Per-passage/per-algorithm results shared by overlapping batches; pass a file-backed
+        # ResultStore to keep them across restarts
+        self.result_store = result_store if result_store is not None else ResultStore()
+        # Executor and concurrency limit for analyze_batch_async; share one context with the
+        # interactive MultiDimensionalAnalyzer so batch chunks and requests take turns
+        self.async_context = async_context or AsyncExecutionContext()
 
     def analyze_batch(self, passages: List[BiblicalPassage], algorithms: List[str] = None,
-                     use_parallel: bool = True) -> BatchAnalysisResult:
-        """Analyze multiple passages in batch with optional parallel processing"""
+                     use_parallel: bool = True, checkpoint_path: str = None, checkpoint_every: int = 50,
+                     resume: bool = True) -> BatchAnalysisResult:
+        """Analyze multiple passages in batch with optional parallel processing
+
+        With checkpoint_path every completed result is appended to a JSON Lines journal,
+        fsynced every checkpoint_every results. If the journal already exists and resume is
+        True, passages recorded there with unchanged text and plugin fingerprints are restored
+        instead of analyzed, so an interrupted run continues where it stopped (see also
+        load_checkpoint).
+        """
         import time
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if not passages:
             return BatchAnalysisResult(
@@ -2294,27 +5488,28 @@ class BatchAnalyzer:
                 batch_statistics={}
             )
 
-        # Check cache first
-        cache_key = self._generate_cache_key(passages, algorithms)
-        if cache_key in self.batch_cache:
-            cached_result = self.batch_cache[cache_key]
-            # Update timestamp but keep other data
-            cached_result.timestamp = datetime.now().isoformat()
-            return cached_result
-
-        results = []
-
-        if use_parallel and len(passages) > 1:
-            results = self._analyze_parallel(passages, algorithms)
+        if checkpoint_path:
+            results, store_hits, restored = self._analyze_with_checkpoint(
+                passages, use_parallel, checkpoint_path, checkpoint_every, resume)
         else:
-            results = self._analyze_sequential(passages, algorithms)
+            (results, store_hits), restored = self._analyze_with_store(passages, use_parallel), 0
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
+        parallel_backend = self.backend if use_parallel and len(passages) > 1 else None
+        return self._build_batch_result(passages, results, processing_time, algorithms, parallel_backend,
+                                        store_hits, restored)
 
-        # Calculate batch statistics
-        total_insights = sum(r.get_total_insights() for r in results)
-        total_findings = sum(r.get_total_findings() for r in results)
-        avg_confidence = sum(r.get_average_confidence() for r in results) / len(results) if results else 0.0
+    def _build_batch_result(self, passages: List[BiblicalPassage], results: List[MultiDimensionalResult],
+                            processing_time: float, algorithms: List[str], parallel_backend: Optional[str],
+                            store_hits: int, restored: int = 0) -> BatchAnalysisResult:
+        """Compute batch statistics and wrap results in a BatchAnalysisResult"""
+        self.framework.metrics.record("batch_analysis", processing_time)
+
+        # Calculate batch statistics in one pass
+        aggregate = ResultAggregator.from_results(results)
+        total_insights = aggregate.insights.total
+        total_findings = aggregate.findings.total
+        avg_confidence = aggregate.confidence.mean
 
         batch_statistics = {
             "total_passages": len(passages),
@@ -2325,11 +5520,16 @@ class BatchAnalyzer:
             "average_confidence": avg_confidence,
             "processing_time_seconds": processing_time,
             "processing_rate": len(passages) / processing_time if processing_time > 0 else 0,
-            "parallel_processing": use_parallel and len(passages) > 1,
-            "algorithms_used": algorithms or list(self.framework.algorithms.keys())
+            "parallel_processing": parallel_backend is not None,
+            "parallel_backend": parallel_backend,
+            "algorithms_used": algorithms or list(self.framework.algorithms.keys()),
+            "batch_key": self._generate_cache_key(passages, algorithms),
+            "store_hits": store_hits,
+            "passages_computed": len(passages) - store_hits - restored,
+            "restored_from_checkpoint": restored
         }
 
-        batch_result = BatchAnalysisResult(
+        return BatchAnalysisResult(
             passages_analyzed=len(passages),
             total_insights=total_insights,
             average_confidence=avg_confidence,
@@ -2338,66 +5538,262 @@ class BatchAnalyzer:
             batch_statistics=batch_statistics
         )
 
-        # Cache the result
-        self.batch_cache[cache_key] = batch_result
+    async def analyze_batch_async(self, passages: List[BiblicalPassage], algorithms: List[str] = None,
+                                  chunk_size: int = 32, timeout: float = None) -> BatchAnalysisResult:
+        """Async analyze_batch for event-loop callers
+
+        Passages are analyzed in chunks on the async context's executor, taking one
+        concurrency slot per chunk, one chunk at a time, so interactive analyze_async calls
+        sharing the context are served between chunks. timeout is a deadline for the whole batch
+        (asyncio.TimeoutError); on cancellation or timeout no further chunks start.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        start_time = time.perf_counter()
+        deadline = loop.time() + timeout if timeout is not None else None
+
+        results, store_hits = [], 0
+        for start in range(0, len(passages), chunk_size):
+            remaining = deadline - loop.time() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                raise asyncio.TimeoutError(f"Batch deadline passed after {start} of {len(passages)} passages")
+            chunk_results, chunk_hits = await self.async_context.run(
+                self._analyze_with_store, passages[start:start + chunk_size], False, timeout=remaining)
+            results.extend(chunk_results)
+            store_hits += chunk_hits
+
+        # Chunks run one after another, so the batch is reported as sequential
+        return self._build_batch_result(passages, results, time.perf_counter() - start_time, algorithms, None,
+                                        store_hits)
+
+    def get_plugin_fingerprints(self) -> Dict[str, str]:
+        """algorithm -> fingerprint for every dimension algorithm currently registered"""
+        return {
+            algo_name: self.framework.get_plugin_fingerprint(algo_name)
+            for algo_name in MultiDimensionalAnalyzer(self.framework).dimension_algorithms.values()
+            if algo_name in self.framework.algorithms
+        }
 
-        return batch_result
+    def get_analysis_fingerprint(self) -> str:
+        """One hash over get_plugin_fingerprints(); changes whenever any dimension plugin does"""
+        return hashlib.sha256(json.dumps(sorted(self.get_plugin_fingerprints().items())).encode('utf-8')).hexdigest()
+
+    def _analyze_with_checkpoint(self, passages: List[BiblicalPassage], use_parallel: bool,
+                                 checkpoint_path: str, checkpoint_every: int, resume: bool) -> tuple:
+        """Run _analyze_with_store while journaling results; returns (results, store hits, restored)"""
+        encode = _get_jsonl_encoder()
+        restored = {}  # (reference, version) -> checkpoint record
+        analysis_fingerprint = self.get_analysis_fingerprint()
+
+        if resume and os.path.exists(checkpoint_path) and _truncate_partial_jsonl_line(checkpoint_path) > 0:
+            wanted = {(p.reference, p.version): p.get_content_hash() for p in passages}
+            for record in self.framework.read_multidimensional_jsonl(checkpoint_path):
+                key = (record["passage"]["reference"], record["passage"]["version"])
+                # Records from changed text or changed plugins are analyzed again
+                if (wanted.get(key) == record.get("content_hash")
+                        and record.get("analysis_fingerprint") == analysis_fingerprint):
+                    restored[key] = record
+            journal = open(checkpoint_path, 'ab')
+        else:
+            journal = open(checkpoint_path, 'wb')
+            journal.write(encode({
+                "record_type": "header",
+                "checkpoint": True,
+                "version": __version__,
+                "total_passages": len(passages),
+                "created": datetime.now().isoformat()
+            }))
+
+        written = 0
+
+        def checkpoint(result: MultiDimensionalResult):
+            nonlocal written
+            record = self.framework._serialize_checkpoint_record(result)
+            record["analysis_fingerprint"] = analysis_fingerprint
+            journal.write(encode(record))
+            written += 1
+            if checkpoint_every and written % checkpoint_every == 0:
+                journal.flush()
+                os.fsync(journal.fileno())
 
-    def _analyze_sequential(self, passages: List[BiblicalPassage], algorithms: List[str] = None) -> List[MultiDimensionalResult]:
-        """Sequential analysis of passages"""
+        try:
+            pending = [p for p in passages if (p.reference, p.version) not in restored]
+            self.framework.metrics.record_cache("checkpoint", hits=len(passages) - len(pending), misses=len(pending))
+            computed, store_hits = self._analyze_with_store(pending, use_parallel, on_result=checkpoint)
+        finally:
+            journal.flush()
+            os.fsync(journal.fileno())
+            journal.close()
+
+        computed = {id(r.passage): r for r in computed}
         results = []
+        for passage in passages:
+            record = restored.get((passage.reference, passage.version))
+            if record is not None:
+                result = self.framework._deserialize_checkpoint_record(record)
+                result.passage = passage  # Same content hash; keep the caller's object
+                results.append(result)
+            elif id(passage) in computed:
+                results.append(computed[id(passage)])
+        return results, store_hits, len(passages) - len(pending)
+
+    def load_checkpoint(self, checkpoint_path: str) -> List[MultiDimensionalResult]:
+        """Rebuild the results recorded in a checkpoint journal, without needing the corpus"""
+        records = {}
+        for record in self.framework.read_multidimensional_jsonl(checkpoint_path):
+            records[(record["passage"]["reference"], record["passage"]["version"])] = record
+        return [self.framework._deserialize_checkpoint_record(record) for record in records.values()]
+
+    def _analyze_with_store(self, passages: List[BiblicalPassage], use_parallel: bool, on_result=None) -> tuple:
+        """Assemble batch results from result store hits, computing only what is missing
+
+        Returns (results in input order, number of passages served entirely from the store).
+        on_result, if given, is called with each result as soon as it is available.
+        """
         analyzer = MultiDimensionalAnalyzer(self.framework)
+        fingerprints = self.get_plugin_fingerprints()
+        dimensions = {algo_name: dimension for dimension, algo_name in analyzer.dimension_algorithms.items()}
+
+        assembled = {}    # index -> result assembled entirely from the store
+        precomputed = {}  # content hash -> partial dimension results
+        to_compute = []
+        lookups_hit = 0
+        for index, passage in enumerate(passages):
+            stored = self.result_store.get_passage_results(passage.get_content_hash(), fingerprints)
+            lookups_hit += len(stored)
+            dimension_results = {dimensions[algo_name]: value for algo_name, value in stored.items()}
+            if len(stored) == len(fingerprints):
+                # Keep the analyzer's dimension order so synthesis text matches a fresh run
+                dimension_results = {d: dimension_results[d] for d in analyzer.dimension_algorithms
+                                     if d in dimension_results}
+                assembled[index] = MultiDimensionalResult(
+                    passage=passage,
+                    dimension_results=dimension_results,
+                    synthesis=analyzer._generate_synthesis(passage, dimension_results),
+                    multiplication_factor=len(dimension_results)
+                )
+                if on_result:
+                    on_result(assembled[index])
+            else:
+                if dimension_results:
+                    precomputed[passage.get_content_hash()] = dimension_results
+                to_compute.append(passage)
+
+        self.framework.metrics.record_cache("result_store", hits=lookups_hit,
+                                            misses=len(passages) * len(fingerprints) - lookups_hit)
+
+        computed = {}  # id(passage) -> result; failed passages are reported and left out
+        if to_compute:
+            parallel = use_parallel and len(to_compute) > 1
+            for result in self.iter_analyze_batch(to_compute, use_parallel=parallel, precomputed=precomputed):
+                computed[id(result.passage)] = result
+                if on_result:
+                    on_result(result)
+                content_hash = result.passage.get_content_hash()
+                self.result_store.put_passage_results(content_hash, {
+                    analyzer.dimension_algorithms[dimension]: (fingerprints[analyzer.dimension_algorithms[dimension]], value)
+                    for dimension, value in result.dimension_results.items()
+                    if analyzer.dimension_algorithms[dimension] in fingerprints
+                })
 
-        for i, passage in enumerate(passages):
-            print(f"Analyzing passage {i+1}/{len(passages)}: {passage.reference}")
-            try:
-                result = analyzer.analyze(passage)
+        results = []
+        for index, passage in enumerate(passages):
+            result = assembled.get(index) or computed.get(id(passage))
+            if result is not None:
                 results.append(result)
-            except Exception as e:
-                print(f"Error analyzing {passage.reference}: {e}")
-                continue
+        return results, len(assembled)
 
-        return results
+    def _analyze_sequential(self, passages: List[BiblicalPassage], algorithms: List[str] = None) -> List[MultiDimensionalResult]:
+        """Sequential analysis of passages"""
+        return list(self.iter_analyze_batch(passages, use_parallel=False))
+
+    def iter_analyze_batch(self, passages: List[BiblicalPassage], use_parallel: bool = True,
+                           ordered: bool = True, precomputed: Dict[str, Dict] = None) -> Iterator[MultiDimensionalResult]:
+        """Stream batch results with bounded memory instead of accumulating a list"""
+        if use_parallel and self.backend == "process":
+            yield from self._iter_process_pool(passages, ordered, precomputed)
+        else:
+            yield from self.framework.iter_analyze_corpus(
+                passages, ordered=ordered, max_workers=self.max_workers if use_parallel else 1,
+                progress_callback=self.progress_callback, error_callback=self.error_callback,
+                precomputed=precomputed
+            )
 
     def _analyze_parallel(self, passages: List[BiblicalPassage], algorithms: List[str] = None) -> List[MultiDimensionalResult]:
-        """Parallel analysis using threading"""
+        """Parallel analysis using the configured backend"""
+        if self.backend == "process":
+            return self._analyze_process_pool(passages)
+        return self._analyze_threaded(passages, algorithms)
+
+    def _analyze_process_pool(self, passages: List[BiblicalPassage]) -> List[MultiDimensionalResult]:
+        """Parallel analysis across processes with chunked task submission"""
+        return list(self._iter_process_pool(passages))
+
+    def _iter_process_pool(self, passages: List[BiblicalPassage], ordered: bool = True,
+                           precomputed: Dict[str, Dict] = None) -> Iterator[MultiDimensionalResult]:
+        """Yield results from a process pool, keeping at most two chunks per worker in flight"""
         import concurrent.futures
-        import threading
-
-        results = []
-        lock = threading.Lock()
-
-        def analyze_single(passage):
-            analyzer = MultiDimensionalAnalyzer(self.framework)
-            try:
-                result = analyzer.analyze(passage)
-                with lock:
-                    print(f"Completed analysis of {passage.reference}")
-                return result
-            except Exception as e:
-                with lock:
-                    print(f"Error analyzing {passage.reference}: {e}")
-                return None
-
-        # Use ThreadPoolExecutor for I/O bound tasks
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_passage = {executor.submit(analyze_single, passage): passage for passage in passages}
-            for future in concurrent.futures.as_completed(future_to_passage):
-                result = future.result()
-                if result:
-                    results.append(result)
-
-        # Sort results back to original order
-        passage_order = {p.reference: i for i, p in enumerate(passages)}
-        results.sort(key=lambda r: passage_order.get(r.passage.reference, 999))
+        import multiprocessing
+
+        start_method = self.start_method
+        if start_method is None:
+            start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        context = multiprocessing.get_context(start_method)
+
+        chunk_size = self.chunk_size or max(1, math.ceil(len(passages) / (self.max_workers * 4)))
+        chunk_starts = iter(range(0, len(passages), chunk_size))
+        max_pending = self.max_workers * 2
+        completed = 0
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context,
+                                                    initializer=_init_batch_worker,
+                                                    initargs=(self.framework, passages, precomputed)) as executor:
+            pending = {}  # future -> chunk start, in submission order
+            while True:
+                while len(pending) < max_pending:
+                    start = next(chunk_starts, None)
+                    if start is None:
+                        break
+                    future = executor.submit(_analyze_batch_chunk, start, min(start + chunk_size, len(passages)))
+                    pending[future] = start
+                if not pending:
+                    break
+
+                if ordered:
+                    future = next(iter(pending))
+                else:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    future = next(iter(done))
+                del pending[future]
+
+                payloads, worker_metrics = future.result()
+                self.framework.metrics.merge(worker_metrics)
+                for index, dimension_results, synthesis, timestamp, error in payloads:
+                    passage = passages[index]
+                    completed += 1
+                    if self.progress_callback:
+                        self.progress_callback(completed, len(passages), passage)
+                    if error is not None:
+                        self.error_callback(passage, RuntimeError(error))
+                        continue
+                    yield MultiDimensionalResult(
+                        passage=passage,
+                        dimension_results=dimension_results,
+                        synthesis=synthesis,
+                        multiplication_factor=len(dimension_results),
+                        timestamp=timestamp
+                    )
 
-        return results
+    def _analyze_threaded(self, passages: List[BiblicalPassage], algorithms: List[str] = None) -> List[MultiDimensionalResult]:
+        """Parallel analysis using threading, results kept in input order"""
+        return list(self.iter_analyze_batch(passages, use_parallel=True))
 
     def _generate_cache_key(self, passages: List[BiblicalPassage], algorithms: List[str] = None) -> str:
-        """Generate a cache key for the batch"""
-        passage_refs = sorted([p.reference for p in passages])
+        """Generate a stable key identifying the batch contents (not Python's salted hash())"""
+        digest = hashlib.sha256("\n".join(sorted(p.get_content_hash() for p in passages)).encode('utf-8'))
         algo_key = "_".join(sorted(algorithms)) if algorithms else "all"
-        return f"batch_{len(passages)}_{hash('_'.join(passage_refs))}_{algo_key}"
+        return f"batch_{len(passages)}_{digest.hexdigest()[:16]}_{algo_key}"
 
     def analyze_corpus_by_book(self, corpus: List[BiblicalPassage]) -> Dict[str, BatchAnalysisResult]:
         """Analyze corpus grouped by book"""
@@ -2431,43 +5827,145 @@ class BatchAnalyzer:
 
         return testament_results
 
-    def find_patterns_across_batch(self, batch_result: BatchAnalysisResult) -> Dict[str, Any]:
-        """Find patterns and themes across the entire batch"""
-        if not batch_result.results:
-            return {}
-
-        # Aggregate themes across all passages
-        all_themes = {}
-        all_confidences = []
+    def analyze_corpus_incremental(self, corpus: List[BiblicalPassage], manifest_path: str,
+                                   group_by: str = "book") -> Dict[str, Any]:
+        """Re-analyze only what changed since the run recorded in manifest_path
+
+        Passages and plugins are fingerprinted and compared against the previous manifest.
+        New or edited passages are recomputed, as is every passage for a changed plugin (only
+        that plugin's dimension); everything else is assembled from the result store. Groups
+        (books or testaments) are merged back together and find_patterns_across_batch
+        aggregates are recomputed for changed groups and the whole corpus. Use a file-backed
+        result_store, otherwise nothing survives between runs to reuse.
+        """
+        if group_by not in ("book", "testament"):
+            raise ValueError(f"group_by must be 'book' or 'testament', got {group_by!r}")
+        if self.result_store.path == ":memory:":
+            logging.warning("Incremental analysis with an in-memory result store cannot reuse earlier runs")
+
+        previous = {}
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+        if previous.get("group_by", group_by) != group_by:
+            previous = {}  # Groups are not comparable; treat as a first run
 
-        for result in batch_result.results:
-            thematic_analysis = result.dimension_results.get(AnalysisDimension.THEMATIC)
-            if thematic_analysis:
-                themes = thematic_analysis.findings.get("detected_themes", {})
-                for theme, matches in themes.items():
-                    if theme not in all_themes:
-                        all_themes[theme] = []
-                    all_themes[theme].extend(matches)
+        analyzer = MultiDimensionalAnalyzer(self.framework)
+        plugins = {
+            algo_name: self.framework.get_plugin_fingerprint(algo_name)
+            for algo_name in analyzer.dimension_algorithms.values()
+            if algo_name in self.framework.algorithms
+        }
+        previous_plugins = previous.get("plugins", {})
+        changed_plugins = sorted(name for name, fingerprint in plugins.items()
+                                 if previous_plugins.get(name) != fingerprint)
+
+        previous_passages = previous.get("passages", {})
+        passage_hashes = {}
+        groups = {}
+        new, changed, dirty_groups = [], [], set()
+        for passage in corpus:
+            key = f"{passage.reference}|{passage.version}"
+            group = passage.book if group_by == "book" else passage.testament
+            passage_hashes[key] = passage.get_content_hash()
+            groups.setdefault(group, []).append(passage)
+            if key not in previous_passages:
+                new.append(passage.reference)
+                dirty_groups.add(group)
+            elif previous_passages[key] != passage_hashes[key]:
+                changed.append(passage.reference)
+                dirty_groups.add(group)
+        removed = sorted(key for key in previous_passages if key not in passage_hashes)
+
+        previous_groups = previous.get("groups", {})
+        for group, passages in groups.items():
+            # Removed passages or a different membership also invalidate group aggregates
+            if changed_plugins or previous_groups.get(group, {}).get("passages") != len(passages):
+                dirty_groups.add(group)
+
+        group_results = {}
+        group_aggregates = {}
+        group_manifest = {}
+        for group, passages in groups.items():
+            if group in dirty_groups:
+                logging.info(f"Re-analyzing {group_by} {group} ({len(passages)} passages)")
+            group_results[group] = self.analyze_batch(passages)
+            group_aggregates[group] = ResultAggregator.from_results(group_results[group].results)
+            if group in dirty_groups or "patterns" not in previous_groups.get(group, {}):
+                patterns = self.find_patterns_across_batch(group_aggregates[group])
+            else:
+                patterns = dict(previous_groups[group]["patterns"])
+                if "dominant_themes" in patterns:  # JSON turned the (theme, count) tuples into lists
+                    patterns["dominant_themes"] = [tuple(item) for item in patterns["dominant_themes"]]
+            group_manifest[group] = {"passages": len(passages), "patterns": patterns}
+
+        merged_results = [r for result in group_results.values() for r in result.results]
+        merged_aggregate = ResultAggregator()
+        for aggregate in group_aggregates.values():
+            merged_aggregate.merge(aggregate)
+        merged = BatchAnalysisResult(
+            passages_analyzed=len(merged_results),
+            total_insights=sum(result.total_insights for result in group_results.values()),
+            average_confidence=merged_aggregate.confidence.mean,
+            processing_time=sum(result.processing_time for result in group_results.values()),
+            results=merged_results,
+            batch_statistics={
+                "groups": len(group_results),
+                "passages_computed": sum(result.batch_statistics.get("passages_computed", 0)
+                                         for result in group_results.values())
+            }
+        )
 
-            all_confidences.append(result.get_average_confidence())
+        changes = {
+            "new_passages": new,
+            "changed_passages": changed,
+            "removed_passages": removed,
+            "changed_plugins": changed_plugins,
+            "reanalyzed_groups": sorted(dirty_groups),
+            "passages_computed": merged.batch_statistics["passages_computed"]
+        }
 
-        # Find most common themes
-        theme_frequencies = {theme: len(matches) for theme, matches in all_themes.items()}
-        dominant_themes = sorted(theme_frequencies.items(), key=lambda x: x[1], reverse=True)[:5]
+        manifest = {
+            "version": __version__,
+            "timestamp": datetime.now().isoformat(),
+            "group_by": group_by,
+            "result_store": self.result_store.path,
+            "plugins": plugins,
+            "passages": passage_hashes,
+            "groups": group_manifest
+        }
+        temp_path = f"{manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, default=str)
+        os.replace(temp_path, manifest_path)
 
-        # Confidence distribution
-        confidence_distribution = {
-            "high": len([c for c in all_confidences if c >= 0.8]),
-            "medium": len([c for c in all_confidences if 0.5 <= c < 0.8]),
-            "low": len([c for c in all_confidences if c < 0.5])
+        return {
+            "groups": group_results,
+            "merged": merged,
+            "patterns": self.find_patterns_across_batch(merged_aggregate),
+            "group_patterns": {group: entry["patterns"] for group, entry in group_manifest.items()},
+            "changes": changes
         }
 
+    def find_patterns_across_batch(self, batch_result, top_k: int = 5) -> Dict[str, Any]:
+        """Find patterns and themes across the entire batch
+
+        batch_result may be a BatchAnalysisResult, any iterable of results (e.g.
+        iter_analyze_batch) or a ResultAggregator merged from several workers or shards.
+        Theme counts are exact unless there are more distinct themes than the
+        aggregator's theme_capacity.
+        """
+        aggregate = ResultAggregator.of(batch_result)
+        if not aggregate.count:
+            return {}
+
+        confidence_counts = aggregate.confidence_histogram.get_counts()
         return {
-            "dominant_themes": dominant_themes,
-            "theme_frequencies": theme_frequencies,
-            "confidence_distribution": confidence_distribution,
-            "average_batch_confidence": sum(all_confidences) / len(all_confidences) if all_confidences else 0.0,
-            "total_unique_themes": len(all_themes)
+            "dominant_themes": aggregate.themes.top(top_k),
+            "theme_frequencies": dict(aggregate.themes.counts),
+            "confidence_distribution": {level: confidence_counts[level] for level in ("high", "medium", "low")},
+            "average_batch_confidence": aggregate.confidence.mean,
+            "total_unique_themes": len(aggregate.themes.counts)
         }
 
     def export_batch_results(self, batch_result: BatchAnalysisResult, filename: str):
@@ -2503,9 +6001,143 @@ class BatchAnalyzer:
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2)
 
+    def export_batch_results_jsonl(self, results, filename: str, **options) -> int:
+        """Stream batch results to JSON Lines
+
+        Accepts a BatchAnalysisResult or any iterable of results (e.g. iter_analyze_batch);
+        options are passed to AlgorithmicFramework.export_multidimensional_jsonl.
+        """
+        if isinstance(results, BatchAnalysisResult):
+            results = results.results
+        return self.framework.export_multidimensional_jsonl(results, filename, **options)
+
     def clear_cache(self):
-        """Clear the batch analysis cache"""
-        self.batch_cache.clear()
+        """Clear in-memory cached results; a file-backed result store is left untouched"""
+        if self.result_store.path == ":memory:":
+            self.result_store.clear()
+
+    def clear_result_store(self):
+        """Delete every entry in the result store, including a persistent one shared with other runs"""
+        self.result_store.clear()
+
+# Names visible to validation rule conditions besides `result`
+_RULE_GLOBALS = {
+    '__builtins__': {},
+    'AnalysisDimension': AnalysisDimension,
+    'DimensionalAnalysis': DimensionalAnalysis,
+    'len': len,
+    'any': any,
+    'all': all,
+    'sum': sum,
+    'max': max,
+    'min': min,
+    'str': str,
+    'isinstance': isinstance,
+    'dict': dict
+}
+
+_COMPILED_CONDITIONS = {}  # condition string -> predicate(result), or None if it failed to compile
+
+class _RuleConditionCompiler(ast.NodeTransformer):
+    """Rejects dunder access and hoists constant DimensionalAnalysis fallbacks out of a condition
+
+    Conditions use result.dimension_results.get(dim, DimensionalAnalysis(dim, {}, [], 0)) as a
+    default; the fallback is built once at compile time instead of on every evaluation.
+    """
+
+    def __init__(self):
+        self.constants = {}
+
+    def visit_Name(self, node):
+        if node.id.startswith('__'):
+            raise ValueError(f"Access to '{node.id}' is not allowed in rule conditions")
+        return node
+
+    def visit_Attribute(self, node):
+        if node.attr.startswith('__'):
+            raise ValueError(f"Access to '{node.attr}' is not allowed in rule conditions")
+        return self.generic_visit(node)
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        arguments = list(node.args) + [keyword.value for keyword in node.keywords]
+        if (isinstance(node.func, ast.Name) and node.func.id == 'DimensionalAnalysis'
+                and all(self._is_static(argument) for argument in arguments)):
+            name = f"_fallback_{len(self.constants)}"
+            expression = ast.fix_missing_locations(ast.Expression(node))
+            self.constants[name] = eval(compile(expression, '<validation rule>', 'eval'), dict(_RULE_GLOBALS))
+            return ast.copy_location(ast.Name(id=name, ctx=ast.Load()), node)
+        return node
+
+    @staticmethod
+    def _is_static(node) -> bool:
+        if isinstance(node, ast.Constant):
+            return True
+        if isinstance(node, ast.Dict):
+            return not node.keys
+        if isinstance(node, (ast.List, ast.Tuple)):
+            return not node.elts
+        return (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+                and node.value.id == 'AnalysisDimension')
+
+def _compile_rule_condition(condition: str):
+    """Compile a rule condition once into a predicate(result) function (cached per condition)"""
+    if condition not in _COMPILED_CONDITIONS:
+        try:
+            tree = ast.parse(condition, mode='eval')
+            compiler = _RuleConditionCompiler()
+            body = compiler.visit(tree).body
+            # A real function (not eval with a locals dict), so generator expressions see `result`
+            function = ast.Expression(ast.Lambda(
+                args=ast.arguments(posonlyargs=[], args=[ast.arg(arg='result')], kwonlyargs=[],
+                                   kw_defaults=[], defaults=[]),
+                body=body
+            ))
+            namespace = dict(_RULE_GLOBALS, **compiler.constants)
+            predicate = eval(compile(ast.fix_missing_locations(function), '<validation rule>', 'eval'), namespace)
+        except Exception as e:
+            print(f"Error compiling rule condition {condition!r}: {e}")
+            predicate = None
+        _COMPILED_CONDITIONS[condition] = predicate
+    return _COMPILED_CONDITIONS[condition]
+
+_RULE_INPUTS = {}  # condition string -> (dimensions, (dimension, findings key) pairs) it reads
+
+def _get_rule_inputs(condition: str) -> tuple:
+    """Dimensions and findings keys a condition reads, for routing rules in validate_batch
+
+    Recognizes the result.dimension_results.get(AnalysisDimension.X, ...) and
+    ....findings.get('key', ...) forms used by rule conditions.
+    """
+    if condition not in _RULE_INPUTS:
+        dimensions, findings = set(), set()
+        try:
+            tree = ast.parse(condition, mode='eval')
+        except SyntaxError:
+            tree = None
+
+        def dimension_of(node):
+            """AnalysisDimension member for a dimension_results.get(AnalysisDimension.X, ...) call"""
+            if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == 'get'
+                    and isinstance(node.func.value, ast.Attribute) and node.func.value.attr == 'dimension_results'
+                    and node.args and isinstance(node.args[0], ast.Attribute)
+                    and isinstance(node.args[0].value, ast.Name) and node.args[0].value.id == 'AnalysisDimension'):
+                return AnalysisDimension.__members__.get(node.args[0].attr)
+            return None
+
+        for node in ast.walk(tree) if tree is not None else []:
+            dimension = dimension_of(node)
+            if dimension is not None:
+                dimensions.add(dimension)
+            # <dimension lookup>.findings.get('key', ...)
+            if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == 'get'
+                    and isinstance(node.func.value, ast.Attribute) and node.func.value.attr == 'findings'
+                    and node.args and isinstance(node.args[0], ast.Constant)):
+                owner = dimension_of(node.func.value.value)
+                if owner is not None:
+                    findings.add((owner, node.args[0].value))
+        _RULE_INPUTS[condition] = (frozenset(dimensions), frozenset(findings))
+    return _RULE_INPUTS[condition]
 
 class ValidationEngine:
     """Validates analysis results with configurable rule-based validation"""
@@ -2557,7 +6189,7 @@ class ValidationEngine:
         ]
 
         for rule in default_rules:
-            self.rules[rule.name] = rule
+            self.add_rule(rule)
 
     def load_rules_from_file(self, filepath: str):
         """Load validation rules from JSON file"""
@@ -2566,8 +6198,7 @@ class ValidationEngine:
                 rules_data = json.load(f)
 
             for rule_data in rules_data.get('rules', []):
-                rule = ValidationRule(**rule_data)
-                self.rules[rule.name] = rule
+                self.add_rule(ValidationRule(**rule_data))
 
         except FileNotFoundError:
             print(f"Validation rules file not found: {filepath}")
@@ -2575,8 +6206,26 @@ class ValidationEngine:
             print(f"Invalid JSON in validation rules file: {filepath}")
 
     def add_rule(self, rule: ValidationRule):
-        """Add a validation rule"""
+        """Add a validation rule, compiling its condition up front"""
         self.rules[rule.name] = rule
+        _compile_rule_condition(rule.condition)
+
+    @staticmethod
+    def _get_finding(result: MultiDimensionalResult, dimension: AnalysisDimension, key: str, default: Any = 0) -> Any:
+        """Read one finding, or default when the dimension was not analyzed"""
+        analysis = result.dimension_results.get(dimension)
+        return analysis.findings.get(key, default) if analysis is not None else default
+
+    def _format_issue_message(self, rule: ValidationRule, result: MultiDimensionalResult) -> str:
+        """Fill a rule's message template from the result's findings"""
+        message = rule.message_template
+        if '{' in message:
+            message = message.format(
+                lexical_diversity=self._get_finding(result, AnalysisDimension.LEXICAL, 'lexical_diversity'),
+                theme_count=self._get_finding(result, AnalysisDimension.THEMATIC, 'theme_count'),
+                eschatological_density=self._get_finding(result, AnalysisDimension.ESCHATOLOGICAL, 'eschatological_density')
+            )
+        return message
 
     def remove_rule(self, rule_name: str):
         """Remove a validation rule"""
@@ -2593,43 +6242,17 @@ class ValidationEngine:
             if not rule.enabled:
                 continue
 
-            try:
-                # Create evaluation context
-                context = {
-                    'result': result,
-                    'AnalysisDimension': AnalysisDimension,
-                    'DimensionalAnalysis': DimensionalAnalysis,
-                    'len': len,
-                    'any': any,
-                    'all': all,
-                    'sum': sum,
-                    'max': max,
-                    'min': min,
-                    'str': str
-                }
-
-                # Evaluate the condition
-                condition_met = eval(rule.condition, {"__builtins__": {}}, context)
-
-                if condition_met:
-                    # Format message with template variables
-                    message = rule.message_template
-                    if '{' in message:
-                        # Extract values for template
-                        lexical_diversity = result.dimension_results.get(AnalysisDimension.LEXICAL, DimensionalAnalysis(AnalysisDimension.LEXICAL, {}, [], 0)).findings.get('lexical_diversity', 0)
-                        theme_count = result.dimension_results.get(AnalysisDimension.THEMATIC, DimensionalAnalysis(AnalysisDimension.THEMATIC, {}, [], 0)).findings.get('theme_count', 0)
-                        eschatological_density = result.dimension_results.get(AnalysisDimension.ESCHATOLOGICAL, DimensionalAnalysis(AnalysisDimension.ESCHATOLOGICAL, {}, [], 0)).findings.get('eschatological_density', 0)
-
-                        message = message.format(
-                            lexical_diversity=lexical_diversity,
-                            theme_count=theme_count,
-                            eschatological_density=eschatological_density
-                        )
+            # Compiled once per distinct condition; rules edited in place are recompiled
+            predicate = _compile_rule_condition(rule.condition)
+            if predicate is None:
+                continue
 
+            try:
+                if predicate(result):
                     issues.append({
                         "rule_name": rule.name,
                         "type": rule.category,
-                        "description": message,
+                        "description": self._format_issue_message(rule, result),
                         "severity": rule.severity,
                         "suggested_fix": rule.suggested_fix
                     })
@@ -2646,6 +6269,85 @@ class ValidationEngine:
             "rules_evaluated": len([r for r in self.rules.values() if r.enabled])
         }
 
+    def validate_batch(self, results: Iterable[MultiDimensionalResult], include_messages: bool = False) -> Dict[str, Any]:
+        """Validate many results, routing each rule only to results that have its inputs
+
+        Rules are indexed by the dimensions and findings keys their conditions read; a rule
+        is skipped for a result missing any of them. Returns per-rule aggregate statistics
+        and the indices of flagged results. Issue dicts with formatted messages (as in
+        validate_analysis) are only built when include_messages is True.
+        """
+        rules = []
+        for rule in self.rules.values():
+            if not rule.enabled:
+                continue
+            predicate = _compile_rule_condition(rule.condition)
+            if predicate is not None:
+                dimensions, findings = _get_rule_inputs(rule.condition)
+                rules.append((rule, predicate, dimensions, findings))
+
+        rule_statistics = {
+            rule.name: {"evaluated": 0, "skipped": 0, "issues": 0, "errors": 0,
+                        "severity": rule.severity, "category": rule.category, "flagged_indices": []}
+            for rule, _, _, _ in rules
+        }
+        routes = {}  # frozenset of present dimensions -> rules whose dimensions are all present
+        severity_counts = {}
+        issues = []
+        results_with_issues = 0
+        total = 0
+
+        for index, result in enumerate(results):
+            total += 1
+            present = frozenset(result.dimension_results)
+            routed = routes.get(present)
+            if routed is None:
+                routed = routes[present] = [entry for entry in rules if entry[2] <= present]
+
+            flagged = False
+            for rule, predicate, _, findings in routed:
+                stats = rule_statistics[rule.name]
+                if any(key not in result.dimension_results[dimension].findings for dimension, key in findings):
+                    continue
+                try:
+                    met = predicate(result)
+                except Exception:
+                    stats["errors"] += 1
+                    continue
+                stats["evaluated"] += 1
+                if met:
+                    flagged = True
+                    stats["issues"] += 1
+                    stats["flagged_indices"].append(index)
+                    severity_counts[rule.severity] = severity_counts.get(rule.severity, 0) + 1
+                    if include_messages:
+                        issues.append({
+                            "result_index": index,
+                            "reference": result.passage.reference,
+                            "rule_name": rule.name,
+                            "type": rule.category,
+                            "description": self._format_issue_message(rule, result),
+                            "severity": rule.severity,
+                            "suggested_fix": rule.suggested_fix
+                        })
+            results_with_issues += flagged
+
+        for stats in rule_statistics.values():
+            stats["skipped"] = total - stats["evaluated"] - stats["errors"]
+            stats["issue_rate"] = stats["issues"] / stats["evaluated"] if stats["evaluated"] else 0.0
+
+        summary = {
+            "results_validated": total,
+            "results_with_issues": results_with_issues,
+            "issues_found": sum(stats["issues"] for stats in rule_statistics.values()),
+            "severity_counts": severity_counts,
+            "rules_evaluated": len(rules),
+            "rule_statistics": rule_statistics
+        }
+        if include_messages:
+            summary["issues"] = issues
+        return summary
+
 # Algorithm Library v0.0.4
 
 def lexical_analysis(passage: BiblicalPassage) -> Dict[str, Any]:
@@ -3497,10 +7199,8 @@ def historical_analysis(passage: BiblicalPassage) -> Dict[str, Any]:
     }
 
 # Demo usage
-if __name__ == "__main__":
-    print(f"Bible Algorithmic Project - Framework v{__version__}")
-
-    # Create framework
+def create_default_framework() -> AlgorithmicFramework:
+    """Create a framework with the ten built-in dimension algorithms registered"""
     framework = AlgorithmicFramework()
 
     # Register algorithms as plugins (v0.0.6 plugin architecture)
@@ -3555,6 +7255,14 @@ if __name__ == "__main__":
         tags=["history", "culture", "context"]
     )
 
+    return framework
+
+if __name__ == "__main__":
+    print(f"Bible Algorithmic Project - Framework v{__version__}")
+
+    # Create framework with the built-in plugins (v0.0.6 plugin architecture)
+    framework = create_default_framework()
+
     # Create sample passage (metadata auto-populated)
     sample_passage = BiblicalPassage(
         reference="John 1:1",
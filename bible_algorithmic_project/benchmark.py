@@ -0,0 +1,358 @@
+"""Benchmark suite for the Bible Algorithmic Project analysis pipeline
+
+Generates a reproducible synthetic corpus (a full Bible's worth of verses plus long
+transcript-sized documents), times every pipeline stage, records throughput and peak
+memory as JSON, and compares against a stored baseline to flag regressions.
+
+Usage:
+    python benchmark.py                                  # full run -> benchmark_results.json
+    python benchmark.py --quick                          # small corpus for a fast sanity check
+    python benchmark.py --save-baseline benchmark_baseline.json
+    python benchmark.py --baseline benchmark_baseline.json --threshold 0.15
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import dataclasses
+import platform
+import tempfile
+import tracemalloc
+from typing import Dict, List, Any, Callable
+
+from baseline_framework import (
+    __version__, BiblicalPassage, MultiDimensionalAnalyzer, BatchAnalyzer, BatchAnalysisResult, GenreDetector,
+    TheologicalOntology, DimensionInteractionAnalyzer, SharedNgramIndex, ColumnarResultStore, create_default_framework
+)
+
+# Canonical verse counts (31,102 verses in total)
+BOOKS = [
+    ("Genesis", 1533), ("Exodus", 1213), ("Leviticus", 859), ("Numbers", 1288), ("Deuteronomy", 959),
+    ("Joshua", 658), ("Judges", 618), ("Ruth", 85), ("1 Samuel", 810), ("2 Samuel", 695),
+    ("1 Kings", 816), ("2 Kings", 719), ("1 Chronicles", 942), ("2 Chronicles", 822), ("Ezra", 280),
+    ("Nehemiah", 406), ("Esther", 167), ("Job", 1070), ("Psalms", 2461), ("Proverbs", 915),
+    ("Ecclesiastes", 222), ("Song of Solomon", 117), ("Isaiah", 1292), ("Jeremiah", 1364),
+    ("Lamentations", 154), ("Ezekiel", 1273), ("Daniel", 357), ("Hosea", 197), ("Joel", 73),
+    ("Amos", 146), ("Obadiah", 21), ("Jonah", 48), ("Micah", 105), ("Nahum", 47), ("Habakkuk", 56),
+    ("Zephaniah", 53), ("Haggai", 38), ("Zechariah", 211), ("Malachi", 55),
+    ("Matthew", 1071), ("Mark", 678), ("Luke", 1151), ("John", 879), ("Acts", 1007), ("Romans", 433),
+    ("1 Corinthians", 437), ("2 Corinthians", 257), ("Galatians", 149), ("Ephesians", 155),
+    ("Philippians", 104), ("Colossians", 95), ("1 Thessalonians", 89), ("2 Thessalonians", 47),
+    ("1 Timothy", 113), ("2 Timothy", 83), ("Titus", 46), ("Philemon", 25), ("Hebrews", 303),
+    ("James", 108), ("1 Peter", 105), ("2 Peter", 61), ("1 John", 105), ("2 John", 13), ("3 John", 14),
+    ("Jude", 25), ("Revelation", 404)
+]
+NEW_TESTAMENT_START = "Matthew"
+VERSES_PER_CHAPTER = 30  # Synthetic chapters; only the verse totals follow the canon
+
+# Word pools chosen so every dimension algorithm finds something to match
+SUBJECTS = ["the LORD", "God", "Jesus", "the Christ", "the Son of man", "Moses", "David", "the king",
+            "the people", "the prophet", "his disciples", "the Spirit", "the Word", "Israel", "the priest"]
+VERBS = ["said", "came", "went", "saw", "heard", "spoke", "created", "blessed", "judged", "saved",
+         "shall come", "will establish", "shall destroy", "loved", "forgave", "commanded", "redeemed"]
+OBJECTS = ["the heaven and the earth", "the kingdom", "his people", "the temple", "the covenant",
+           "the nations", "Jerusalem", "the wilderness", "the law", "the throne", "the lamb", "the sinners",
+           "the righteous", "the wicked", "the children of Israel", "the light", "the darkness"]
+CLAUSES = ["in the beginning", "in that day", "for ever and ever", "by faith", "with grace and truth",
+           "unto the end of the age", "according to the word", "before the judgment", "after these things",
+           "as a shepherd", "like a lion", "in the last days", "because of sin", "through righteousness"]
+OPENERS = ["And", "Then", "For", "But", "Behold,", "Thus says the LORD:", "Blessed is he that", "Therefore"]
+
+
+def _sentence(rng: random.Random) -> str:
+    """One synthetic scripture-style clause"""
+    parts = [rng.choice(OPENERS), rng.choice(SUBJECTS), rng.choice(VERBS), rng.choice(OBJECTS)]
+    if rng.random() < 0.6:
+        parts.append(rng.choice(CLAUSES))
+    return " ".join(parts)
+
+
+def generate_corpus(verses: int = 31102, seed: int = 1729) -> List[BiblicalPassage]:
+    """Generate a reproducible synthetic corpus following the canonical book proportions"""
+    rng = random.Random(seed)
+    total = sum(count for _, count in BOOKS)
+    passages = []
+    testament = "Old"
+    seen = 0
+    for book, count in BOOKS:
+        if book == NEW_TESTAMENT_START:
+            testament = "New"
+        # Cumulative rounding so the book quotas add up to exactly `verses`
+        book_verses = round((seen + count) * verses / total) - round(seen * verses / total)
+        seen += count
+        for i in range(book_verses):
+            chapter, verse = i // VERSES_PER_CHAPTER + 1, i % VERSES_PER_CHAPTER + 1
+            text = "; ".join(_sentence(rng) for _ in range(rng.randint(1, 3))) + "."
+            passages.append(BiblicalPassage(
+                reference=f"{book} {chapter}:{verse}", text=text, version="SYN", testament=testament,
+                book=book, chapter=chapter, verse=verse
+            ))
+    return passages
+
+
+def generate_transcripts(count: int = 3, words: int = 20000, seed: int = 1729) -> List[BiblicalPassage]:
+    """Generate long sermon-transcript-sized documents"""
+    rng = random.Random(seed + 1)
+    transcripts = []
+    for n in range(1, count + 1):
+        sentences = []
+        length = 0
+        while length < words:
+            sentence = _sentence(rng) + rng.choice([".", "!", "?", "."])
+            sentences.append(sentence)
+            length += sentence.count(" ") + 1
+        transcripts.append(BiblicalPassage(
+            reference=f"Transcript {n}", text=" ".join(sentences), version="SYN", testament="New",
+            book="Transcript", chapter=n, verse=1
+        ))
+    return transcripts
+
+
+class BenchmarkRunner:
+    """Times workloads and records throughput and peak memory"""
+
+    def __init__(self, memory_items: int = 500, repeat: int = 1):
+        self.memory_items = memory_items  # Items per workload traced with tracemalloc (0 disables)
+        self.repeat = repeat
+        self.results = {}
+
+    def measure(self, name: str, items: List[Any], func: Callable[[List[Any]], Any]):
+        """Run func over items; the best of `repeat` timed runs, then a traced run for memory
+
+        If func returns an int it is recorded as the number of items that failed.
+        """
+        best = None
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            failed = func(items)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        entry = {
+            "items": len(items),
+            "seconds": best,
+            "throughput_per_second": len(items) / best if best > 0 else 0.0
+        }
+        if isinstance(failed, int):
+            entry["errors"] = failed
+        if self.memory_items:
+            # Traced separately: tracemalloc slows allocation-heavy code several-fold
+            traced = items[:self.memory_items]
+            tracemalloc.start()
+            try:
+                func(traced)
+                entry["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            entry["memory_items"] = len(traced)
+
+        self.results[name] = entry
+        memory = f", peak {entry['peak_memory_bytes'] / 1e6:.1f} MB" if "peak_memory_bytes" in entry else ""
+        errors = f", {entry['errors']} failed" if entry.get("errors") else ""
+        print(f"  {name:<45} {entry['throughput_per_second']:>12.1f}/s  "
+              f"({best:.3f}s for {len(items)}{memory}{errors})")
+
+
+def each(call: Callable[[Any], Any]) -> Callable[[List[Any]], int]:
+    """Apply call to every item, counting failures instead of aborting (as the batch paths do)"""
+    def run(items):
+        failed = 0
+        for item in items:
+            try:
+                call(item)
+            except Exception:
+                failed += 1
+        return failed
+    return run
+
+
+def batch_errors(run: Callable[[List[Any]], BatchAnalysisResult]) -> Callable[[List[Any]], int]:
+    """Run a batch analysis and return how many of its passages failed"""
+    def measured(items):
+        batch = run(items)
+        return batch.passages_analyzed - len(batch.results)
+    return measured
+
+
+def classification_errors(classify: Callable[..., List[Any]]) -> Callable[..., int]:
+    """Run a corpus classification and return how many passages got no classification"""
+    def measured(*args, **kwargs):
+        return sum(1 for classification in classify(*args, **kwargs) if classification is None)
+    return measured
+
+
+def run_benchmarks(args) -> Dict[str, Any]:
+    """Run every pipeline benchmark and return the results document"""
+    start = time.perf_counter()
+    corpus = generate_corpus(args.verses, args.seed)
+    transcripts = generate_transcripts(args.transcripts, args.transcript_words, args.seed)
+    print(f"Generated {len(corpus)} verses and {len(transcripts)} transcripts in {time.perf_counter() - start:.2f}s")
+
+    sample = corpus[:args.sample] if args.sample else corpus
+    framework = create_default_framework()
+    framework.metrics.enabled = False  # Benchmark the pipeline, not the instrumentation
+    runner = BenchmarkRunner(memory_items=args.memory_items, repeat=args.repeat)
+
+    print("\nDimension algorithms:")
+    for name in framework.algorithms:
+        runner.measure(f"algorithm.{name}", sample, each(lambda p, name=name: framework.analyze_passage(p, name)))
+        runner.measure(f"algorithm.{name}.transcripts", transcripts,
+                       each(lambda p, name=name: framework.analyze_passage(p, name)))
+
+    print("\nAnalyzers:")
+    analyzer = MultiDimensionalAnalyzer(framework)
+    runner.measure("multidimensional.analyze", sample, each(analyzer.analyze))
+    runner.measure("multidimensional.analyze.transcripts", transcripts, each(analyzer.analyze))
+
+    batch_corpus = corpus[:args.batch_size] if args.batch_size else corpus
+    # A fresh analyzer per run, so result store hits from earlier runs do not skew timings
+    runner.measure("batch.sequential", batch_corpus,
+                   batch_errors(lambda items: BatchAnalyzer(framework).analyze_batch(items, use_parallel=False)))
+    runner.measure("batch.threaded", batch_corpus,
+                   batch_errors(lambda items: BatchAnalyzer(framework, max_workers=args.workers).analyze_batch(items)))
+    runner.measure("batch.process", batch_corpus,
+                   batch_errors(lambda items: BatchAnalyzer(framework, max_workers=args.workers,
+                                                            backend="process").analyze_batch(items)))
+
+    batch_result = BatchAnalyzer(framework).analyze_batch(sample, use_parallel=False)
+    results = batch_result.results
+    # Benchmarks below run on analysis results, so they cover only the passages that analyzed
+    print(f"\nResult-based benchmarks use the {len(results)} of {len(sample)} sample passages "
+          f"that analyzed without errors")
+
+    detector = GenreDetector()
+    runner.measure("genre_detector.classify_genre", sample, each(detector.classify_genre))
+    runner.measure("genre_detector.classify_corpus", sample, classification_errors(detector.classify_corpus))
+    # Classification after a full analysis, reusing its dimension results
+    runner.measure("genre_detector.classify_corpus.with_results", results,
+                   lambda items: classification_errors(detector.classify_corpus)(
+                       [result.passage for result in items], results=items))
+    interactions = DimensionInteractionAnalyzer()
+    runner.measure("interactions.analyze_interactions", results,
+                   each(lambda result: interactions.analyze_interactions(result.dimension_results)))
+    runner.measure("interactions.analyze_interactions_batch", results, interactions.analyze_interactions_batch)
+    runner.measure("aggregate.find_patterns_across_batch", results,
+                   lambda items: BatchAnalyzer(framework).find_patterns_across_batch(iter(items)))
+    runner.measure("shared_ngrams.find_matches", sample + transcripts, SharedNgramIndex().find_matches)
+    runner.measure("columnar.from_results", results, ColumnarResultStore.from_results)
+    columnar = ColumnarResultStore.from_results(results)
+    runner.measure("columnar.materialize", results, lambda items: each(columnar.__getitem__)(range(len(items))))
+    ontology = TheologicalOntology()
+    runner.measure("ontology.map_passage_to_concepts", sample, each(ontology.map_passage_to_concepts))
+
+    print("\nExporters:")
+    with tempfile.TemporaryDirectory() as directory:
+        def path(name):
+            return os.path.join(directory, name)
+        runner.measure("export.json", results, lambda items: framework.export_multidimensional_results(items, path("r.json")))
+        runner.measure("export.jsonl", results,
+                       lambda items: len(items) - framework.export_multidimensional_jsonl(items, path("r.jsonl")))
+        runner.measure("export.markdown", results, lambda items: framework.export_multidimensional_markdown(items, path("r.md")))
+        runner.measure("export.html", results, lambda items: framework.export_interactive_html(items, path("r.html")))
+        runner.measure("export.batch_json", results,
+                       lambda items: BatchAnalyzer(framework).export_batch_results(
+                           dataclasses.replace(batch_result, results=items), path("b.json")))
+
+    return {
+        "framework_version": __version__,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": {
+            "verses": len(corpus), "sample": len(sample), "sample_analyzed": len(results),
+            "batch_size": len(batch_corpus),
+            "transcripts": len(transcripts), "transcript_words": args.transcript_words,
+            "workers": args.workers, "seed": args.seed, "repeat": args.repeat,
+            "memory_items": args.memory_items
+        },
+        "benchmarks": runner.results
+    }
+
+
+def compare_to_baseline(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Flag benchmarks whose throughput dropped or peak memory grew by more than threshold"""
+    regressions = []
+    for name, entry in current["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if previous is None:
+            continue
+        if previous["throughput_per_second"] > 0:
+            change = entry["throughput_per_second"] / previous["throughput_per_second"] - 1
+            entry["throughput_change"] = change
+            if change < -threshold:
+                regressions.append({"benchmark": name, "metric": "throughput_per_second", "change": change,
+                                    "baseline": previous["throughput_per_second"],
+                                    "current": entry["throughput_per_second"]})
+        if previous.get("peak_memory_bytes") and "peak_memory_bytes" in entry:
+            change = entry["peak_memory_bytes"] / previous["peak_memory_bytes"] - 1
+            entry["memory_change"] = change
+            if change > threshold:
+                regressions.append({"benchmark": name, "metric": "peak_memory_bytes", "change": change,
+                                    "baseline": previous["peak_memory_bytes"], "current": entry["peak_memory_bytes"]})
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Bible Algorithmic Project analysis pipeline")
+    parser.add_argument("--verses", type=int, default=31102, help="Synthetic corpus size")
+    parser.add_argument("--sample", type=int, default=3000,
+                        help="Verses per algorithm/analyzer/exporter benchmark (0 = whole corpus)")
+    parser.add_argument("--batch-size", type=int, default=0, help="Verses per BatchAnalyzer benchmark (0 = whole corpus)")
+    parser.add_argument("--transcripts", type=int, default=3, help="Number of long transcript documents")
+    parser.add_argument("--transcript-words", type=int, default=20000, help="Words per transcript")
+    parser.add_argument("--workers", type=int, default=4, help="Workers for parallel batch benchmarks")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per benchmark (best is kept)")
+    parser.add_argument("--memory-items", type=int, default=500,
+                        help="Items traced for peak memory per benchmark (0 disables tracemalloc)")
+    parser.add_argument("--seed", type=int, default=1729, help="Corpus generator seed")
+    parser.add_argument("--quick", action="store_true", help="Small corpus for a fast sanity check")
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to write results")
+    parser.add_argument("--baseline", help="Baseline results to compare against")
+    parser.add_argument("--save-baseline", help="Also write the results to this baseline file")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Relative change that counts as a regression (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.verses, args.sample, args.batch_size = 1000, 300, 300
+        args.transcripts, args.transcript_words, args.memory_items = 1, 5000, 100
+
+    # Per-passage analysis errors would swamp the report; benchmarks record failure counts instead
+    logging.disable(logging.WARNING)
+    print(f"Bible Algorithmic Project benchmark - framework v{__version__}")
+    results = run_benchmarks(args)
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get("config") != results["config"]:
+            print("\nWarning: baseline was recorded with a different configuration")
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        results["baseline"] = args.baseline
+        results["regressions"] = regressions
+        print(f"\nCompared against {args.baseline} (threshold {args.threshold:.0%}):")
+        for regression in regressions:
+            print(f"  REGRESSION {regression['benchmark']}: {regression['metric']} "
+                  f"{regression['change']:+.1%} ({regression['baseline']:.1f} -> {regression['current']:.1f})")
+        if not regressions:
+            print("  No regressions")
+        exit_code = 1 if regressions else 0
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.save_baseline}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
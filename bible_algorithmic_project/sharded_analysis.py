@@ -0,0 +1,431 @@
+"""Sharded corpus analysis for the Bible Algorithmic Project
+
+Splits a (possibly multi-translation) corpus into shards by book, testament or a hash
+of the reference, runs each shard as an independent job and merges the shard outputs
+into one BatchAnalysisResult. Jobs only share a directory (local disk, NFS or any
+mounted volume), so they can run as local processes or on separate machines:
+
+    shards/manifest.json                 plan: shard -> label and passage count
+    shards/shard-0003/passages.jsonl     input, one passage per line with its corpus index
+    shards/shard-0003/results.jsonl      checkpoint journal (an interrupted job resumes)
+    shards/shard-0003/summary.json       written last; marks the shard as complete for
+                                         the plugin versions it records
+    shards/links.jsonl                   merge output: every link with its resolved shards
+
+Statistics are combined from each shard's mergeable ResultAggregator, and link targets
+(cross-references and dimension links) are resolved against the whole corpus so links
+that point into other shards are reported as such.
+
+Usage:
+    python sharded_analysis.py plan shards --corpus kjv.json web.json --shard-by book --shards 8
+    python sharded_analysis.py run shards --shard 0003          # one job, on any machine
+    python sharded_analysis.py local shards --processes 4       # every pending job locally
+    python sharded_analysis.py merge shards --output merged.json
+"""
+
+import os
+import re
+import sys
+import json
+import socket
+import hashlib
+import argparse
+import importlib
+import subprocess
+import concurrent.futures
+from datetime import datetime
+from typing import Dict, List, Any, Iterable
+
+from baseline_framework import (
+    __version__, AlgorithmicFramework, AnalysisDimension, BatchAnalysisResult, BatchAnalyzer, BibleLoader,
+    BiblicalPassage, ResultAggregator, create_default_framework
+)
+
+PASSAGE_FIELDS = ("reference", "text", "version", "testament", "book", "chapter", "verse")
+SHARD_BY = ("book", "testament", "hash")
+VERSE_RANGE_PATTERN = re.compile(r"^(.+?\d+:\d+)\s*[-–]\s*\d+(?::\d+)?$")
+
+
+def load_framework(factory: str = None) -> AlgorithmicFramework:
+    """Build a framework from a "module:function" factory (default create_default_framework)"""
+    if not factory:
+        return create_default_framework()
+    module_name, _, function_name = factory.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)()
+
+
+def _write_json_atomic(path: str, data: Any):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, default=str)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class ShardedBatchAnalyzer:
+    """Plan, run and merge shard jobs over a shared directory"""
+
+    def __init__(self, framework: AlgorithmicFramework = None, shard_by: str = "book", num_shards: int = None,
+                 framework_factory: str = None):
+        if shard_by not in SHARD_BY:
+            raise ValueError(f"shard_by must be one of {SHARD_BY}, got {shard_by!r}")
+        self.framework_factory = framework_factory  # Rebuilds the framework in each shard process
+        self.framework = framework or load_framework(framework_factory)
+        self.shard_by = shard_by
+        # Book and testament groups are packed into num_shards shards (None = one shard per group)
+        self.num_shards = num_shards if num_shards or shard_by != "hash" else 8
+
+    # Planning
+
+    def _shard_key(self, passage: BiblicalPassage) -> str:
+        if self.shard_by == "book":
+            return passage.book
+        if self.shard_by == "testament":
+            return passage.testament
+        # Hash the reference, not the text, so every translation of a verse lands in the same shard
+        digest = hashlib.md5(passage.reference.encode('utf-8')).digest()
+        return str(int.from_bytes(digest[:8], 'big') % self.num_shards)
+
+    def partition(self, passages: Iterable[BiblicalPassage]) -> List[Dict[str, Any]]:
+        """Group passages into shards; returns [{"label", "indices"}] in first-seen order"""
+        groups = {}
+        for index, passage in enumerate(passages):
+            groups.setdefault(self._shard_key(passage), []).append(index)
+
+        if self.shard_by == "hash" or not self.num_shards or len(groups) <= self.num_shards:
+            return [{"label": key, "indices": indices} for key, indices in groups.items()]
+
+        # Pack whole groups largest first into the least loaded shard
+        shards = [{"labels": [], "indices": []} for _ in range(self.num_shards)]
+        for key, indices in sorted(groups.items(), key=lambda x: len(x[1]), reverse=True):
+            target = min(shards, key=lambda shard: len(shard["indices"]))
+            target["labels"].append(key)
+            target["indices"].extend(indices)
+        return [{"label": ", ".join(shard["labels"]), "indices": sorted(shard["indices"])}
+                for shard in shards if shard["indices"]]
+
+    def plan(self, passages: List[BiblicalPassage], directory: str) -> Dict[str, Any]:
+        """Write shard inputs and the manifest; returns the manifest
+
+        Re-planning the same corpus with the same settings keeps the existing plan, so
+        completed shards are not rerun. Any other plan replaces the old shard files.
+        """
+        fingerprint = hashlib.sha256(json.dumps(
+            [self.shard_by, self.num_shards] + [[p.reference, p.version, p.get_content_hash()] for p in passages]
+        ).encode('utf-8')).hexdigest()
+        manifest_path = os.path.join(directory, "manifest.json")
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            if previous.get("fingerprint") == fingerprint:
+                return previous
+            for shard_id in previous.get("shards", {}):
+                for name in ("passages.jsonl", "results.jsonl", "summary.json"):
+                    path = os.path.join(self._shard_directory(directory, shard_id), name)
+                    if os.path.exists(path):
+                        os.remove(path)
+
+        os.makedirs(directory, exist_ok=True)
+        shards = {}
+        for number, shard in enumerate(self.partition(passages)):
+            shard_id = f"{number:04d}"
+            shard_directory = self._shard_directory(directory, shard_id)
+            os.makedirs(shard_directory, exist_ok=True)
+            with open(os.path.join(shard_directory, "passages.jsonl"), 'w', encoding='utf-8') as f:
+                for index in shard["indices"]:
+                    record = {field: getattr(passages[index], field) for field in PASSAGE_FIELDS}
+                    record["index"] = index
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            shards[shard_id] = {"label": shard["label"], "passages": len(shard["indices"])}
+
+        manifest = {
+            "version": __version__,
+            "created": datetime.now().isoformat(),
+            "fingerprint": fingerprint,
+            "shard_by": self.shard_by,
+            "num_shards": self.num_shards,
+            "total_passages": len(passages),
+            "shards": shards
+        }
+        _write_json_atomic(manifest_path, manifest)
+        return manifest
+
+    # Shard jobs
+
+    @staticmethod
+    def _shard_directory(directory: str, shard_id: str) -> str:
+        return os.path.join(directory, f"shard-{shard_id}")
+
+    @staticmethod
+    def load_manifest(directory: str) -> Dict[str, Any]:
+        with open(os.path.join(directory, "manifest.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _read_shard_passages(self, directory: str, shard_id: str) -> List[tuple]:
+        """(corpus index, passage) pairs of one shard"""
+        entries = []
+        with open(os.path.join(self._shard_directory(directory, shard_id), "passages.jsonl"), 'r',
+                  encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                index = record.pop("index")
+                entries.append((index, BiblicalPassage(**{k: v for k, v in record.items() if k in PASSAGE_FIELDS})))
+        return entries
+
+    def is_complete(self, directory: str, shard_id: str) -> bool:
+        """True once the shard has a summary written by the current plugins"""
+        path = os.path.join(self._shard_directory(directory, shard_id), "summary.json")
+        if not os.path.exists(path):
+            return False
+        with open(path, 'r', encoding='utf-8') as f:
+            summary = json.load(f)
+        return summary.get("analysis_fingerprint") == BatchAnalyzer(self.framework).get_analysis_fingerprint()
+
+    def pending_shards(self, directory: str) -> List[str]:
+        return [shard_id for shard_id in self.load_manifest(directory)["shards"]
+                if not self.is_complete(directory, shard_id)]
+
+    def run_shard(self, directory: str, shard_id: str, use_parallel: bool = False, max_workers: int = 4,
+                  backend: str = "thread") -> Dict[str, Any]:
+        """Analyze one shard and write its summary; safe to rerun after an interruption
+
+        After a plugin change the shard counts as pending again, and checkpoint records
+        written by the old plugins are analyzed again rather than restored.
+        """
+        shard_directory = self._shard_directory(directory, shard_id)
+        passages = [passage for _, passage in self._read_shard_passages(directory, shard_id)]
+        analyzer = BatchAnalyzer(self.framework, max_workers=max_workers, backend=backend)
+        batch = analyzer.analyze_batch(passages, use_parallel=use_parallel,
+                                       checkpoint_path=os.path.join(shard_directory, "results.jsonl"))
+
+        summary = {
+            "shard": shard_id,
+            "passages": len(passages),
+            "results": len(batch.results),
+            "processing_time": batch.processing_time,
+            "batch_statistics": batch.batch_statistics,
+            "aggregate": ResultAggregator.from_results(batch.results).to_dict(),
+            "analysis_fingerprint": analyzer.get_analysis_fingerprint(),
+            "host": socket.gethostname(),
+            "completed": datetime.now().isoformat()
+        }
+        _write_json_atomic(os.path.join(shard_directory, "summary.json"), summary)
+        return summary
+
+    def run_local(self, directory: str, processes: int = None, use_parallel: bool = False) -> List[str]:
+        """Run every pending shard as a separate local process, at most processes at a time
+
+        Shard processes build their own framework from framework_factory. Returns the shard
+        ids that were run; raises RuntimeError if any job fails.
+        """
+        pending = self.pending_shards(directory)
+        processes = processes or os.cpu_count() or 1
+        command = [sys.executable, os.path.abspath(__file__), "run", directory]
+        if self.framework_factory:
+            command += ["--framework-factory", self.framework_factory]
+        if use_parallel:
+            command.append("--parallel")
+
+        def run(shard_id):
+            return shard_id, subprocess.run(command + ["--shard", shard_id]).returncode
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=processes) as executor:
+            failed = [shard_id for shard_id, returncode in executor.map(run, pending) if returncode != 0]
+        if failed:
+            raise RuntimeError(f"Shard jobs failed: {', '.join(failed)}")
+        return pending
+
+    # Merging
+
+    @staticmethod
+    def _normalize_reference(reference: str) -> str:
+        """"John 1:1-3" -> "John 1:1"; ranges resolve to their first verse"""
+        match = VERSE_RANGE_PATTERN.match(reference.strip())
+        return match.group(1) if match else reference.strip()
+
+    def _iter_links(self, result) -> Iterable[Dict[str, Any]]:
+        """Every outgoing link of a result: cross-reference findings and other dimensions' links"""
+        cross_reference = result.dimension_results.get(AnalysisDimension.CROSS_REFERENCE)
+        if cross_reference is not None:
+            for link in cross_reference.findings.get("cross_references", []):
+                yield {"dimension": AnalysisDimension.CROSS_REFERENCE.value, "target": link["reference"],
+                       "type": link["type"], "strength": link["strength"]}
+        for dimension, analysis in result.dimension_results.items():
+            if dimension == AnalysisDimension.CROSS_REFERENCE:
+                continue  # Its links mirror the findings above, without strengths
+            for link in analysis.links:
+                yield {"dimension": dimension.value, "target": link.reference, "type": link.relationship,
+                       "strength": None}
+
+    def merge(self, directory: str, allow_partial: bool = False) -> BatchAnalysisResult:
+        """Merge completed shards into one BatchAnalysisResult in corpus order
+
+        Statistics come from merging the shards' aggregators. Every link is resolved
+        against the full corpus and written to links.jsonl; counts (including links that
+        cross shards) are in batch_statistics["link_resolution"]. Missing shards raise
+        RuntimeError unless allow_partial.
+        """
+        manifest = self.load_manifest(directory)
+        missing = [shard_id for shard_id in manifest["shards"] if not self.is_complete(directory, shard_id)]
+        if missing and not allow_partial:
+            raise RuntimeError(f"Shards not complete: {', '.join(missing)}")
+
+        # Passage location across the whole plan, completed or not
+        reference_shards = {}  # reference -> shard ids holding it (any translation)
+        passage_index = {}     # (shard id, reference, version) -> corpus index
+        for shard_id in manifest["shards"]:
+            for index, passage in self._read_shard_passages(directory, shard_id):
+                reference_shards.setdefault(passage.reference, set()).add(shard_id)
+                passage_index[(shard_id, passage.reference, passage.version)] = index
+
+        batch_analyzer = BatchAnalyzer(self.framework)
+        aggregate = ResultAggregator()
+        indexed_results = []
+        shard_statistics = {}
+        totals = {"store_hits": 0, "passages_computed": 0, "restored_from_checkpoint": 0}
+        algorithms = []
+        link_counts = {"links": 0, "resolved": 0, "unresolved": 0, "same_shard": 0, "cross_shard": 0}
+        links_path = os.path.join(directory, "links.jsonl")
+
+        with open(links_path, 'w', encoding='utf-8') as links_file:
+            for shard_id, shard in manifest["shards"].items():
+                if shard_id in missing:
+                    continue
+                with open(os.path.join(self._shard_directory(directory, shard_id), "summary.json"), 'r',
+                          encoding='utf-8') as f:
+                    summary = json.load(f)
+                aggregate.merge(ResultAggregator.from_dict(summary["aggregate"]))
+                statistics = summary["batch_statistics"]
+                for key in totals:
+                    totals[key] += statistics.get(key, 0)
+                algorithms.extend(a for a in statistics.get("algorithms_used", []) if a not in algorithms)
+                shard_statistics[shard_id] = {
+                    "label": shard["label"],
+                    "passages": summary["passages"],
+                    "results": summary["results"],
+                    "processing_time": summary["processing_time"],
+                    "host": summary.get("host")
+                }
+
+                results_path = os.path.join(self._shard_directory(directory, shard_id), "results.jsonl")
+                for result in batch_analyzer.load_checkpoint(results_path):
+                    index = passage_index.get((shard_id, result.passage.reference, result.passage.version))
+                    if index is None:
+                        continue  # Journal entry from text that has since changed
+                    indexed_results.append((index, result))
+                    for link in self._iter_links(result):
+                        resolved = self._normalize_reference(link["target"])
+                        target_shards = reference_shards.get(link["target"]) or reference_shards.get(resolved)
+                        link_counts["links"] += 1
+                        if not target_shards:
+                            link_counts["unresolved"] += 1
+                        elif target_shards == {shard_id}:
+                            link_counts["resolved"] += 1
+                            link_counts["same_shard"] += 1
+                        else:
+                            link_counts["resolved"] += 1
+                            link_counts["cross_shard"] += 1
+                        links_file.write(json.dumps(dict(
+                            link,
+                            source=result.passage.reference,
+                            source_version=result.passage.version,
+                            source_shard=shard_id,
+                            resolved_reference=(link["target"] if link["target"] in reference_shards else
+                                                resolved if target_shards else None),
+                            target_shards=sorted(target_shards or ()),
+                            cross_shard=bool(target_shards) and target_shards != {shard_id}
+                        ), ensure_ascii=False) + "\n")
+
+        indexed_results.sort(key=lambda x: x[0])
+        results = [result for _, result in indexed_results]
+        passages_planned = sum(statistics["passages"] for statistics in shard_statistics.values())
+        processing_time = sum(statistics["processing_time"] for statistics in shard_statistics.values())
+
+        batch_statistics = {
+            "total_passages": passages_planned,
+            "total_insights": aggregate.insights.total,
+            "total_findings": aggregate.findings.total,
+            "average_insights_per_passage": aggregate.insights.total / passages_planned if passages_planned else 0,
+            "average_findings_per_passage": aggregate.findings.total / passages_planned if passages_planned else 0,
+            "average_confidence": aggregate.confidence.mean,
+            "processing_time_seconds": processing_time,  # Summed over shards
+            "critical_path_seconds": max((s["processing_time"] for s in shard_statistics.values()), default=0.0),
+            "processing_rate": passages_planned / processing_time if processing_time > 0 else 0,
+            "parallel_processing": len(shard_statistics) > 1,
+            "parallel_backend": "sharded",
+            "algorithms_used": algorithms,
+            **totals,
+            "failed_passages": passages_planned - len(results),
+            "shard_by": manifest["shard_by"],
+            "shards": len(shard_statistics),
+            "missing_shards": missing,
+            "shard_statistics": shard_statistics,
+            "link_resolution": dict(link_counts, links_file=links_path)
+        }
+
+        return BatchAnalysisResult(
+            passages_analyzed=passages_planned,
+            total_insights=aggregate.insights.total,
+            average_confidence=aggregate.confidence.mean,
+            processing_time=processing_time,
+            results=results,
+            batch_statistics=batch_statistics
+        )
+
+    def analyze(self, passages: List[BiblicalPassage], directory: str, processes: int = None) -> BatchAnalysisResult:
+        """Plan, run every pending shard locally and merge"""
+        self.plan(passages, directory)
+        self.run_local(directory, processes)
+        return self.merge(directory)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Sharded Bible Algorithmic Project corpus analysis")
+    parser.add_argument("command", choices=("plan", "run", "local", "merge"))
+    parser.add_argument("directory", help="Shared shard directory")
+    parser.add_argument("--corpus", nargs="+", help="plan: Bible JSON files (one per translation)")
+    parser.add_argument("--shard-by", choices=SHARD_BY, default="book", help="plan: partitioning")
+    parser.add_argument("--shards", type=int, help="plan: number of shards (default: one per book/testament, 8 for hash)")
+    parser.add_argument("--shard", help="run: shard id (default: every pending shard, sequentially)")
+    parser.add_argument("--processes", type=int, help="local: concurrent shard processes (default: CPU count)")
+    parser.add_argument("--parallel", action="store_true", help="run: also parallelize within the shard")
+    parser.add_argument("--framework-factory", help="module:function returning an AlgorithmicFramework")
+    parser.add_argument("--allow-partial", action="store_true", help="merge: skip incomplete shards")
+    parser.add_argument("--output", help="merge: export the merged batch as JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == "plan":
+        if not args.corpus:
+            parser.error("plan needs --corpus")
+        passages = []
+        for path in args.corpus:
+            passages.extend(BibleLoader().load_from_json(path))
+        sharder = ShardedBatchAnalyzer(shard_by=args.shard_by, num_shards=args.shards,
+                                       framework_factory=args.framework_factory)
+        manifest = sharder.plan(passages, args.directory)
+        print(f"Planned {len(manifest['shards'])} shards for {manifest['total_passages']} passages")
+        return
+
+    manifest = ShardedBatchAnalyzer.load_manifest(args.directory)
+    sharder = ShardedBatchAnalyzer(shard_by=manifest["shard_by"], num_shards=manifest["num_shards"],
+                                   framework_factory=args.framework_factory)
+    if args.command == "run":
+        for shard_id in [args.shard] if args.shard else sharder.pending_shards(args.directory):
+            summary = sharder.run_shard(args.directory, shard_id, use_parallel=args.parallel)
+            print(f"Shard {shard_id}: {summary['results']}/{summary['passages']} passages "
+                  f"in {summary['processing_time']:.2f}s")
+    elif args.command == "local":
+        ran = sharder.run_local(args.directory, args.processes, use_parallel=args.parallel)
+        print(f"Ran {len(ran)} shard jobs")
+    else:
+        merged = sharder.merge(args.directory, allow_partial=args.allow_partial)
+        resolution = merged.batch_statistics["link_resolution"]
+        print(f"Merged {merged.batch_statistics['shards']} shards: {len(merged.results)} results, "
+              f"{resolution['cross_shard']} of {resolution['links']} links cross shards")
+        if args.output:
+            BatchAnalyzer(sharder.framework).export_batch_results(merged, args.output)
+
+
+if __name__ == "__main__":
+    main()